@@ -1,11 +1,17 @@
 """GUI components for the Polyomino Puzzle Solver application."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
 from src.gui.board_tab import BoardTab
 from src.gui.board_widget import BoardWidget
 from src.gui.editor_window import EditorWindow
 from src.gui.piece_tab import PieceTab
 from src.gui.saved_puzzles_tab import SavedPuzzlesTab
-from src.gui.visualization_window import VisualizationWindow
+
+if TYPE_CHECKING:
+    from src.gui.visualization_window import VisualizationWindow
 
 __all__ = [
     "BoardTab",
@@ -15,3 +21,16 @@ __all__ = [
     "SavedPuzzlesTab",
     "VisualizationWindow",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the visualization window on first access.
+
+    It is only needed once the user solves a puzzle, so it stays out of
+    the editor's startup path.
+    """
+    if name == "VisualizationWindow":
+        from src.gui.visualization_window import VisualizationWindow
+
+        return VisualizationWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
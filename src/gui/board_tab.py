@@ -8,11 +8,15 @@ from __future__ import annotations
 
 from collections.abc import Callable
 
-from PySide6.QtCore import QSize, Qt, Signal
-from PySide6.QtGui import QColor, QPainter, QPaintEvent, QPen, QResizeEvent
+from PySide6.QtCore import QRect, QSize, Qt, QTimer, Signal
+from PySide6.QtGui import (QBrush, QColor, QFont, QFontMetrics, QPainter,
+                           QPaintEvent, QPen, QPixmap, QResizeEvent)
 from PySide6.QtWidgets import (QGridLayout, QLabel, QSizePolicy, QSpinBox,
                                QWidget)
 
+# Largest supported board side; the blocked-cell mask is always this square
+_MAX_DIM = 50
+
 
 class BoardGridWidget(QWidget):
     """Grid widget for editing board cells.
@@ -27,7 +31,34 @@ class BoardGridWidget(QWidget):
     """
 
     # Signals
-    blocked_cells_changed = Signal(set)
+    blocked_cells_changed = Signal(frozenset)
+    blocked_count_changed = Signal(int)
+
+    # Instance state read in the paint and mouse hot paths; slots give
+    # descriptor access instead of instance-dict lookups
+    __slots__ = (
+        "_width",
+        "_height",
+        "_mask",
+        "_blocked_count",
+        "_blocked_cells_snapshot",
+        "_cell_size",
+        "_is_blocking",
+        "_last_drag_cell",
+        "_bulk_active",
+        "_bulk_dirty",
+        "_grid_pen",
+        "_label_pen",
+        "_blocked_brush",
+        "_empty_brush",
+        "_label_font",
+        "_label_font_size",
+        "_label_text_offset",
+        "_col_labels",
+        "_row_labels",
+        "_cache",
+        "_cache_valid",
+    )
 
     # Constants
     MIN_CELL_SIZE = 5
@@ -47,13 +78,37 @@ class BoardGridWidget(QWidget):
 
         self._width = 5
         self._height = 5
-        self._blocked_cells: set[tuple[int, int]] = set()
+        # Flat row-major mask (index row * _MAX_DIM + col), 1 = blocked
+        self._mask = bytearray(_MAX_DIM * _MAX_DIM)
+        self._blocked_count = 0
+        # Read-only copy handed out by the getter; None until next read
+        self._blocked_cells_snapshot: frozenset[tuple[int, int]] | None = None
         self._cell_size = self.DEFAULT_CELL_SIZE
         self._is_blocking = True  # True = add blocked, False = remove blocked
+        self._last_drag_cell: tuple[int, int] | None = None
+        # While a bulk update is active, changes are published once at the end
+        self._bulk_active = False
+        self._bulk_dirty = False
+        # Paint resources built once instead of per paint/cell
+        self._grid_pen = QPen(self.GRID_COLOR)
+        self._grid_pen.setWidth(1)
+        self._label_pen = QColor(100, 100, 100)
+        self._blocked_brush = QBrush(self.BLOCKED_COLOR)
+        self._empty_brush = QBrush(self.EMPTY_COLOR)
+        self._label_font: QFont | None = None
+        self._label_font_size = -1
+        # (text, pixel width) per column/row label, measured once per resize
+        self._label_text_offset = 0
+        self._col_labels: list[tuple[str, int]] = []
+        self._row_labels: list[tuple[str, int]] = []
+        # Rendered grid, blitted on paint and rebuilt only when invalidated
+        self._cache: QPixmap | None = None
+        self._cache_valid = False
 
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
         self.setMouseTracking(True)
+        self._rebuild_label_cache()
 
     @property
     def board_width(self) -> int:
@@ -67,7 +122,12 @@ class BoardGridWidget(QWidget):
         Args:
             value: New width (1-50)
         """
-        self._width = max(1, min(50, value))
+        value = max(1, min(50, value))
+        if value == self._width:
+            return
+        self._width = value
+        self._rebuild_label_cache()
+        self._cache_valid = False
         self.updateGeometry()
         self.update()
 
@@ -83,14 +143,31 @@ class BoardGridWidget(QWidget):
         Args:
             value: New height (1-50)
         """
-        self._height = max(1, min(50, value))
+        value = max(1, min(50, value))
+        if value == self._height:
+            return
+        self._height = value
+        self._rebuild_label_cache()
+        self._cache_valid = False
         self.updateGeometry()
         self.update()
 
     @property
-    def blocked_cells(self) -> set[tuple[int, int]]:
-        """Get the set of blocked cell positions."""
-        return self._blocked_cells.copy()
+    def blocked_cells(self) -> frozenset[tuple[int, int]]:
+        """Get the set of blocked cell positions.
+
+        The snapshot is built lazily and reused until the cells next change,
+        so repeated reads are cheap.
+        """
+        if self._blocked_cells_snapshot is None:
+            mask = self._mask
+            self._blocked_cells_snapshot = frozenset(
+                (row, col)
+                for row in range(self._height)
+                for col in range(self._width)
+                if mask[row * _MAX_DIM + col]
+            )
+        return self._blocked_cells_snapshot
 
     @blocked_cells.setter
     def blocked_cells(self, cells: set[tuple[int, int]]) -> None:
@@ -99,8 +176,39 @@ class BoardGridWidget(QWidget):
         Args:
             cells: Set of (row, col) positions to mark as blocked
         """
-        self._blocked_cells = cells.copy()
-        self.update()
+        mask = bytearray(_MAX_DIM * _MAX_DIM)
+        for row, col in cells:
+            if 0 <= row < _MAX_DIM and 0 <= col < _MAX_DIM:
+                mask[row * _MAX_DIM + col] = 1
+        old = self._mask
+        if mask == old:
+            return
+
+        # Diff row by row so only the cells that flipped get repainted
+        changed: list[tuple[int, int]] = []
+        for row in range(_MAX_DIM):
+            base = row * _MAX_DIM
+            if old[base : base + _MAX_DIM] != mask[base : base + _MAX_DIM]:
+                changed.extend(
+                    (row, col)
+                    for col in range(_MAX_DIM)
+                    if old[base + col] != mask[base + col]
+                )
+
+        self._mask = mask
+        self._blocked_count = mask.count(1)
+        self._blocked_cells_snapshot = None
+
+        # Bulk replacements are cheaper to redraw from scratch
+        if len(changed) > self._width * self._height // 4:
+            self._cache_valid = False
+            self.update()
+            return
+        rect = self._rect_for_cells(changed)
+        if rect.isNull():
+            return
+        self._render_rect_to_pixmap(rect)
+        self.update(rect)
 
     def set_dimensions(self, width: int, height: int) -> None:
         """Set board dimensions and clear blocked cells that are out of bounds.
@@ -109,23 +217,48 @@ class BoardGridWidget(QWidget):
             width: New width (1-50)
             height: New height (1-50)
         """
-        self._width = max(1, min(50, width))
-        self._height = max(1, min(50, height))
-
-        # Remove out-of-bounds blocked cells
-        self._blocked_cells = {
-            (r, c)
-            for r, c in self._blocked_cells
-            if 0 <= r < self._height and 0 <= c < self._width
-        }
+        width = max(1, min(50, width))
+        height = max(1, min(50, height))
+        if width == self._width and height == self._height:
+            return
+        self._width = width
+        self._height = height
+
+        # Remove out-of-bounds blocked cells: whole rows below the board,
+        # then the tail of each remaining row past the last column
+        mask = self._mask
+        tail = _MAX_DIM - self._width
+        mask[self._height * _MAX_DIM :] = bytes((_MAX_DIM - self._height) * _MAX_DIM)
+        for base in range(self._width, self._height * _MAX_DIM, _MAX_DIM):
+            mask[base : base + tail] = bytes(tail)
+        self._blocked_count = mask.count(1)
+        self._blocked_cells_snapshot = None
 
         self._calculate_cell_size()
+        self._cache_valid = False
         self.updateGeometry()
         self.update()
 
+    def begin_bulk_update(self) -> None:
+        """Start a batch of cell changes.
+
+        Until end_bulk_update() is called, toggled cells are drawn but
+        blocked_cells_changed is held back.
+        """
+        self._bulk_active = True
+        self._bulk_dirty = False
+
+    def end_bulk_update(self) -> None:
+        """Finish a batch of cell changes, emitting once if any cell changed."""
+        self._bulk_active = False
+        if self._bulk_dirty:
+            self._bulk_dirty = False
+            self.blocked_cells_changed.emit(self.blocked_cells)
+
     def resizeEvent(self, event: QResizeEvent) -> None:
         """Handle widget resize to auto-fit cell size."""
         self._calculate_cell_size()
+        self._cache_valid = False
         super().resizeEvent(event)
 
     def _calculate_cell_size(self) -> None:
@@ -141,6 +274,32 @@ class BoardGridWidget(QWidget):
             self._cell_size = max(
                 self.MIN_CELL_SIZE, min(cell_width, cell_height, self.MAX_CELL_SIZE)
             )
+        self._rebuild_label_cache()
+
+    def _ensure_label_font(self) -> QFont:
+        """Get the label font for the current cell size, rebuilding if needed.
+
+        Returns:
+            Widget font scaled to the label point size
+        """
+        font_size = max(7, min(10, self._cell_size // 3))
+        if self._label_font is None or font_size != self._label_font_size:
+            font = QFont(self.font())
+            font.setPointSize(font_size)
+            self._label_font = font
+            self._label_font_size = font_size
+        return self._label_font
+
+    def _rebuild_label_cache(self) -> None:
+        """Measure the row and column labels for the current cell size."""
+        metrics = QFontMetrics(self._ensure_label_font())
+        self._label_text_offset = metrics.height() // 3
+        self._col_labels = [
+            (str(i), metrics.horizontalAdvance(str(i))) for i in range(self._width)
+        ]
+        self._row_labels = [
+            (str(i), metrics.horizontalAdvance(str(i))) for i in range(self._height)
+        ]
 
     def sizeHint(self) -> QSize:
         """Return the preferred size hint."""
@@ -155,10 +314,127 @@ class BoardGridWidget(QWidget):
         return QSize(width, height)
 
     def paintEvent(self, event: QPaintEvent) -> None:
-        """Paint the board grid."""
+        """Paint the board grid from the cached pixmap."""
+        if not self._cache_valid or self._cache is None:
+            self._render_to_pixmap()
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.drawPixmap(0, 0, self._cache)
+
+    def _render_to_pixmap(self) -> None:
+        """Render the whole grid into a fresh cache pixmap."""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        self._render(painter, self.rect())
+        painter.end()
+        self._cache = pixmap
+        self._cache_valid = True
+
+    def _render_cell_to_pixmap(self, row: int, col: int) -> None:
+        """Redraw one cell into the cache if it has already been built.
+
+        Args:
+            row: Cell row
+            col: Cell column
+        """
+        self._render_rect_to_pixmap(self._cell_rect(row, col))
+
+    def _render_rect_to_pixmap(self, rect: QRect) -> None:
+        """Redraw a region into the cache if it has already been built.
+
+        Args:
+            rect: Region to redraw, in widget coordinates
+        """
+        if not self._cache_valid or self._cache is None:
+            return
+        painter = QPainter(self._cache)
+        painter.setClipRect(rect)
+        self._render(painter, rect)
+        painter.end()
+
+    def _render(self, painter: QPainter, dirty: QRect) -> None:
+        """Draw the grid cells and labels.
+
+        Args:
+            painter: Active painter on the target device
+            dirty: Region to draw; cells outside it are skipped
+        """
+        # Cells and grid lines are axis-aligned on integer coordinates, so
+        # they stay on the raster engine's non-antialiased fast path
+        offset_x, offset_y = self._grid_offset()
+        cs = self._cell_size
+
+        # Only visit the rows/columns that intersect the dirty rect
+        col_start = max(0, (dirty.left() - offset_x) // cs)
+        col_end = min(self._width, (dirty.right() - offset_x) // cs + 1)
+        row_start = max(0, (dirty.top() - offset_y) // cs)
+        row_end = min(self._height, (dirty.bottom() - offset_y) // cs + 1)
+
+        # Collect cell rects per color so each class is drawn in one call
+        blocked_rects: list[QRect] = []
+        empty_rects: list[QRect] = []
+        all_rects: list[QRect] = []
+        # Hot loop: bind attributes and bound methods to locals
+        mask = self._mask
+        add_blocked = blocked_rects.append
+        add_empty = empty_rects.append
+        add_any = all_rects.append
+        for row in range(row_start, row_end):
+            base = row * _MAX_DIM
+            y = offset_y + row * cs
+            for col in range(col_start, col_end):
+                rect = QRect(offset_x + col * cs, y, cs, cs)
+                if mask[base + col]:
+                    add_blocked(rect)
+                else:
+                    add_empty(rect)
+                add_any(rect)
+
+        # Draw cells (PySide6 has no fillRects, so use brush-only drawRects)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._blocked_brush)
+        painter.drawRects(blocked_rects)
+        painter.setBrush(self._empty_brush)
+        painter.drawRects(empty_rects)
+
+        # Draw grid lines
+        painter.setPen(self._grid_pen)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawRects(all_rects)
+
+        # Draw row/column labels if cells are large enough
+        if cs >= 20:
+            painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+            painter.setFont(self._ensure_label_font())
+            painter.setPen(self._label_pen)
+
+            # Label text and widths come from _rebuild_label_cache
+            col_labels = self._col_labels
+            row_labels = self._row_labels
+            text_offset = self._label_text_offset
+            draw_text = painter.drawText
+            half = cs // 2
 
+            # Column labels (top)
+            y = offset_y - 8
+            for col in range(col_start, col_end):
+                text, text_width = col_labels[col]
+                draw_text(offset_x + col * cs + half - text_width // 2, y, text)
+
+            # Row labels (left)
+            x = offset_x - 8
+            for row in range(row_start, row_end):
+                text, text_width = row_labels[row]
+                draw_text(x - text_width, offset_y + row * cs + half + text_offset, text)
+
+    def _grid_offset(self) -> tuple[int, int]:
+        """Get the top-left pixel position of the painted grid.
+
+        Returns:
+            (offset_x, offset_y) tuple, leaving room for the labels
+        """
         # Extra padding for labels
         label_padding = 25
         grid_width = self._width * self._cell_size
@@ -167,57 +443,41 @@ class BoardGridWidget(QWidget):
         offset_y = (self.height() - grid_height) // 2
 
         # Ensure labels have enough space
-        offset_x = max(offset_x, label_padding)
-        offset_y = max(offset_y, label_padding)
-
-        # Draw cells
-        for row in range(self._height):
-            for col in range(self._width):
-                x = offset_x + col * self._cell_size
-                y = offset_y + row * self._cell_size
-
-                # Determine cell color
-                if (row, col) in self._blocked_cells:
-                    color = self.BLOCKED_COLOR
-                else:
-                    color = self.EMPTY_COLOR
+        return max(offset_x, label_padding), max(offset_y, label_padding)
 
-                painter.fillRect(x, y, self._cell_size, self._cell_size, color)
+    def _cell_rect(self, row: int, col: int) -> QRect:
+        """Get the pixel rectangle of a cell, including its grid lines.
 
-                # Draw grid lines
-                pen = QPen(self.GRID_COLOR)
-                pen.setWidth(1)
-                painter.setPen(pen)
-                painter.drawRect(x, y, self._cell_size, self._cell_size)
+        Args:
+            row: Cell row
+            col: Cell column
 
-        # Draw row/column labels if cells are large enough
-        if self._cell_size >= 20:
-            font = painter.font()
-            font.setPointSize(max(7, min(10, self._cell_size // 3)))
-            painter.setFont(font)
-            painter.setPen(QColor(100, 100, 100))
+        Returns:
+            QRect covering the cell and the pen strokes along its edges
+        """
+        offset_x, offset_y = self._grid_offset()
+        rect = QRect(
+            offset_x + col * self._cell_size,
+            offset_y + row * self._cell_size,
+            self._cell_size,
+            self._cell_size,
+        )
+        return rect.adjusted(-1, -1, 1, 1)
 
-            # Column labels (top)
-            for col in range(self._width):
-                x = offset_x + col * self._cell_size + self._cell_size // 2
-                y = offset_y - 8
-                label = str(col)
-                metrics = painter.fontMetrics()
-                text_width = metrics.horizontalAdvance(label)
-                painter.drawText(int(x - text_width // 2), int(y), label)
+    def _rect_for_cells(self, cells: list[tuple[int, int]]) -> QRect:
+        """Get the bounding rectangle of the visible cells in a list.
 
-            # Row labels (left)
-            for row in range(self._height):
-                x = offset_x - 8
-                y = offset_y + row * self._cell_size + self._cell_size // 2
-                label = str(row)
-                metrics = painter.fontMetrics()
-                text_height = metrics.height()
-                painter.drawText(
-                    int(x - metrics.horizontalAdvance(label)),
-                    int(y + text_height // 3),
-                    label,
-                )
+        Args:
+            cells: (row, col) positions; cells outside the board are ignored
+
+        Returns:
+            United cell rectangles, or a null QRect if none are visible
+        """
+        rect = QRect()
+        for row, col in cells:
+            if row < self._height and col < self._width:
+                rect = rect.united(self._cell_rect(row, col))
+        return rect
 
     def _get_cell_at_position(self, pos_x: int, pos_y: int) -> tuple[int, int] | None:
         """Get the cell coordinates at the given position.
@@ -249,6 +509,8 @@ class BoardGridWidget(QWidget):
 
     def mousePressEvent(self, event) -> None:
         """Handle mouse press for toggling blocked cells."""
+        self._last_drag_cell = None
+        self.begin_bulk_update()
         if event.button() == Qt.MouseButton.LeftButton:
             self._is_blocking = True
             self._toggle_cell_at_position(event.pos())
@@ -258,13 +520,30 @@ class BoardGridWidget(QWidget):
 
     def mouseMoveEvent(self, event) -> None:
         """Handle mouse drag for painting blocked cells."""
-        if event.buttons() & Qt.MouseButton.LeftButton:
+        buttons = event.buttons()
+        if not buttons & (Qt.MouseButton.LeftButton | Qt.MouseButton.RightButton):
+            return
+
+        # Moves within the cell handled last are a no-op
+        pos = event.pos()
+        cell = self._get_cell_at_position(pos.x(), pos.y())
+        if cell == self._last_drag_cell:
+            return
+        self._last_drag_cell = cell
+
+        if buttons & Qt.MouseButton.LeftButton:
             self._is_blocking = True
             self._toggle_cell_at_position(event.pos())
-        elif event.buttons() & Qt.MouseButton.RightButton:
+        elif buttons & Qt.MouseButton.RightButton:
             self._is_blocking = False
             self._toggle_cell_at_position(event.pos())
 
+    def mouseReleaseEvent(self, event) -> None:
+        """Handle mouse release to end a drag and publish the new cells."""
+        self._last_drag_cell = None
+        self.end_bulk_update()
+        super().mouseReleaseEvent(event)
+
     def _toggle_cell_at_position(self, pos) -> None:
         """Toggle blocked state at the given position.
 
@@ -272,13 +551,28 @@ class BoardGridWidget(QWidget):
             pos: QPoint position
         """
         cell = self._get_cell_at_position(pos.x(), pos.y())
-        if cell is not None:
-            if self._is_blocking:
-                self._blocked_cells.add(cell)
-            else:
-                self._blocked_cells.discard(cell)
-            self.blocked_cells_changed.emit(self._blocked_cells)
-            self.update()
+        if cell is None:
+            return
+        row, col = cell
+        index = row * _MAX_DIM + col
+        # Re-entering a cell that is already in the target state is a no-op
+        if self._mask[index] == self._is_blocking:
+            return
+
+        if self._is_blocking:
+            self._mask[index] = 1
+            self._blocked_count += 1
+        else:
+            self._mask[index] = 0
+            self._blocked_count -= 1
+        self._blocked_cells_snapshot = None
+        if self._bulk_active:
+            self._bulk_dirty = True
+        else:
+            self.blocked_cells_changed.emit(self.blocked_cells)
+        self.blocked_count_changed.emit(self._blocked_count)
+        self._render_cell_to_pixmap(row, col)
+        self.update(self._cell_rect(row, col))
 
 
 class BoardTab(QWidget):
@@ -294,14 +588,16 @@ class BoardTab(QWidget):
 
     # Signals
     dimensions_changed = Signal(int, int)
-    blocked_cells_changed = Signal(set)
+    blocked_cells_changed = Signal(frozenset)
 
     def __init__(
         self,
         parent: QWidget | None = None,
         *,
         on_dimensions_changed: Callable[[int, int], None] | None = None,
-        on_blocked_cells_changed: Callable[[set[tuple[int, int]]], None] | None = None,
+        on_blocked_cells_changed: (
+            Callable[[frozenset[tuple[int, int]]], None] | None
+        ) = None,
     ) -> None:
         """Initialize the board tab.
 
@@ -317,10 +613,17 @@ class BoardTab(QWidget):
 
         self._init_ui()
 
+        # Coalesce bursts of spinner ticks into a single board rebuild
+        self._dim_debounce = QTimer(self)
+        self._dim_debounce.setSingleShot(True)
+        self._dim_debounce.setInterval(20)
+        self._dim_debounce.timeout.connect(self._apply_dimensions)
+
         # Connect internal signals to callbacks
         self._width_spinner.valueChanged.connect(self._on_dimension_changed)
         self._height_spinner.valueChanged.connect(self._on_dimension_changed)
         self._grid_widget.blocked_cells_changed.connect(self._on_blocked_cells_changed)
+        self._grid_widget.blocked_count_changed.connect(self._on_blocked_count_changed)
 
     def _init_ui(self) -> None:
         """Initialize the user interface."""
@@ -372,7 +675,21 @@ class BoardTab(QWidget):
         layout.setRowStretch(4, 1)
 
     def _on_dimension_changed(self) -> None:
-        """Handle dimension spinner changes."""
+        """Handle dimension spinner changes.
+
+        Restarting the single-shot timer cancels any pending apply, so only
+        the last value of a burst reaches the grid and the callbacks.
+        """
+        self._dim_debounce.start()
+
+    def flush_pending_dimensions(self) -> None:
+        """Apply a spinner change still waiting on the debounce timer."""
+        if self._dim_debounce.isActive():
+            self._dim_debounce.stop()
+            self._apply_dimensions()
+
+    def _apply_dimensions(self) -> None:
+        """Apply the current spinner dimensions to the grid."""
         width = self._width_spinner.value()
         height = self._height_spinner.value()
         self._grid_widget.set_dimensions(width, height)
@@ -380,7 +697,15 @@ class BoardTab(QWidget):
         if self._dimensions_callback:
             self._dimensions_callback(width, height)
 
-    def _on_blocked_cells_changed(self, cells: set[tuple[int, int]]) -> None:
+    def _on_blocked_count_changed(self, count: int) -> None:
+        """Update the status label while blocked cells are being painted.
+
+        Args:
+            count: Number of blocked cells
+        """
+        self._status_label.setText(f"Blocked cells: {count}")
+
+    def _on_blocked_cells_changed(self, cells: frozenset[tuple[int, int]]) -> None:
         """Handle blocked cells changes.
 
         Args:
@@ -402,7 +727,7 @@ class BoardTab(QWidget):
         return self._height_spinner.value()
 
     @property
-    def blocked_cells(self) -> set[tuple[int, int]]:
+    def blocked_cells(self) -> frozenset[tuple[int, int]]:
         """Get the current blocked cells."""
         return self._grid_widget.blocked_cells
 
@@ -6,10 +6,12 @@ defining puzzle pieces and board configurations.
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from operator import attrgetter
 from pathlib import Path
-from typing import override
+from typing import Any, override
 
-from PySide6.QtCore import QEvent, QSize
+from PySide6.QtCore import QEvent, QSize, QTimer, Slot
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import (QFileDialog, QHBoxLayout, QLabel, QMainWindow,
                                QMessageBox, QPushButton, QSizePolicy,
@@ -18,14 +20,58 @@ from PySide6.QtWidgets import (QFileDialog, QHBoxLayout, QLabel, QMainWindow,
 from src.gui.board_tab import BoardTab
 from src.gui.piece_tab import PieceTab
 from src.gui.saved_puzzles_tab import SavedPuzzlesTab
-from src.gui.visualization_window import VisualizationWindow
 from src.models.piece import PuzzlePiece
 from src.models.puzzle_config import PuzzleConfiguration
-from src.utils.file_io import (export_puzzle, import_puzzle, load_puzzle,
-                               save_puzzle)
 
 SAVED_PUZZLES_DIR = Path.home() / ".polyomino-puzzles" / "saved"
 
+# Validation label colors, selected by its "severity" dynamic property
+_VALIDATION_STYLE = (
+    'QLabel[severity="ok"] { color: green; }'
+    'QLabel[severity="info"] { color: blue; }'
+    'QLabel[severity="warn"] { color: orange; }'
+    'QLabel[severity="error"] { color: red; }'
+)
+
+# Fixed validation messages
+_NO_PIECES_TEXT = "No pieces defined"
+_VALID_TEXT = "Configuration valid"
+
+# Menu action spec: (text, shortcut, handler attribute path); None is a separator
+_MenuAction = tuple[str, str | None, str] | None
+
+# Menu bar layout as (menu title, actions) pairs
+_MENUS: tuple[tuple[str, tuple[_MenuAction, ...]], ...] = (
+    (
+        "File",
+        (
+            ("New Puzzle", "Ctrl+N", "_on_new_puzzle"),
+            None,
+            ("Save", "Ctrl+S", "_on_save"),
+            ("Load", "Ctrl+O", "_on_load"),
+            None,
+            ("Export...", None, "_on_export"),
+            ("Import...", None, "_on_import"),
+            None,
+            ("Exit", "Ctrl+Q", "close"),
+        ),
+    ),
+    ("Edit", (("Clear All", None, "_on_clear"),)),
+    # Forwarded to the Solve button so _on_solve has a single connection
+    ("Solve", (("Solve", "Ctrl+Enter", "_solve_btn.click"),)),
+)
+
+# Set once SAVED_PUZZLES_DIR has been created in this session
+_saved_dir_initialized = False
+
+
+def _ensure_saved_puzzles_dir() -> None:
+    """Create the saved puzzles directory the first time it is needed."""
+    global _saved_dir_initialized
+    if not _saved_dir_initialized:
+        SAVED_PUZZLES_DIR.mkdir(parents=True, exist_ok=True)
+        _saved_dir_initialized = True
+
 
 class EditorWindow(QMainWindow):
     """Main editor window for the Polyomino Puzzle Solver.
@@ -50,11 +96,29 @@ class EditorWindow(QMainWindow):
             blocked_cells=set(),
         )
         self._selected_piece_index: int | None = None
+        # The validation label is only rewritten when its inputs differ
+        self._validation_key: tuple[bool, int, int] | None = None
+        self._bulk_loading = False
+        # Message boxes are built on first use and reused, one per icon
+        self._message_boxes: dict[QMessageBox.Icon, QMessageBox] = {}
+
+        # Board edits are coalesced and applied to the config once per frame,
+        # and piece edits share the same timer for their revalidation
+        self._pending_dimensions: tuple[int, int] | None = None
+        self._pending_blocked_cells: frozenset[tuple[int, int]] | None = None
+        self._pending_validation = False
+        self._board_sync_timer = QTimer(self)
+        self._board_sync_timer.setSingleShot(True)
+        self._board_sync_timer.setInterval(16)
+        self._board_sync_timer.timeout.connect(self._flush_board_changes)
 
         self._setup_ui()
         self._setup_menu()
         self._setup_status_bar()
-        self._saved_puzzles_tab.refresh()
+
+        # The saved puzzles directory is scanned when that tab is first shown
+        self._saved_puzzles_loaded = False
+        self._tab_widget.currentChanged.connect(self._on_tab_changed)
 
     def _setup_ui(self) -> None:
         """Set up the user interface."""
@@ -107,7 +171,8 @@ class EditorWindow(QMainWindow):
 
         # Validation status label
         self._validation_label = QLabel("")
-        self._validation_label.setStyleSheet("color: orange;")
+        self._validation_label.setStyleSheet(_VALIDATION_STYLE)
+        self._validation_label.setProperty("severity", "warn")
         button_layout.addWidget(self._validation_label)
 
         main_layout.addWidget(button_container)
@@ -116,60 +181,21 @@ class EditorWindow(QMainWindow):
         self._update_board()
 
     def _setup_menu(self) -> None:
-        """Set up the menu bar."""
+        """Set up the menu bar from the _MENUS table."""
         menubar = self.menuBar()
 
-        # File menu
-        file_menu = menubar.addMenu("File")
-
-        new_action = QAction("New Puzzle", self)
-        new_action.setShortcut("Ctrl+N")
-        new_action.triggered.connect(self._on_new_puzzle)
-        file_menu.addAction(new_action)
-
-        file_menu.addSeparator()
-
-        save_action = QAction("Save", self)
-        save_action.setShortcut("Ctrl+S")
-        save_action.triggered.connect(self._on_save)
-        file_menu.addAction(save_action)
-
-        load_action = QAction("Load", self)
-        load_action.setShortcut("Ctrl+O")
-        load_action.triggered.connect(self._on_load)
-        file_menu.addAction(load_action)
-
-        file_menu.addSeparator()
-
-        export_action = QAction("Export...", self)
-        export_action.triggered.connect(self._on_export)
-        file_menu.addAction(export_action)
-
-        import_action = QAction("Import...", self)
-        import_action.triggered.connect(self._on_import)
-        file_menu.addAction(import_action)
-
-        file_menu.addSeparator()
-
-        exit_action = QAction("Exit", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-
-        # Edit menu
-        edit_menu = menubar.addMenu("Edit")
-
-        clear_action = QAction("Clear All", self)
-        clear_action.triggered.connect(self._on_clear)
-        edit_menu.addAction(clear_action)
-
-        # Solve menu
-        solve_menu = menubar.addMenu("Solve")
-
-        solve_action = QAction("Solve", self)
-        solve_action.setShortcut("Ctrl+Enter")
-        solve_action.triggered.connect(self._on_solve)
-        solve_menu.addAction(solve_action)
+        for title, actions in _MENUS:
+            menu = menubar.addMenu(title)
+            for spec in actions:
+                if spec is None:
+                    menu.addSeparator()
+                    continue
+                text, shortcut, handler = spec
+                action = QAction(text, self)
+                if shortcut:
+                    action.setShortcut(shortcut)
+                action.triggered.connect(attrgetter(handler)(self))
+                menu.addAction(action)
 
     def _setup_status_bar(self) -> None:
         """Set up the status bar."""
@@ -177,18 +203,125 @@ class EditorWindow(QMainWindow):
         self.setStatusBar(self._status_bar)
         self._status_bar.showMessage("Ready")
 
+    @Slot(object)
     def _on_piece_selected(self, piece) -> None:
         """Handle piece selection from piece tab."""
         pass  # Currently no action needed on selection
 
+    @Slot(int)
+    def _on_tab_changed(self, index: int) -> None:
+        """Populate the saved puzzles list the first time its tab is opened."""
+        if (
+            not self._saved_puzzles_loaded
+            and self._tab_widget.widget(index) is self._saved_puzzles_tab
+        ):
+            self._saved_puzzles_loaded = True
+            self._saved_puzzles_tab.refresh()
+
+    @Slot(object)
     def _on_saved_puzzle_selected(self, filepath: Path) -> None:
         """Handle saved puzzle selection."""
         self._load_puzzle_from_file(filepath)
 
+    @Slot(object)
     def _on_saved_puzzle_deleted(self, filepath: Path) -> None:
         """Handle saved puzzle deletion."""
         self._status_bar.showMessage(f"Deleted puzzle: {filepath.stem}")
 
+    def _message_box(
+        self,
+        icon: QMessageBox.Icon,
+        title: str,
+        text: str,
+        buttons: QMessageBox.StandardButton,
+    ) -> QMessageBox:
+        """Get the shared message box for an icon, filled in for this prompt.
+
+        Args:
+            icon: Message box icon, which selects the cached instance
+            title: Window title
+            text: Message text
+            buttons: Standard buttons to show
+
+        Returns:
+            Configured message box, ready to exec()
+        """
+        box = self._message_boxes.get(icon)
+        if box is None:
+            box = QMessageBox(self)
+            box.setIcon(icon)
+            self._message_boxes[icon] = box
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.setStandardButtons(buttons)
+        return box
+
+    def _confirm(self, title: str, text: str) -> bool:
+        """Ask a yes/no question.
+
+        Args:
+            title: Window title
+            text: Question text
+
+        Returns:
+            True if the user answered Yes
+        """
+        box = self._message_box(
+            QMessageBox.Icon.Question,
+            title,
+            text,
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+        )
+        return box.exec() == QMessageBox.StandardButton.Yes
+
+    def _inform(self, title: str, text: str) -> None:
+        """Show an information message.
+
+        Args:
+            title: Window title
+            text: Message text
+        """
+        self._message_box(
+            QMessageBox.Icon.Information, title, text, QMessageBox.StandardButton.Ok
+        ).exec()
+
+    def _report_error(self, title: str, text: str) -> None:
+        """Show an error message.
+
+        Args:
+            title: Window title
+            text: Message text
+        """
+        self._message_box(
+            QMessageBox.Icon.Critical, title, text, QMessageBox.StandardButton.Ok
+        ).exec()
+
+    def _run_io(
+        self, action: str, operation: Callable[..., Any], *args: Any
+    ) -> tuple[bool, Any]:
+        """Run a puzzle file operation, reporting any failure to the user.
+
+        Args:
+            action: Verb used in error messages ("save", "load", ...)
+            operation: File I/O function to call
+            *args: Arguments for the operation; the last one is the path
+
+        Returns:
+            (True, result) on success, (False, None) if an error was shown
+        """
+        title = f"{action.capitalize()} Failed"
+        try:
+            return True, operation(*args)
+        except FileNotFoundError:
+            self._report_error(title, f"File not found:\n{args[-1]}")
+        except ValueError as e:
+            self._report_error(title, f"Invalid puzzle file:\n{e}")
+        except OSError as e:
+            self._report_error(title, f"Failed to {action} puzzle:\n{e}")
+        except Exception as e:
+            self._report_error(title, f"An unexpected error occurred:\n{e}")
+        return False, None
+
     @property
     def config(self) -> PuzzleConfiguration:
         """Get the current puzzle configuration."""
@@ -201,81 +334,153 @@ class EditorWindow(QMainWindow):
         )
         self._board_tab.set_blocked_cells(self._config.blocked_cells)
 
+    def _apply_loaded_config(self, loaded_config: PuzzleConfiguration) -> None:
+        """Make a loaded or imported configuration the current one.
+
+        Args:
+            loaded_config: Configuration read from a puzzle file
+        """
+        loaded_config.name = loaded_config.name or "Imported Puzzle"
+        self._config = loaded_config
+        # Edits queued against the previous puzzle no longer apply
+        self._board_sync_timer.stop()
+        self._pending_dimensions = None
+        self._pending_blocked_cells = None
+        self._pending_validation = False
+
+        # Validate once after the board and piece tabs are repopulated
+        self._bulk_loading = True
+        try:
+            self._update_board()
+
+            self._piece_tab.set_pieces(self._config.pieces)
+        finally:
+            self._bulk_loading = False
+        self._update_validation()
+
     def _update_validation(self) -> None:
-        """Update validation status display."""
+        """Update validation status display.
+
+        Skipped while a puzzle is being bulk loaded, and a no-op when the
+        piece and board areas are the same as on the last update.
+        """
+        if self._bulk_loading:
+            return
+
         # Get piece area and board area
+        no_pieces = self._config.is_empty
         piece_area = self._config.get_piece_area()
-        board_area = self._config.get_board_area() - len(self._config.blocked_cells)
+        board_area = self._config.available_area
 
-        if len(self._config.pieces) == 0:
-            self._validation_label.setText("No pieces defined")
-            self._validation_label.setStyleSheet("color: orange;")
+        key = (no_pieces, piece_area, board_area)
+        if key == self._validation_key:
+            return
+        self._validation_key = key
+
+        if no_pieces:
+            self._set_validation_status(_NO_PIECES_TEXT, "warn")
         elif piece_area > board_area:
-            self._validation_label.setText(
+            self._set_validation_status(
                 f"Warning: Piece area ({piece_area}) exceeds "
-                f"available board area ({board_area})"
+                f"available board area ({board_area})",
+                "error",
             )
-            self._validation_label.setStyleSheet("color: red;")
         elif piece_area < board_area:
-            self._validation_label.setText(
+            self._set_validation_status(
                 f"Note: Piece area ({piece_area}) is less than "
-                f"board area ({board_area})"
+                f"board area ({board_area})",
+                "info",
             )
-            self._validation_label.setStyleSheet("color: blue;")
         else:
-            self._validation_label.setText("Configuration valid")
-            self._validation_label.setStyleSheet("color: green;")
+            self._set_validation_status(_VALID_TEXT, "ok")
 
+    def _set_validation_status(self, text: str, severity: str) -> None:
+        """Show a validation message, colored by the label's stylesheet.
+
+        Args:
+            text: Message to display
+            severity: One of "ok", "info", "warn" or "error"
+        """
+        label = self._validation_label
+        if text != label.text():
+            label.setText(text)
+        if label.property("severity") != severity:
+            # Re-polish so the existing stylesheet rules are re-matched
+            label.setProperty("severity", severity)
+            style = label.style()
+            style.unpolish(label)
+            style.polish(label)
+
+    @Slot(int, int)
     def _on_board_dimensions_changed(self, width: int, height: int) -> None:
         """Handle board dimension changes."""
-        # Create new configuration with updated dimensions
-        self._config = PuzzleConfiguration(
-            name=self._config.name,
-            board_width=width,
-            board_height=height,
-            pieces=self._config.pieces.copy(),
-            blocked_cells=self._board_tab.blocked_cells,
-        )
+        self._pending_dimensions = (width, height)
+        self._board_sync_timer.start()
 
-        self._update_validation()
-        self._status_bar.showMessage(f"Board size: {width}×{height}")
-
-    def _on_blocked_cells_changed(self, blocked_cells: set[tuple[int, int]]) -> None:
+    @Slot(object)
+    def _on_blocked_cells_changed(
+        self, blocked_cells: frozenset[tuple[int, int]]
+    ) -> None:
         """Handle blocked cells changes."""
-        # Update configuration
-        self._config = PuzzleConfiguration(
-            name=self._config.name,
-            board_width=self._config.board_width,
-            board_height=self._config.board_height,
-            pieces=self._config.pieces.copy(),
-            blocked_cells=blocked_cells,
-        )
+        self._pending_blocked_cells = blocked_cells
+        self._board_sync_timer.start()
+
+    @Slot()
+    def _flush_board_changes(self) -> None:
+        """Apply pending board edits to the configuration and revalidate."""
+        # A debounced spinner change queues its dimensions here when applied
+        self._board_tab.flush_pending_dimensions()
+        self._board_sync_timer.stop()
+        dimensions = self._pending_dimensions
+        blocked_cells = self._pending_blocked_cells
+        revalidate = self._pending_validation
+        self._pending_dimensions = None
+        self._pending_blocked_cells = None
+        self._pending_validation = False
+
+        # Update the configuration in place; pieces are unaffected
+        if dimensions is not None:
+            width, height = dimensions
+            # Only announce real size changes, not re-syncs after a load
+            resized = (width, height) != (
+                self._config.board_width,
+                self._config.board_height,
+            )
+            self._config.set_dimensions(width, height)
+            # The grid has already trimmed its cells to the new size
+            self._config.blocked_cells = self._board_tab.blocked_cells
+            if resized:
+                self._status_bar.showMessage(f"Board size: {width}×{height}")
+        elif blocked_cells is not None:
+            self._config.blocked_cells = blocked_cells
+        elif not revalidate:
+            return
 
         self._update_validation()
 
+    @Slot(object)
     def _on_piece_added(self, piece: PuzzlePiece) -> None:
         """Handle piece added from piece tab."""
-        # Sync with our configuration
+        # Sync with our configuration; revalidate once per burst of edits
         self._config.add_piece(piece)
-        self._update_validation()
+        self._pending_validation = True
+        self._board_sync_timer.start()
 
+    @Slot(object)
     def _on_piece_deleted(self, piece: PuzzlePiece) -> None:
         """Handle piece deleted from piece tab."""
         # Sync with our configuration
         if piece in self._config.pieces:
             self._config.remove_piece(piece)
-        self._update_validation()
+        self._pending_validation = True
+        self._board_sync_timer.start()
 
+    @Slot()
     def _on_new_puzzle(self) -> None:
         """Handle new puzzle action."""
-        reply = QMessageBox.question(
-            self,
-            "New Puzzle",
-            "Create a new puzzle? All unsaved changes will be lost.",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-        )
-
-        if reply == QMessageBox.StandardButton.Yes:
+        if self._confirm(
+            "New Puzzle", "Create a new puzzle? All unsaved changes will be lost."
+        ):
             self._config = PuzzleConfiguration(
                 name="New Puzzle",
                 board_width=5,
@@ -287,9 +492,13 @@ class EditorWindow(QMainWindow):
             self._update_validation()
             self._status_bar.showMessage("New puzzle created")
 
+    @Slot()
     def _on_save(self) -> None:
         """Handle save action."""
-        SAVED_PUZZLES_DIR.mkdir(parents=True, exist_ok=True)
+        from src.utils.file_io import save_puzzle
+
+        self._flush_board_changes()
+        _ensure_saved_puzzles_dir()
 
         puzzle_name, ok = QFileDialog.getSaveFileName(
             self,
@@ -305,31 +514,21 @@ class EditorWindow(QMainWindow):
         if filepath.suffix != ".json":
             filepath = filepath.with_suffix(".json")
 
-        try:
-            save_puzzle(self._config, filepath)
-            self._status_bar.showMessage(f"Puzzle saved: {filepath.name}")
-            QMessageBox.information(
-                self,
-                "Save Successful",
-                f"Puzzle saved to:\n{filepath}",
-            )
-            self._saved_puzzles_tab.refresh()
-        except OSError as e:
-            QMessageBox.critical(
-                self,
-                "Save Failed",
-                f"Failed to save puzzle:\n{e}",
-            )
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Save Failed",
-                f"An unexpected error occurred:\n{e}",
-            )
+        ok, _ = self._run_io("save", save_puzzle, self._config, filepath)
+        if not ok:
+            return
 
+        self._status_bar.showMessage(f"Puzzle saved: {filepath.name}")
+        self._inform(
+            "Save Successful",
+            f"Puzzle saved to:\n{filepath}",
+        )
+        self._saved_puzzles_tab.refresh()
+
+    @Slot()
     def _on_load(self) -> None:
         """Handle load action."""
-        SAVED_PUZZLES_DIR.mkdir(parents=True, exist_ok=True)
+        _ensure_saved_puzzles_dir()
 
         filepath, ok = QFileDialog.getOpenFileName(
             self,
@@ -343,8 +542,12 @@ class EditorWindow(QMainWindow):
 
         self._load_puzzle_from_file(Path(filepath))
 
+    @Slot()
     def _on_export(self) -> None:
         """Handle export action."""
+        from src.utils.file_io import export_puzzle
+
+        self._flush_board_changes()
         filepath, ok = QFileDialog.getSaveFileName(
             self,
             "Export Puzzle",
@@ -359,29 +562,21 @@ class EditorWindow(QMainWindow):
         if export_path.suffix != ".json":
             export_path = export_path.with_suffix(".json")
 
-        try:
-            export_puzzle(self._config, export_path)
-            self._status_bar.showMessage(f"Puzzle exported: {export_path.name}")
-            QMessageBox.information(
-                self,
-                "Export Successful",
-                f"Puzzle exported to:\n{export_path}",
-            )
-        except OSError as e:
-            QMessageBox.critical(
-                self,
-                "Export Failed",
-                f"Failed to export puzzle:\n{e}",
-            )
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Export Failed",
-                f"An unexpected error occurred:\n{e}",
-            )
+        ok, _ = self._run_io("export", export_puzzle, self._config, export_path)
+        if not ok:
+            return
 
+        self._status_bar.showMessage(f"Puzzle exported: {export_path.name}")
+        self._inform(
+            "Export Successful",
+            f"Puzzle exported to:\n{export_path}",
+        )
+
+    @Slot()
     def _on_import(self) -> None:
         """Handle import action."""
+        from src.utils.file_io import import_puzzle
+
         filepath, ok = QFileDialog.getOpenFileName(
             self,
             "Import Puzzle",
@@ -394,67 +589,25 @@ class EditorWindow(QMainWindow):
 
         path = Path(filepath)
 
-        try:
-            loaded_config = import_puzzle(path)
-
-            loaded_config.name = loaded_config.name or "Imported Puzzle"
-            self._config = loaded_config
-            self._update_board()
-            self._update_validation()
+        ok, loaded_config = self._run_io("import", import_puzzle, path)
+        if not ok:
+            return
 
-            # Use the piece tab's internal method to add pieces with proper sorting
-            self._piece_tab.clear_all()
-            for piece, count in self._config.pieces.items():
-                self._piece_tab._pieces[piece] = count
-            self._piece_tab._refresh_piece_list()
-            self._piece_tab._piece_count_label.setText(
-                f"Pieces: {len(self._piece_tab._get_all_pieces())}"
-            )
+        self._apply_loaded_config(loaded_config)
 
-            self._status_bar.showMessage(f"Imported puzzle: {path.name}")
+        self._status_bar.showMessage(f"Imported puzzle: {path.name}")
 
-            QMessageBox.information(
-                self,
-                "Import Successful",
-                f"Puzzle imported:\n{path.name}\n\n"
-                f"Board: {self._config.board_width}x{self._config.board_height}\n"
-                f"Piece types: {len(self._config.pieces)}",
-            )
-        except FileNotFoundError:
-            QMessageBox.critical(
-                self,
-                "Import Failed",
-                f"File not found:\n{path}",
-            )
-        except ValueError as e:
-            QMessageBox.critical(
-                self,
-                "Import Failed",
-                f"Invalid puzzle file:\n{e}",
-            )
-        except OSError as e:
-            QMessageBox.critical(
-                self,
-                "Import Failed",
-                f"Failed to import puzzle:\n{e}",
-            )
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Import Failed",
-                f"An unexpected error occurred:\n{e}",
-            )
+        self._inform(
+            "Import Successful",
+            f"Puzzle imported:\n{path.name}\n\n"
+            f"Board: {self._config.board_width}x{self._config.board_height}\n"
+            f"Piece types: {len(self._config.pieces)}",
+        )
 
+    @Slot()
     def _on_clear(self) -> None:
         """Handle clear action."""
-        reply = QMessageBox.question(
-            self,
-            "Clear All",
-            "Clear all pieces and reset board?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-        )
-
-        if reply == QMessageBox.StandardButton.Yes:
+        if self._confirm("Clear All", "Clear all pieces and reset board?"):
             self._config = PuzzleConfiguration(
                 name=self._config.name,
                 board_width=self._config.board_width,
@@ -467,8 +620,12 @@ class EditorWindow(QMainWindow):
             self._piece_tab.clear_all()
             self._status_bar.showMessage("Cleared all pieces and reset board")
 
+    @Slot()
     def _on_solve(self) -> None:
         """Handle solve action."""
+        # Make sure the latest board edits are in the configuration
+        self._flush_board_changes()
+
         # Validate configuration
         if len(self._config.pieces) == 0:
             QMessageBox.warning(
@@ -480,7 +637,7 @@ class EditorWindow(QMainWindow):
 
         # Check if configuration is valid
         piece_area = self._config.get_piece_area()
-        board_area = self._config.get_board_area() - len(self._config.blocked_cells)
+        board_area = self._config.available_area
 
         if piece_area > board_area:
             reply = QMessageBox.question(
@@ -492,8 +649,12 @@ class EditorWindow(QMainWindow):
             if reply == QMessageBox.StandardButton.No:
                 return
 
-        # Create and show visualization window
-        viz_window = VisualizationWindow(self._config)
+        # Create and show visualization window (imported on first solve)
+        from src.gui.visualization_window import VisualizationWindow
+
+        # The editor keeps editing its config in place, so the window gets a
+        # snapshot that later board edits cannot resize under it
+        viz_window = VisualizationWindow(self._config.copy())
         viz_window.show()
 
         self._status_bar.showMessage("Solving...")
@@ -501,14 +662,7 @@ class EditorWindow(QMainWindow):
     @override
     def closeEvent(self, event: QEvent) -> None:
         """Handle close event."""
-        reply = QMessageBox.question(
-            self,
-            "Exit",
-            "Exit the application?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-        )
-
-        if reply == QMessageBox.StandardButton.No:
+        if not self._confirm("Exit", "Exit the application?"):
             event.ignore()
         else:
             event.accept()
@@ -519,53 +673,19 @@ class EditorWindow(QMainWindow):
         Args:
             filepath: Path to the puzzle file
         """
-        try:
-            loaded_config = load_puzzle(filepath)
+        from src.utils.file_io import load_puzzle
 
-            loaded_config.name = loaded_config.name or "Imported Puzzle"
-            self._config = loaded_config
-            self._update_board()
-            self._update_validation()
+        ok, loaded_config = self._run_io("load", load_puzzle, filepath)
+        if not ok:
+            return
 
-            # Use the piece tab's internal method to add pieces with proper sorting
-            self._piece_tab.clear_all()
-            for piece, count in self._config.pieces.items():
-                self._piece_tab._pieces[piece] = count
-            self._piece_tab._refresh_piece_list()
-            self._piece_tab._piece_count_label.setText(
-                f"Pieces: {len(self._piece_tab._get_all_pieces())}"
-            )
+        self._apply_loaded_config(loaded_config)
 
-            self._status_bar.showMessage(f"Loaded puzzle: {filepath.name}")
+        self._status_bar.showMessage(f"Loaded puzzle: {filepath.name}")
 
-            QMessageBox.information(
-                self,
-                "Load Successful",
-                f"Puzzle loaded:\n{filepath.name}\n\n"
-                f"Board: {self._config.board_width}x{self._config.board_height}\n"
-                f"Piece types: {len(self._config.pieces)}",
-            )
-        except FileNotFoundError:
-            QMessageBox.critical(
-                self,
-                "Load Failed",
-                f"File not found:\n{filepath}",
-            )
-        except ValueError as e:
-            QMessageBox.critical(
-                self,
-                "Load Failed",
-                f"Invalid puzzle file:\n{e}",
-            )
-        except OSError as e:
-            QMessageBox.critical(
-                self,
-                "Load Failed",
-                f"Failed to load puzzle:\n{e}",
-            )
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Load Failed",
-                f"An unexpected error occurred:\n{e}",
-            )
+        self._inform(
+            "Load Successful",
+            f"Puzzle loaded:\n{filepath.name}\n\n"
+            f"Board: {self._config.board_width}x{self._config.board_height}\n"
+            f"Piece types: {len(self._config.pieces)}",
+        )
@@ -6,10 +6,15 @@ and editing polyomino pieces through a grid-based drawing interface.
 
 from __future__ import annotations
 
-from collections.abc import Callable
-
-from PySide6.QtCore import QSize, Qt, Signal
-from PySide6.QtGui import QColor, QPainter, QPaintEvent, QPen, QResizeEvent
+from bisect import bisect_right
+from collections.abc import Callable, Iterable, Mapping
+from functools import lru_cache
+from itertools import chain, repeat, starmap
+from operator import itemgetter
+
+from PySide6.QtCore import QLine, QRect, QSize, Qt, QTimer, Signal
+from PySide6.QtGui import (QBrush, QColor, QFont, QFontMetrics, QImage,
+                           QPainter, QPaintEvent, QPen, QPixmap, QResizeEvent)
 from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
@@ -25,6 +30,71 @@ from PySide6.QtWidgets import (
 
 from src.models.piece import PuzzlePiece
 
+# Largest grid dimension; also the row stride of the filled-cell mask
+_MAX_DIM = 50
+
+# Canonical shapes of the five free tetrominoes, mapped to their labels
+_TETROMINO_TYPES: dict[frozenset[tuple[int, int]], str] = {
+    PuzzlePiece(cells).canonical_shape: label
+    for label, cells in (
+        ("Tetromino (I)", {(0, 0), (0, 1), (0, 2), (0, 3)}),
+        ("Tetromino (O)", {(0, 0), (0, 1), (1, 0), (1, 1)}),
+        ("Tetromino (L)", {(0, 0), (1, 0), (2, 0), (2, 1)}),
+        ("Tetromino (T)", {(0, 0), (0, 1), (0, 2), (1, 1)}),
+        ("Tetromino (S)", {(0, 1), (0, 2), (1, 0), (1, 1)}),
+    )
+}
+
+
+@lru_cache(maxsize=512)
+def _shape_type(shape: frozenset[tuple[int, int]]) -> str:
+    """Identify the type of a polyomino from its canonical shape.
+
+    Args:
+        shape: Canonical (normalized) cell set of a piece
+
+    Returns:
+        A string describing the shape type
+    """
+    area = len(shape)
+
+    # Get bounding box dimensions in a single pass
+    min_row = min_col = _MAX_DIM
+    max_row = max_col = -1
+    for r, c in shape:
+        if r < min_row:
+            min_row = r
+        if r > max_row:
+            max_row = r
+        if c < min_col:
+            min_col = c
+        if c > max_col:
+            max_col = c
+    width = max_col - min_col + 1
+    height = max_row - min_row + 1
+
+    # Special shape patterns
+    if area == 1:
+        return "Mono"
+    elif area == 2:
+        return "Domino"
+    elif area == 3:
+        # L-shape or straight
+        if width == 1 or height == 1:
+            return "Triomino (straight)"
+        else:
+            return "Triomino (L)"
+    elif area == 4:
+        return _TETROMINO_TYPES.get(shape, "Tetromino")
+    else:
+        # For larger pieces, use dimensions
+        if width == 1 or height == 1:
+            return f"Bar ({area})"
+        elif width == height:
+            return f"Square ({area})"
+        else:
+            return f"Polyomino ({width}×{height})"
+
 
 class PieceGridWidget(QWidget):
     """Grid widget for drawing and editing piece shapes.
@@ -43,7 +113,9 @@ class PieceGridWidget(QWidget):
     MAX_CELL_SIZE = 50
     DEFAULT_CELL_SIZE = 30
     FILL_COLOR = QColor(0, 123, 255)  # Blue for filled cells
+    EMPTY_COLOR = QColor(255, 255, 255)  # White for empty cells
     GRID_COLOR = QColor(180, 180, 180)  # Medium gray for grid lines
+    LABEL_COLOR = QColor(100, 100, 100)  # Dark gray for row/column labels
 
     def __init__(self, parent: QWidget | None = None) -> None:
         """Initialize the piece grid widget.
@@ -55,9 +127,33 @@ class PieceGridWidget(QWidget):
 
         self._grid_width = 10
         self._grid_height = 10
-        self._filled_cells: set[tuple[int, int]] = set()
+        # Flat row-major mask (index row * _MAX_DIM + col), 1 = filled
+        self._mask = bytearray(_MAX_DIM * _MAX_DIM)
         self._cell_size = self.DEFAULT_CELL_SIZE
         self._is_filling = True  # True = add cells, False = remove cells
+        self._last_cell: tuple[int, int] | None = None  # Last cell hit in a drag
+        # Paint resources built once instead of per paint/cell
+        self._grid_pen = QPen(self.GRID_COLOR)
+        self._grid_pen.setWidth(1)
+        self._label_pen = self.LABEL_COLOR
+        self._fill_brush = QBrush(self.FILL_COLOR)
+        self._label_font: QFont | None = None
+        self._label_font_size = -1
+        self._label_metrics: QFontMetrics | None = None
+        # Label text and width by row/column number, for the current font
+        self._label_advances: dict[int, tuple[str, int]] = {}
+        # Grid geometry and label metrics, rebuilt by _ensure_geometry() after
+        # a resize or dimension change
+        self._geom_dirty = True
+        self._offset_x = 0
+        self._offset_y = 0
+        self._label_text_offset = 0
+        self._col_labels: list[tuple[str, int]] = []
+        self._row_labels: list[tuple[str, int]] = []
+        self._grid_lines: list[QLine] = []
+        # Back buffer holding the rendered grid, rebuilt only after changes
+        self._cache: QPixmap | None = None
+        self._cache_valid = False
 
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
@@ -77,6 +173,8 @@ class PieceGridWidget(QWidget):
         """
         self._grid_width = max(1, min(50, value))
         self._trim_filled_cells()
+        self._geom_dirty = True
+        self._cache_valid = False
         self.updateGeometry()
         self.update()
 
@@ -94,32 +192,53 @@ class PieceGridWidget(QWidget):
         """
         self._grid_height = max(1, min(50, value))
         self._trim_filled_cells()
+        self._geom_dirty = True
+        self._cache_valid = False
         self.updateGeometry()
         self.update()
 
     @property
-    def filled_cells(self) -> set[tuple[int, int]]:
-        """Get the set of filled cell positions."""
-        return self._filled_cells.copy()
+    def filled_cells(self) -> frozenset[tuple[int, int]]:
+        """Get the set of filled cell positions.
+
+        The result is immutable, so callers can keep it without a copy.
+        """
+        mask = self._mask
+        cells = []
+        index = mask.find(1)
+        while index != -1:
+            cells.append(divmod(index, _MAX_DIM))
+            index = mask.find(1, index + 1)
+        return frozenset(cells)
 
     @filled_cells.setter
-    def filled_cells(self, cells: set[tuple[int, int]]) -> None:
+    def filled_cells(self, cells: Iterable[tuple[int, int]]) -> None:
         """Set the filled cells and update display.
 
+        Cells outside the grid are dropped.
+
         Args:
-            cells: Set of (row, col) positions to mark as filled
+            cells: (row, col) positions to mark as filled
         """
-        self._filled_cells = cells.copy()
-        self._trim_filled_cells()
+        mask = bytearray(_MAX_DIM * _MAX_DIM)
+        for row, col in cells:
+            if 0 <= row < self._grid_height and 0 <= col < self._grid_width:
+                mask[row * _MAX_DIM + col] = 1
+        self._mask = mask
+        self._cache_valid = False
         self.update()
 
     def _trim_filled_cells(self) -> None:
         """Remove filled cells that are outside the grid bounds."""
-        self._filled_cells = {
-            (r, c)
-            for r, c in self._filled_cells
-            if 0 <= r < self._grid_height and 0 <= c < self._grid_width
-        }
+        # Clear whole rows below the grid, then the tail of each remaining
+        # row past the last column
+        mask = self._mask
+        tail = _MAX_DIM - self._grid_width
+        mask[self._grid_height * _MAX_DIM :] = bytes(
+            (_MAX_DIM - self._grid_height) * _MAX_DIM
+        )
+        for base in range(self._grid_width, self._grid_height * _MAX_DIM, _MAX_DIM):
+            mask[base : base + tail] = bytes(tail)
 
     def set_dimensions(self, width: int, height: int) -> None:
         """Set grid dimensions.
@@ -132,17 +251,26 @@ class PieceGridWidget(QWidget):
         self._grid_height = max(1, min(50, height))
         self._trim_filled_cells()
         self._calculate_cell_size()
+        self._geom_dirty = True
+        self._cache_valid = False
         self.updateGeometry()
         self.update()
 
     def clear(self) -> None:
         """Clear all filled cells."""
-        self._filled_cells.clear()
+        self._mask = bytearray(_MAX_DIM * _MAX_DIM)
+        self._cache_valid = False
         self.update()
 
     def resizeEvent(self, event: QResizeEvent) -> None:
         """Handle widget resize to auto-fit cell size."""
         self._calculate_cell_size()
+        self._geom_dirty = True
+        # Qt re-sends resize events at the same size (e.g. from grab()); keep
+        # the cache when it already matches
+        cache = self._cache
+        if cache is None or cache.deviceIndependentSize().toSize() != event.size():
+            self._cache_valid = False
         super().resizeEvent(event)
 
     def _calculate_cell_size(self) -> None:
@@ -159,6 +287,66 @@ class PieceGridWidget(QWidget):
                 self.MIN_CELL_SIZE, min(cell_width, cell_height, self.MAX_CELL_SIZE)
             )
 
+    def _ensure_geometry(self) -> None:
+        """Recompute grid offsets and label metrics if they are stale."""
+        if not self._geom_dirty:
+            return
+        self._geom_dirty = False
+
+        # Extra padding for labels
+        label_padding = 25
+        grid_width = self._grid_width * self._cell_size
+        grid_height = self._grid_height * self._cell_size
+        # Ensure labels have enough space
+        self._offset_x = max((self.width() - grid_width) // 2, label_padding)
+        self._offset_y = max((self.height() - grid_height) // 2, label_padding)
+
+        # All grid lines, drawn with a single drawLines() call
+        x0, y0 = self._offset_x, self._offset_y
+        x1, y1 = x0 + grid_width, y0 + grid_height
+        cs = self._cell_size
+        self._grid_lines = [
+            QLine(x0 + col * cs, y0, x0 + col * cs, y1)
+            for col in range(self._grid_width + 1)
+        ] + [
+            QLine(x0, y0 + row * cs, x1, y0 + row * cs)
+            for row in range(self._grid_height + 1)
+        ]
+
+        # Label metrics only change with the font size (which follows the
+        # cell size) or the number of rows/columns
+        font_size = max(7, min(10, self._cell_size // 3))
+        if self._label_font is None or font_size != self._label_font_size:
+            font = QFont(self.font())
+            font.setPointSize(font_size)
+            self._label_font = font
+            self._label_font_size = font_size
+            self._label_metrics = QFontMetrics(font)
+            self._label_text_offset = self._label_metrics.height() // 3
+            self._label_advances.clear()
+            self._col_labels = []
+            self._row_labels = []
+        if len(self._col_labels) != self._grid_width:
+            self._col_labels = [self._label_entry(i) for i in range(self._grid_width)]
+        if len(self._row_labels) != self._grid_height:
+            self._row_labels = [self._label_entry(i) for i in range(self._grid_height)]
+
+    def _label_entry(self, index: int) -> tuple[str, int]:
+        """Get a row/column label and its width in the current label font.
+
+        Args:
+            index: Row or column number
+
+        Returns:
+            (text, horizontal advance) tuple
+        """
+        entry = self._label_advances.get(index)
+        if entry is None:
+            text = str(index)
+            entry = (text, self._label_metrics.horizontalAdvance(text))
+            self._label_advances[index] = entry
+        return entry
+
     def sizeHint(self) -> QSize:
         """Return the preferred size hint."""
         width = self._grid_width * self._cell_size + 10
@@ -172,69 +360,169 @@ class PieceGridWidget(QWidget):
         return QSize(width, height)
 
     def paintEvent(self, event: QPaintEvent) -> None:
-        """Paint the grid."""
+        """Paint the grid from the cached pixmap."""
+        if not self._cache_valid or self._cache is None:
+            self._render_to_pixmap()
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        # Extra padding for labels
-        label_padding = 25
-        grid_width = self._grid_width * self._cell_size
-        grid_height = self._grid_height * self._cell_size
-        offset_x = (self.width() - grid_width) // 2
-        offset_y = (self.height() - grid_height) // 2
+        painter.drawPixmap(0, 0, self._cache)
+
+    def _render_to_pixmap(self) -> None:
+        """Render the whole grid into a fresh cache pixmap."""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        self._render(painter)
+        painter.end()
+        self._cache = pixmap
+        self._cache_valid = True
+
+    def _render_cell_to_pixmap(self, row: int, col: int) -> None:
+        """Redraw one cell into the cache if it has already been built.
 
-        # Ensure labels have enough space
-        offset_x = max(offset_x, label_padding)
-        offset_y = max(offset_y, label_padding)
+        Args:
+            row: Cell row
+            col: Cell column
+        """
+        if not self._cache_valid or self._cache is None:
+            return
+        self._ensure_geometry()
+        cs = self._cell_size
+        x = self._offset_x + col * cs
+        y = self._offset_y + row * cs
+        filled = self._mask[row * _MAX_DIM + col]
+        painter = QPainter(self._cache)
+        # Only this cell's fill and its four edges change; labels sit outside
+        # the grid, so nothing else needs redrawing
+        painter.fillRect(
+            QRect(x, y, cs, cs), self.FILL_COLOR if filled else self.EMPTY_COLOR
+        )
+        painter.setPen(self._grid_pen)
+        painter.drawLines(
+            [
+                QLine(x, y, x + cs, y),
+                QLine(x, y + cs, x + cs, y + cs),
+                QLine(x, y, x, y + cs),
+                QLine(x + cs, y, x + cs, y + cs),
+            ]
+        )
+        painter.end()
 
-        # Draw cells
-        for row in range(self._grid_height):
-            for col in range(self._grid_width):
-                x = offset_x + col * self._cell_size
-                y = offset_y + row * self._cell_size
+    def _render(self, painter: QPainter) -> None:
+        """Draw the grid cells, grid lines and labels.
 
-                # Determine cell color
-                if (row, col) in self._filled_cells:
-                    color = self.FILL_COLOR
-                else:
-                    color = QColor(255, 255, 255)
+        Args:
+            painter: Painter targeting the cache pixmap
+        """
+        self._ensure_geometry()
+        # Cells and grid lines are axis-aligned on integer coordinates, so
+        # they stay on the raster engine's non-antialiased fast path
+        offset_x = self._offset_x
+        offset_y = self._offset_y
+        cs = self._cell_size
+        grid_rect = QRect(
+            offset_x, offset_y, self._grid_width * cs, self._grid_height * cs
+        )
 
-                painter.fillRect(x, y, self._cell_size, self._cell_size, color)
+        # Small cells mean a dense grid without labels: draw every cell as
+        # one scaled pixel instead of building a rect per filled cell
+        if cs < 20:
+            self._draw_cells_as_image(painter, grid_rect)
+        else:
+            self._draw_cells_as_rects(painter, grid_rect)
 
-                # Draw grid lines
-                pen = QPen(self.GRID_COLOR)
-                pen.setWidth(1)
-                painter.setPen(pen)
-                painter.drawRect(x, y, self._cell_size, self._cell_size)
+        # Draw grid lines
+        painter.setPen(self._grid_pen)
+        painter.drawLines(self._grid_lines)
 
         # Draw row/column labels if cells are large enough
         if self._cell_size >= 20:
-            font = painter.font()
-            font.setPointSize(max(7, min(10, self._cell_size // 3)))
-            painter.setFont(font)
-            painter.setPen(QColor(100, 100, 100))
+            painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+            painter.setFont(self._label_font)
+            painter.setPen(self._label_pen)
+            half = self._cell_size // 2
 
             # Column labels (top)
-            for col in range(self._grid_width):
-                x = offset_x + col * self._cell_size + self._cell_size // 2
-                y = offset_y - 8
-                label = str(col)
-                metrics = painter.fontMetrics()
-                text_width = metrics.horizontalAdvance(label)
-                painter.drawText(int(x - text_width // 2), int(y), label)
+            y = offset_y - 8
+            for col, (label, text_width) in enumerate(self._col_labels):
+                x = offset_x + col * self._cell_size + half
+                painter.drawText(x - text_width // 2, y, label)
 
             # Row labels (left)
-            for row in range(self._grid_height):
-                x = offset_x - 8
-                y = offset_y + row * self._cell_size + self._cell_size // 2
-                label = str(row)
-                metrics = painter.fontMetrics()
-                text_height = metrics.height()
-                painter.drawText(
-                    int(x - metrics.horizontalAdvance(label)),
-                    int(y + text_height // 3),
-                    label,
-                )
+            x = offset_x - 8
+            for row, (label, text_width) in enumerate(self._row_labels):
+                y = offset_y + row * self._cell_size + half
+                painter.drawText(x - text_width, y + self._label_text_offset, label)
+
+    def _draw_cells_as_rects(self, painter: QPainter, grid_rect: QRect) -> None:
+        """Draw the empty background and then each filled cell.
+
+        Args:
+            painter: Active painter on the target device
+            grid_rect: Pixel rectangle covered by the cells
+        """
+        offset_x = grid_rect.x()
+        offset_y = grid_rect.y()
+        cs = self._cell_size
+
+        # Empty background in one fill, then only the filled cells on top
+        painter.fillRect(grid_rect, self.EMPTY_COLOR)
+        # Jump straight between set bits of the mask; trimming keeps every
+        # filled cell inside the grid
+        filled_rects: list[QRect] = []
+        add_filled = filled_rects.append
+        mask = self._mask
+        index = mask.find(1)
+        while index != -1:
+            row, col = divmod(index, _MAX_DIM)
+            add_filled(QRect(offset_x + col * cs, offset_y + row * cs, cs, cs))
+            index = mask.find(1, index + 1)
+        # PySide6 has no fillRects, so draw them all with a brush-only drawRects
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._fill_brush)
+        painter.drawRects(filled_rects)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+
+    def _draw_cells_as_image(self, painter: QPainter, grid_rect: QRect) -> None:
+        """Draw all cells as one indexed image scaled up to the cell size.
+
+        The mask bytes (0 = empty, 1 = filled) are used directly as palette
+        indices, one pixel per cell.
+
+        Args:
+            painter: Active painter on the target device
+            grid_rect: Pixel rectangle covered by the cells
+        """
+        image = QImage(
+            bytes(self._mask),
+            self._grid_width,
+            self._grid_height,
+            _MAX_DIM,
+            QImage.Format.Format_Indexed8,
+        )
+        image.setColorTable([self.EMPTY_COLOR.rgb(), self.FILL_COLOR.rgb()])
+        # Integer upscaling without smoothing keeps cell edges exact
+        painter.drawImage(grid_rect, image)
+
+    def _cell_rect(self, row: int, col: int) -> QRect:
+        """Get the pixel rectangle of a cell, including its grid lines.
+
+        Args:
+            row: Cell row
+            col: Cell column
+
+        Returns:
+            QRect covering the cell and the pen strokes along its edges
+        """
+        self._ensure_geometry()
+        rect = QRect(
+            self._offset_x + col * self._cell_size,
+            self._offset_y + row * self._cell_size,
+            self._cell_size,
+            self._cell_size,
+        )
+        return rect.adjusted(-1, -1, 1, 1)
 
     def _get_cell_at_position(self, pos_x: int, pos_y: int) -> tuple[int, int] | None:
         """Get the cell coordinates at the given position.
@@ -246,26 +534,23 @@ class PieceGridWidget(QWidget):
         Returns:
             (row, col) tuple or None if position is outside the grid
         """
-        grid_width = self._grid_width * self._cell_size
-        grid_height = self._grid_height * self._cell_size
-        offset_x = (self.width() - grid_width) // 2
-        offset_y = (self.height() - grid_height) // 2
-
-        # Check if position is within grid bounds
-        if pos_x < offset_x or pos_x >= offset_x + grid_width:
-            return None
-        if pos_y < offset_y or pos_y >= offset_y + grid_height:
+        # Use the same (label-padded) offsets the grid is painted with
+        self._ensure_geometry()
+        dx = pos_x - self._offset_x
+        dy = pos_y - self._offset_y
+        if dx < 0 or dy < 0:
             return None
 
-        col = (pos_x - offset_x) // self._cell_size
-        row = (pos_y - offset_y) // self._cell_size
-
-        if 0 <= row < self._grid_height and 0 <= col < self._grid_width:
-            return (row, col)
-        return None
+        cs = self._cell_size
+        col = dx // cs
+        row = dy // cs
+        if row >= self._grid_height or col >= self._grid_width:
+            return None
+        return (row, col)
 
     def mousePressEvent(self, event) -> None:
         """Handle mouse press for toggling cells."""
+        self._last_cell = None
         if event.button() == Qt.MouseButton.LeftButton:
             self._is_filling = True
             self._toggle_cell_at_position(event.pos())
@@ -289,12 +574,20 @@ class PieceGridWidget(QWidget):
             pos: QPoint position
         """
         cell = self._get_cell_at_position(pos.x(), pos.y())
-        if cell is not None:
-            if self._is_filling:
-                self._filled_cells.add(cell)
-            else:
-                self._filled_cells.discard(cell)
-            self.update()
+        # Mouse moves within the cell just toggled need no further work
+        if cell is None or cell == self._last_cell:
+            return
+        self._last_cell = cell
+        row, col = cell
+        index = row * _MAX_DIM + col
+        mask = self._mask
+        filling = self._is_filling
+        # Dragging over a cell already in the target state is a no-op
+        if mask[index] == filling:
+            return
+        mask[index] = 1 if filling else 0
+        self._render_cell_to_pixmap(row, col)
+        self.update(self._cell_rect(row, col))
 
 
 class PieceListItemWidget(QWidget):
@@ -309,7 +602,12 @@ class PieceListItemWidget(QWidget):
     decrement_requested = Signal(PuzzlePiece)
 
     def __init__(
-        self, piece: PuzzlePiece, count: int, parent: QWidget | None = None
+        self,
+        piece: PuzzlePiece,
+        count: int,
+        parent: QWidget | None = None,
+        *,
+        cell_count: int | None = None,
     ) -> None:
         """Initialize the piece list item widget.
 
@@ -317,10 +615,14 @@ class PieceListItemWidget(QWidget):
             piece: The puzzle piece this item represents
             count: Current count of this piece type
             parent: Parent widget
+            cell_count: Number of cells in the piece, if already known
         """
         super().__init__(parent)
         self._piece = piece
         self._count = count
+        self._cell_count = (
+            len(piece.canonical_shape) if cell_count is None else cell_count
+        )
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -361,7 +663,7 @@ class PieceListItemWidget(QWidget):
 
     def _get_label_text(self) -> str:
         """Generate label like '(3×4) (7 cells)'."""
-        return f"({self._piece.width}×{self._piece.height}) ({len(self._piece.canonical_shape)} cells)"
+        return f"({self._piece.width}×{self._piece.height}) ({self._cell_count} cells)"
 
     def _get_count_text(self) -> str:
         """Generate count text like 'x3'."""
@@ -384,6 +686,23 @@ class PieceListItemWidget(QWidget):
         self._count = count
         self._count_label.setText(self._get_count_text())
 
+    def set_piece(
+        self, piece: PuzzlePiece, count: int, cell_count: int | None = None
+    ) -> None:
+        """Rebind the widget to another piece, reusing its child widgets.
+
+        Args:
+            piece: The puzzle piece this item now represents
+            count: Current count of this piece type
+            cell_count: Number of cells in the piece, if already known
+        """
+        self._piece = piece
+        self._cell_count = (
+            len(piece.canonical_shape) if cell_count is None else cell_count
+        )
+        self._label.setText(self._get_label_text())
+        self.update_count(count)
+
 
 class PieceTab(QWidget):
     """Tab widget for piece creation and editing.
@@ -425,6 +744,16 @@ class PieceTab(QWidget):
         super().__init__(parent)
 
         self._pieces: dict[PuzzlePiece, int] = {}
+        # Pieces in list order (by cell count, then insertion), kept in step
+        # with _pieces so the list order is never re-sorted
+        self._sorted_pieces: list[PuzzlePiece] = []
+        self._piece_lengths: list[int] = []
+        # Row of each piece in _sorted_pieces, rebuilt whenever it changes
+        self._piece_row: dict[PuzzlePiece, int] = {}
+        # List row widgets by piece, for in-place count updates
+        self._item_widgets: dict[PuzzlePiece, PieceListItemWidget] = {}
+        # Row widgets in list order, reused across list refreshes
+        self._item_pool: list[PieceListItemWidget] = []
         self._selected_piece: PuzzlePiece | None = None
         self._piece_counter = 0  # Only for generating unique labels
 
@@ -435,6 +764,12 @@ class PieceTab(QWidget):
 
         self._init_ui()
 
+        # Coalesce bursts of spinner ticks into a single grid relayout
+        self._grid_size_debounce = QTimer(self)
+        self._grid_size_debounce.setSingleShot(True)
+        self._grid_size_debounce.setInterval(20)
+        self._grid_size_debounce.timeout.connect(self._apply_grid_size)
+
     def _init_ui(self) -> None:
         """Initialize the user interface."""
         # Main layout with pieces list on left and editor on right
@@ -548,16 +883,12 @@ class PieceTab(QWidget):
         selected_items = self._piece_list.selectedItems()
         if selected_items:
             index = self._piece_list.row(selected_items[0])
-            # Sort pieces the same way as _refresh_piece_list
-            sorted_pieces = sorted(
-                self._pieces.keys(),
-                key=lambda p: len(p.canonical_shape),
-            )
+            sorted_pieces = self._sorted_pieces
             if 0 <= index < len(sorted_pieces):
                 self._selected_piece = sorted_pieces[index]
                 # Load the piece shape into the grid
                 shape = self._selected_piece.canonical_shape
-                self._grid_widget.filled_cells = set(shape)
+                self._grid_widget.filled_cells = shape
                 self._update_shape_info()
         else:
             self._selected_piece = None
@@ -594,11 +925,12 @@ class PieceTab(QWidget):
         else:
             # Add new piece with count 1
             self._pieces[new_piece] = 1
+            self._insert_sorted_piece(new_piece)
 
         # Refresh list with custom widgets
         self._refresh_piece_list()
         self._select_piece_in_list(new_piece)
-        self._piece_count_label.setText(f"Pieces: {len(self._get_all_pieces())}")
+        self._piece_count_label.setText(f"Pieces: {self._total_piece_count()}")
         self.piece_added.emit(new_piece)
         if self._piece_added_callback:
             self._piece_added_callback(new_piece)
@@ -631,56 +963,7 @@ class PieceTab(QWidget):
         Returns:
             A string describing the shape type
         """
-        shape = piece.canonical_shape
-        area = len(shape)
-
-        # Get bounding box dimensions
-        min_row = min(r for r, c in shape)
-        max_row = max(r for r, c in shape)
-        min_col = min(c for r, c in shape)
-        max_col = max(c for r, c in shape)
-        width = max_col - min_col + 1
-        height = max_row - min_row + 1
-
-        # Special shape patterns
-        if area == 1:
-            return "Mono"
-        elif area == 2:
-            return "Domino"
-        elif area == 3:
-            # L-shape or straight
-            if width == 1 or height == 1:
-                return "Triomino (straight)"
-            else:
-                return "Triomino (L)"
-        elif area == 4:
-            # Check for common tetromino types
-            # Straight (I)
-            if width == 4 or height == 4:
-                return "Tetromino (I)"
-            # Square (O)
-            elif width == 2 and height == 2:
-                return "Tetromino (O)"
-            # L-shape
-            elif (width == 3 and height == 2) or (width == 2 and height == 3):
-                return "Tetromino (L)"
-            # T-shape
-            elif width == 3 and height == 2:
-                # Check if it's a T
-                return "Tetromino (T)"
-            # S or Z shape
-            elif width == 3 and height == 2:
-                return "Tetromino (S)"
-            else:
-                return "Tetromino"
-        else:
-            # For larger pieces, use dimensions
-            if width == 1 or height == 1:
-                return f"Bar ({area})"
-            elif width == height:
-                return f"Square ({area})"
-            else:
-                return f"Polyomino ({width}×{height})"
+        return _shape_type(piece.canonical_shape)
 
     def _get_piece_index(self, piece: PuzzlePiece) -> int:
         """Get the index of a piece in the internal list.
@@ -691,14 +974,45 @@ class PieceTab(QWidget):
         Returns:
             The index in the sorted pieces list, or -1 if not found
         """
-        sorted_pieces = sorted(
-            self._pieces.keys(),
-            key=lambda p: len(p.canonical_shape),
+        return self._piece_row.get(piece, -1)
+
+    def _insert_sorted_piece(self, piece: PuzzlePiece) -> None:
+        """Insert a newly added piece into the sorted piece list.
+
+        Args:
+            piece: The piece just added to _pieces
+        """
+        length = len(piece.canonical_shape)
+        index = bisect_right(self._piece_lengths, length)
+        self._piece_lengths.insert(index, length)
+        self._sorted_pieces.insert(index, piece)
+        self._index_piece_rows()
+
+    def _remove_sorted_piece(self, piece: PuzzlePiece) -> None:
+        """Remove a piece deleted from _pieces from the sorted piece list.
+
+        Args:
+            piece: The piece just removed from _pieces
+        """
+        index = self._piece_row[piece]
+        del self._sorted_pieces[index]
+        del self._piece_lengths[index]
+        self._index_piece_rows()
+
+    def _rebuild_sorted_pieces(self) -> None:
+        """Rebuild the sorted piece list from _pieces."""
+        # Compute each cell count once and sort on it (stable, so ties keep
+        # insertion order)
+        keyed = sorted(
+            ((len(p.canonical_shape), p) for p in self._pieces), key=itemgetter(0)
         )
-        try:
-            return sorted_pieces.index(piece)
-        except ValueError:
-            return -1
+        self._piece_lengths = [length for length, _ in keyed]
+        self._sorted_pieces = [piece for _, piece in keyed]
+        self._index_piece_rows()
+
+    def _index_piece_rows(self) -> None:
+        """Rebuild the piece-to-row lookup from the sorted piece list."""
+        self._piece_row = {piece: row for row, piece in enumerate(self._sorted_pieces)}
 
     def _get_all_pieces(self) -> list[PuzzlePiece]:
         """Get a flat list of all pieces with counts expanded.
@@ -706,43 +1020,71 @@ class PieceTab(QWidget):
         Returns:
             List of pieces with each piece repeated according to its count
         """
-        all_pieces = []
-        for piece, count in self._pieces.items():
-            all_pieces.extend([piece] * count)
-        return all_pieces
+        # repeat() yields each piece count times without building a list
+        return list(chain.from_iterable(starmap(repeat, self._pieces.items())))
+
+    def _total_piece_count(self) -> int:
+        """Get the number of pieces with counts expanded.
+
+        Returns:
+            Sum of all piece counts
+        """
+        return sum(self._pieces.values())
 
     def _refresh_piece_list(self) -> None:
         """Refresh all list items with custom widgets showing counts.
 
         Pieces are automatically sorted by number of cells (ascending).
         """
-        self._piece_list.clear()
-
-        # Sort pieces by number of cells (ascending order)
-        sorted_pieces = sorted(
-            self._pieces.items(),
-            key=lambda item: len(item[0].canonical_shape),
-        )
+        piece_list = self._piece_list
+        pool = self._item_pool
+        # Rows added without a pooled widget (see add_piece) cannot be reused
+        if piece_list.count() != len(pool):
+            piece_list.clear()
+            pool.clear()
+        else:
+            # Clearing used to drop the selection; keep that behaviour
+            piece_list.clearSelection()
+        self._item_widgets.clear()
+
+        pieces = self._pieces
+        for row, (piece, cell_count) in enumerate(
+            zip(self._sorted_pieces, self._piece_lengths)
+        ):
+            count = pieces[piece]
+            if row < len(pool):
+                # Rebind an existing row; its signals are already connected
+                item = piece_list.item(row)
+                item.setData(Qt.ItemDataRole.UserRole, piece)
+                widget = pool[row]
+                widget.set_piece(piece, count, cell_count)
+            else:
+                item = QListWidgetItem()
+                item.setData(Qt.ItemDataRole.UserRole, piece)
 
-        for piece, count in sorted_pieces:
-            item = QListWidgetItem()
-            item.setData(Qt.ItemDataRole.UserRole, piece)
+                widget = PieceListItemWidget(piece, count, cell_count=cell_count)
+                widget.increment_requested.connect(self._on_piece_increment)
+                widget.decrement_requested.connect(self._on_piece_decrement)
+                pool.append(widget)
 
-            widget = PieceListItemWidget(piece, count)
-            widget.increment_requested.connect(self._on_piece_increment)
-            widget.decrement_requested.connect(self._on_piece_decrement)
+                piece_list.addItem(item)
+                piece_list.setItemWidget(item, widget)
+            self._item_widgets[piece] = widget
 
-            self._piece_list.addItem(item)
-            self._piece_list.setItemWidget(item, widget)
+        # Drop rows left over from a longer list
+        for row in range(piece_list.count() - 1, len(self._sorted_pieces) - 1, -1):
+            piece_list.takeItem(row)
+        del pool[len(self._sorted_pieces) :]
 
     def _on_piece_increment(self, piece: PuzzlePiece) -> None:
         """Handle increment button click for a piece."""
         if piece in self._pieces:
             self._pieces[piece] += 1
-            self._refresh_piece_list()
+            # Only the count changed; list order is unaffected
+            self._item_widgets[piece].update_count(self._pieces[piece])
             # Re-select the piece
             self._select_piece_in_list(piece)
-            self._piece_count_label.setText(f"Pieces: {len(self._get_all_pieces())}")
+            self._piece_count_label.setText(f"Pieces: {self._total_piece_count()}")
 
     def _on_piece_decrement(self, piece: PuzzlePiece) -> None:
         """Handle decrement button click for a piece."""
@@ -751,29 +1093,24 @@ class PieceTab(QWidget):
 
         if self._pieces[piece] > 1:
             self._pieces[piece] -= 1
-            self._refresh_piece_list()
+            self._item_widgets[piece].update_count(self._pieces[piece])
             # Re-select the piece
             self._select_piece_in_list(piece)
         else:
             # Remove entirely when count reaches 0
             del self._pieces[piece]
+            self._remove_sorted_piece(piece)
             self._selected_piece = None
             self._grid_widget.clear()
             self._refresh_piece_list()
 
-        self._piece_count_label.setText(f"Pieces: {len(self._get_all_pieces())}")
+        self._piece_count_label.setText(f"Pieces: {self._total_piece_count()}")
 
     def _select_piece_in_list(self, piece: PuzzlePiece) -> None:
         """Select a piece in the list widget."""
-        sorted_pieces = sorted(
-            self._pieces.keys(),
-            key=lambda p: len(p.canonical_shape),
-        )
-        try:
-            index = sorted_pieces.index(piece)
+        index = self._get_piece_index(piece)
+        if index >= 0:
             self._piece_list.setCurrentRow(index)
-        except ValueError:
-            pass
 
     def _on_delete_piece(self) -> None:
         """Handle deleting the selected piece."""
@@ -789,6 +1126,7 @@ class PieceTab(QWidget):
             else:
                 # Remove entirely
                 del self._pieces[piece_to_delete]
+                self._remove_sorted_piece(piece_to_delete)
 
         # Clear selection and grid
         self._selected_piece = None
@@ -796,7 +1134,7 @@ class PieceTab(QWidget):
 
         # Refresh list and update count
         self._refresh_piece_list()
-        self._piece_count_label.setText(f"Pieces: {len(self._get_all_pieces())}")
+        self._piece_count_label.setText(f"Pieces: {self._total_piece_count()}")
 
         self.piece_deleted.emit(piece_to_delete)
         if self._piece_deleted_callback:
@@ -815,16 +1153,39 @@ class PieceTab(QWidget):
             # Create new piece with empty shape (will be validated elsewhere)
             new_piece = PuzzlePiece(shape={(0, 0)})
             # Replace in dict - remove old, add new
-            del self._pieces[self._selected_piece]
-            self._pieces[new_piece] = count
+            self._replace_piece(self._selected_piece, new_piece, count)
             self._selected_piece = new_piece
             self._refresh_piece_list()
             self.piece_modified.emit(new_piece)
             if self._piece_modified_callback:
                 self._piece_modified_callback(new_piece)
 
+    def _replace_piece(
+        self, old_piece: PuzzlePiece, new_piece: PuzzlePiece, count: int
+    ) -> None:
+        """Replace a piece with another, keeping the sorted list in step.
+
+        Args:
+            old_piece: Piece to remove
+            new_piece: Piece to store in its place
+            count: Count to store for new_piece
+        """
+        del self._pieces[old_piece]
+        self._remove_sorted_piece(old_piece)
+        if new_piece not in self._pieces:
+            self._insert_sorted_piece(new_piece)
+        self._pieces[new_piece] = count
+
     def _on_grid_size_changed(self) -> None:
-        """Handle grid size changes."""
+        """Handle grid size spinner changes.
+
+        Restarting the single-shot timer cancels any pending apply, so only
+        the last value of a burst reaches the grid.
+        """
+        self._grid_size_debounce.start()
+
+    def _apply_grid_size(self) -> None:
+        """Apply the current spinner dimensions to the grid."""
         width = self._width_spinner.value()
         height = self._height_spinner.value()
         self._grid_widget.set_dimensions(width, height)
@@ -850,18 +1211,21 @@ class PieceTab(QWidget):
         Returns:
             Set of (row, col) coordinates representing the current shape
         """
-        return self._grid_widget.filled_cells
+        return set(self._grid_widget.filled_cells)
 
     def save_current_shape_to_piece(self) -> None:
         """Save the current grid shape to the selected piece."""
         if self._selected_piece is not None:
             shape = self._grid_widget.filled_cells
+            # An unedited grid still holds the canonical shape loaded on
+            # selection; saving it would only rebuild an equal piece
+            if shape == self._selected_piece.canonical_shape:
+                return
             # Get current count
             count = self._pieces.get(self._selected_piece, 1)
             new_piece = PuzzlePiece(shape=shape)
             # Replace in dict
-            del self._pieces[self._selected_piece]
-            self._pieces[new_piece] = count
+            self._replace_piece(self._selected_piece, new_piece, count)
             self._selected_piece = new_piece
             self._refresh_piece_list()
             self.piece_modified.emit(new_piece)
@@ -879,18 +1243,42 @@ class PieceTab(QWidget):
             self._pieces[piece] += 1
         else:
             self._pieces[piece] = 1
+            self._insert_sorted_piece(piece)
 
         # Add to list with shape info
         piece_label = self._get_piece_label(piece)
         item = QListWidgetItem(piece_label)
         item.setData(Qt.ItemDataRole.UserRole, piece)
         self._piece_list.addItem(item)
-        self._piece_count_label.setText(f"Pieces: {len(self._get_all_pieces())}")
+        self._piece_count_label.setText(f"Pieces: {self._total_piece_count()}")
+
+    def set_pieces(self, pieces: Mapping[PuzzlePiece, int]) -> None:
+        """Replace all pieces and their counts.
+
+        The list is rebuilt once, which is much cheaper than clearing and
+        adding the pieces one by one.
+
+        Args:
+            pieces: Mapping of piece to count
+        """
+        self._pieces.clear()
+        self._pieces.update(pieces)
+        self._rebuild_sorted_pieces()
+        self._selected_piece = None
+        self._grid_widget.clear()
+        self._refresh_piece_list()
+        self._piece_count_label.setText(f"Pieces: {self._total_piece_count()}")
+        self._update_shape_info()
 
     def clear_all(self) -> None:
         """Clear all pieces and reset the UI."""
         self._pieces.clear()
+        self._sorted_pieces.clear()
+        self._piece_lengths.clear()
+        self._piece_row.clear()
         self._selected_piece = None
+        self._item_widgets.clear()
+        self._item_pool.clear()
         self._piece_list.clear()
         self._grid_widget.clear()
         self._piece_count_label.setText("Pieces: 0")
@@ -20,6 +20,9 @@ from src.gui.board_widget import BoardWidget
 class VisualizationWindow(QMainWindow):
     """Dedicated window for solver visualization with QTimer pacing."""
 
+    # Shortest timer interval; roughly one frame at 60 Hz
+    MIN_TICK_MS = 16
+
     def __init__(
         self,
         puzzle_config: "PuzzleConfiguration",
@@ -34,8 +37,13 @@ class VisualizationWindow(QMainWindow):
         super().__init__(parent)
         self._config = puzzle_config
         self._generator: Optional[Generator[dict[str, Any], None, None]] = None
+        # Single-shot, re-armed by _advance once a step is done, so pacing is
+        # measured from the end of each step and ticks never queue up
         self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
         self._delay_ms = 100
+        # Solver steps per yielded event; above 1 once ticks outpace repaints
+        self._yield_every = 1
         self._is_playing = False  # Track playing state explicitly
 
         self._setup_ui()
@@ -59,6 +67,9 @@ class VisualizationWindow(QMainWindow):
 
         # Create board widget
         board = self._config.get_board()
+        # Kept for resizeEvent, which fires continuously during a drag
+        self._board_w = board.width
+        self._board_h = board.height
         self._board_widget = BoardWidget(
             width=board.width,
             height=board.height,
@@ -126,16 +137,38 @@ class VisualizationWindow(QMainWindow):
         from src.logic.solver import solve_backtracking
 
         board = self._config.get_board()
-        self._generator = solve_backtracking(self._config.pieces, board)
+        self._generator = solve_backtracking(
+            self._config.pieces, board, yield_every=self._yield_every
+        )
+
+    def _apply_timer_interval(self) -> None:
+        """Set the timer interval and precision for the current delay.
+
+        Delays below MIN_TICK_MS are not worth a timer tick each; _advance
+        drains several events per tick instead.
+        """
+        interval = max(self.MIN_TICK_MS, self._delay_ms)
+        self._timer.setTimerType(
+            Qt.TimerType.PreciseTimer if interval < 50 else Qt.TimerType.CoarseTimer
+        )
+        self._timer.setInterval(interval)
 
     @Slot()
     def _advance(self) -> None:
-        """Called by timer to advance generator one step."""
+        """Called by timer to advance the generator.
+
+        At fast speeds several events are drained per tick and only the last
+        one is drawn, so the solver is not throttled by timer resolution.
+        """
         generator = self._generator
         if generator is None:
             return
+        batch = max(1, 50 // self._delay_ms)
         try:
-            event = next(generator)
+            for _ in range(batch):
+                event = next(generator)
+                if event["type"] in ("solved", "no_solution"):
+                    break
             self._board_widget.handle_event(event)
             event_type = event["type"]
             if event_type == "solved":
@@ -153,9 +186,14 @@ class VisualizationWindow(QMainWindow):
                     "place": "Piece placed",
                     "remove": "Backtracking...",
                 }.get(event_type, "Unknown")
+                if event.get("removed") is not None:
+                    status = "Backtracked, piece placed"
                 self._status_label.setText(f"Step {step}: {status}")
         except StopIteration:
             self._on_stop_clicked()
+            return
+        if self._is_playing:
+            self._timer.start()
 
     @Slot()
     def _on_play_pause_clicked(self) -> None:
@@ -172,8 +210,7 @@ class VisualizationWindow(QMainWindow):
                 self._create_solver()
             self._is_playing = True
             self._play_pause_btn.setText("Pause")
-            self._timer.setInterval(self._speed_slider.value())
-            self._timer.start()
+            self._apply_timer_interval()
             if self._generator is not None:
                 self._advance()
             self._status_label.setText("Solving...")
@@ -202,14 +239,17 @@ class VisualizationWindow(QMainWindow):
 
     @Slot(int)
     def _on_speed_changed(self, value: int) -> None:
-        """Handle speed slider change."""
+        """Handle speed slider change.
+
+        Delays under 100 ms also make the next solver skip intermediate
+        steps, since the board cannot visibly repaint that often.
+        """
         self._delay_ms = max(10, min(1000, value))
-        self._timer.setInterval(self._delay_ms)
+        self._yield_every = max(1, 100 // self._delay_ms)
+        self._apply_timer_interval()
 
     def resizeEvent(self, event: QResizeEvent) -> None:
         """Handle window resize to adapt board cell size."""
-        board = self._config.get_board()
-
         # Account for margins (10px each side) and control panel (~60px) and status label (~25px)
         margin = 20
         controls_height = 85  # ~60 for controls, ~25 for status label
@@ -217,8 +257,8 @@ class VisualizationWindow(QMainWindow):
         available_height = event.size().height() - margin - controls_height
 
         # Calculate max cell size that fits
-        max_cell_width = available_width // board.width
-        max_cell_height = available_height // board.height
+        max_cell_width = available_width // self._board_w
+        max_cell_height = available_height // self._board_h
         cell_size = min(max_cell_width, max_cell_height)
 
         # Ensure minimum size
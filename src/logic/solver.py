@@ -7,16 +7,127 @@ clean separation from GUI code.
 
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import Generator, Mapping
+from math import gcd
 from typing import Any
 
 from src.models.board import GameBoard
 from src.models.piece import PuzzlePiece
 
+# One placement: (cell bitmask, orientation, origin)
+Placement = tuple[int, frozenset[tuple[int, int]], tuple[int, int]]
+# A placement covering a given cell: (piece index, piece, *placement)
+Covering = tuple[int, PuzzlePiece, int, frozenset[tuple[int, int]], tuple[int, int]]
+
+# Upper bound on remembered dead-end states, to bound memory on large boards
+_MAX_FAILED_STATES = 1 << 20
+
+
+def _anchored_placements(piece: PuzzlePiece, board: GameBoard) -> list[list[Placement]]:
+    """Precompute every in-bounds, unblocked placement of a piece by anchor cell.
+
+    A placement is anchored at the cell its orientation's top-left cell covers,
+    so each distinct placement appears exactly once in the table.
+
+    Args:
+        piece: The piece whose orientations to place
+        board: The board providing dimensions and blocked cells
+
+    Returns:
+        List indexed by ``row * width + col`` of the placements anchored at
+        that cell, in ``piece.orientations`` order
+    """
+    width = board.width
+    height = board.height
+    blocked = board.blocked_mask
+    table: list[list[Placement]] = [[] for _ in range(width * height)]
+    for orientation in piece.orientations:
+        # Top-left cell, extents and the mask of the orientation with its
+        # origin at (0, 0), all in one pass; shifting the mask by
+        # row * width + col moves it to origin (row, col)
+        top_row, top_col = min(orientation)
+        max_row = top_row
+        min_col = max_col = top_col
+        base = 0
+        for r, c in orientation:
+            if r > max_row:
+                max_row = r
+            if c < min_col:
+                min_col = c
+            elif c > max_col:
+                max_col = c
+            base |= 1 << (r * width + c)
+        for row in range(height):
+            origin_row = row - top_row
+            if origin_row < 0 or origin_row + max_row >= height:
+                continue
+            for col in range(width):
+                origin_col = col - top_col
+                if origin_col + min_col < 0 or origin_col + max_col >= width:
+                    continue
+                mask = base << (origin_row * width + origin_col)
+                if mask & blocked:
+                    continue
+                table[row * width + col].append(
+                    (mask, orientation, (origin_row, origin_col))
+                )
+    return table
+
+
+def _has_dead_region(
+    free: int,
+    seeds: int,
+    min_area: int,
+    area_gcd: int,
+    width: int,
+    shift_left_ok: int,
+    shift_right_ok: int,
+) -> bool:
+    """Check whether any empty region touching ``seeds`` cannot be tiled.
+
+    Pieces never span two disconnected empty regions, so every region must
+    be at least the smallest remaining piece area and a multiple of the
+    GCD of the remaining areas.
+
+    Args:
+        free: Bitmask of empty cells
+        seeds: Bitmask of empty cells whose regions to check
+        min_area: Smallest area among the remaining pieces
+        area_gcd: GCD of the areas of the remaining pieces
+        width: Board width, the bit distance between vertical neighbors
+        shift_left_ok: Cells that have a neighbor to their right (not in the
+            last column), so they may be shifted left by one bit
+        shift_right_ok: Cells that have a neighbor to their left (not in the
+            first column), so they may be shifted right by one bit
+
+    Returns:
+        True if some region is too small or not a multiple of ``area_gcd``
+    """
+    while seeds:
+        region = seeds & -seeds
+        # Grow the region by one step in each direction until it stops
+        while True:
+            grown = (
+                region
+                | ((region & shift_left_ok) << 1)
+                | ((region & shift_right_ok) >> 1)
+                | (region << width)
+                | (region >> width)
+            ) & free
+            if grown == region:
+                break
+            region = grown
+        size = region.bit_count()
+        if size < min_area or size % area_gcd:
+            return True
+        seeds &= ~region
+    return False
+
 
 def solve_backtracking(
-    pieces: dict[PuzzlePiece, int],
+    pieces: Mapping[PuzzlePiece, int],
     board: GameBoard,
+    yield_every: int = 1,
 ) -> Generator[dict[str, Any], None, None]:
     """Generator function that solves polyomino puzzles using backtracking.
 
@@ -25,13 +136,20 @@ def solve_backtracking(
     thread synchronization complexity.
 
     Args:
-        pieces: Dictionary mapping unique puzzle pieces to their counts
-                (e.g., {L_tromino: 3, I_tromino: 2})
+        pieces: Mapping of unique puzzle pieces to their counts
+                (e.g., {L_tromino: 3, I_tromino: 2}); not modified
         board: The game board to solve
+        yield_every: Yield only every Nth 'place'/'remove' step; 'solved' and
+                     'no_solution' are always yielded. Values above 1 skip
+                     intermediate states when they cannot all be displayed.
 
     Yields:
         Dictionary containing:
         - type: 'place' | 'remove' | 'solved' | 'no_solution'
+        - removed: On 'place' only, the (shape, position) taken off the board
+          just before this placement, or None. Backtracking followed by
+          another attempt at the same cell is reported as one 'place' event
+          instead of a 'remove' and a 'place'.
         - board_snapshot: Direct reference to current board state (READ-ONLY)
         - placed_pieces: Direct reference to list of (shape, position) tuples (READ-ONLY)
         - remaining_pieces: Direct reference to dict of piece -> count (READ-ONLY)
@@ -42,15 +160,59 @@ def solve_backtracking(
         Consumers MUST treat them as read-only and must not modify them.
         The generator yields control to the caller, and expects to resume
         with unchanged state when next() is called.
+        Each event dict itself is new, so its 'type' and 'step_count' stay
+        valid after later next() calls; the referenced board, placed list
+        and remaining dict keep changing. Use yield_every rather than event
+        reuse to cut per-step allocation.
+
+    Raises:
+        ValueError: If yield_every is less than 1
     """
+    if yield_every < 1:
+        raise ValueError("yield_every must be at least 1")
+
     # Single mutable state
     step_count = 0
-    remaining: dict[PuzzlePiece, int] = pieces.copy()
+    remaining: dict[PuzzlePiece, int] = dict(pieces)
     placed: list[tuple[frozenset[tuple[int, int]], tuple[int, int], PuzzlePiece]] = []
 
     # Get all unique piece types sorted by area (largest first)
     piece_types = sorted(remaining.keys(), key=lambda p: p.area, reverse=True)
 
+    # Placements depend only on (piece, orientation, anchor cell), so
+    # compute them once instead of on every visit to a cell, then list for
+    # each cell every placement that covers it
+    covering: list[list[Covering]] = [[] for _ in range(board.total_area)]
+    for piece_idx, piece in enumerate(piece_types):
+        for anchored in _anchored_placements(piece, board):
+            for mask, orientation, origin in anchored:
+                option = (piece_idx, piece, mask, orientation, origin)
+                cells = mask
+                while cells:
+                    bit = cells & -cells
+                    covering[bit.bit_length() - 1].append(option)
+                    cells ^= bit
+    # Per-piece counts and areas indexed like piece_types; the search reads
+    # these instead of hashing PuzzlePiece keys, and `remaining` is only
+    # updated alongside them for the yielded events
+    counts = [remaining[piece] for piece in piece_types]
+    piece_areas = [piece.area for piece in piece_types]
+    # Cells pieces must cover: everything not blocked
+    full_mask = ((1 << board.total_area) - 1) & ~board.blocked_mask
+    # Column masks so horizontal neighbor shifts do not wrap across rows
+    width = board.width
+    first_col = 0
+    for row in range(board.height):
+        first_col |= 1 << (row * width)
+    last_col = first_col << (width - 1)
+    shift_left_ok = full_mask & ~last_col
+    shift_right_ok = full_mask & ~first_col
+    # (occupied mask, counts) states already searched without a solution;
+    # different placement orders often reach the same state
+    failed_states: set[tuple[int, tuple[int, ...]]] = set()
+    place_shape = board.place_shape
+    remove_shape = board.remove_shape
+
     # Check if already solved (no pieces to place)
     if not remaining:
         yield {
@@ -62,24 +224,25 @@ def solve_backtracking(
         }
         return
 
-    def find_next_empty() -> tuple[int, int] | None:
-        """Find first empty cell in L→R, T→B order."""
-        for row in range(board.height):
-            for col in range(board.width):
-                if board.get_piece_at((row, col)) is None:
-                    return (row, col)
-        return None
-
-    def backtrack() -> Generator[dict[str, Any], None, bool]:
+    def backtrack(
+        occupied: int, last_mask: int
+    ) -> Generator[dict[str, Any], None, bool]:
         """Recursive backtracking generator.
 
+        Placements are pre-filtered against bounds and blocked cells, so the
+        fit test is a single AND against ``occupied``, the bitmask of cells
+        covered so far, which is passed down rather than read off the board.
+
+        The cell to fill next is the most constrained one among the first
+        empty cell and the empty cells around ``last_mask``, the previous
+        placement: the cells whose candidate counts just changed.
+
         Yields state dictionaries and returns True if solution found.
         """
         nonlocal step_count
 
-        # Find next empty cell
-        cell = find_next_empty()
-        if cell is None:
+        free = full_mask & ~occupied
+        if not free:
             # Board is full - check if solved
             if not remaining:
                 step_count += 1
@@ -94,55 +257,115 @@ def solve_backtracking(
             # No empty cells but pieces remain
             return False
 
-        # Try each piece type
-        for piece in piece_types:
-            count = remaining.get(piece, 0)
-            if count <= 0:
+        # Bounds every empty region must satisfy; computed over the pieces
+        # remaining before this placement, which only loosens them
+        state = (occupied, tuple(counts))
+        if state in failed_states:
+            return False
+
+        areas = [area for area, count in zip(piece_areas, counts) if count > 0]
+        if not areas:
+            return False
+        min_area = min(areas)
+        area_gcd = gcd(*areas)
+
+        # Pick the candidate cell with the fewest fitting placements
+        candidates = (
+            ((last_mask & shift_left_ok) << 1)
+            | ((last_mask & shift_right_ok) >> 1)
+            | (last_mask << width)
+            | (last_mask >> width)
+            | (free & -free)
+        ) & free
+        best: list[Covering] | None = None
+        while candidates:
+            bit = candidates & -candidates
+            candidates ^= bit
+            fits = [
+                option
+                for option in covering[bit.bit_length() - 1]
+                if counts[option[0]] and not occupied & option[2]
+            ]
+            if best is None or len(fits) < len(best):
+                best = fits
+                if len(fits) <= 1:
+                    break
+        if not best:
+            # Some empty cell cannot be covered by any remaining piece
+            return False
+
+        # Removal not yet reported, merged into the next 'place' event
+        pending_remove: tuple[frozenset[tuple[int, int]], tuple[int, int]] | None
+        pending_remove = None
+        for piece_idx, piece, mask, orientation, origin in best:
+            count = counts[piece_idx]
+            # Prune placements that leave an untileable empty pocket:
+            # only regions next to the new piece can have changed shape
+            next_free = free & ~mask
+            neighbors = (
+                ((mask & shift_left_ok) << 1)
+                | ((mask & shift_right_ok) >> 1)
+                | (mask << width)
+                | (mask >> width)
+            ) & next_free
+            if _has_dead_region(
+                next_free,
+                neighbors,
+                min_area,
+                area_gcd,
+                width,
+                shift_left_ok,
+                shift_right_ok,
+            ):
                 continue
+            place_shape(orientation, origin, mask)
+            placed.append((orientation, origin, piece))
+            counts[piece_idx] = count - 1
+            if count == 1:
+                del remaining[piece]
+            else:
+                remaining[piece] = count - 1
+
+            step_count += 1
+            if pending_remove is not None or step_count % yield_every == 0:
+                yield {
+                    "type": "place",
+                    "board_snapshot": board,
+                    "placed_pieces": placed,
+                    "remaining_pieces": remaining,
+                    "step_count": step_count,
+                    "removed": pending_remove,
+                }
+                pending_remove = None
+
+            # Recurse
+            if (yield from backtrack(occupied | mask, mask)):
+                return True
 
-            # Try each orientation
-            for orientation in piece.orientations:
-                top_left_cell = min(orientation, key=lambda c: (c[0], c[1]))
-                origin = (cell[0] - top_left_cell[0], cell[1] - top_left_cell[1])
-
-                if board.can_place_shape(orientation, origin):
-                    board.place_shape(orientation, origin)
-                    placed.append((orientation, origin, piece))
-                    remaining[piece] = count - 1
-                    if remaining[piece] == 0:
-                        del remaining[piece]
-
-                    step_count += 1
-                    yield {
-                        "type": "place",
-                        "board_snapshot": board,
-                        "placed_pieces": placed,
-                        "remaining_pieces": remaining,
-                        "step_count": step_count,
-                    }
-
-                    # Recurse
-                    if (yield from backtrack()):
-                        return True
-
-                    # Backtrack
-                    shape, pos, p = placed.pop()
-                    board.remove_shape(shape, pos)
-                    remaining[p] = remaining.get(p, 0) + 1
-                    step_count += 1
-                    yield {
-                        "type": "remove",
-                        "board_snapshot": board,
-                        "placed_pieces": placed,
-                        "remaining_pieces": remaining,
-                        "step_count": step_count,
-                    }
+            # Backtrack
+            placed.pop()
+            remove_shape(orientation, origin, mask)
+            counts[piece_idx] = count
+            remaining[piece] = count
+            step_count += 1
+            if step_count % yield_every == 0:
+                pending_remove = (orientation, origin)
 
         # No piece fits at this cell
+        if pending_remove is not None:
+            yield {
+                "type": "remove",
+                "board_snapshot": board,
+                "placed_pieces": placed,
+                "remaining_pieces": remaining,
+                "step_count": step_count,
+            }
+        if len(failed_states) < _MAX_FAILED_STATES:
+            failed_states.add(state)
         return False
 
     # Start backtracking
-    if not (yield from backtrack()):
+    if not (yield from backtrack(board.occupied_mask, 0)):
         # No solution found
         yield {
             "type": "no_solution",
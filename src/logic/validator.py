@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import List, Set, Tuple
+from typing import AbstractSet, List, Set, Tuple
 
 
 class ValidationError:
@@ -49,11 +49,11 @@ class ValidationError:
         )
 
 
-def validate_piece_shape(shape: Set[Tuple[int, int]]) -> List[ValidationError]:
+def validate_piece_shape(shape: AbstractSet[Tuple[int, int]]) -> List[ValidationError]:
     """Validate that a shape is a valid polyomino.
 
     Args:
-        shape: Set of (row, col) coordinates
+        shape: Set or frozenset of (row, col) coordinates; not modified
 
     Returns:
         List of validation errors (empty if valid)
@@ -220,7 +220,7 @@ def validate_puzzle_config(
             )
             continue
 
-        shape_errors = validate_piece_shape(set(piece.canonical_shape))
+        shape_errors = validate_piece_shape(piece.canonical_shape)
         errors.extend(shape_errors)
         total_piece_area += len(piece.canonical_shape)
 
@@ -242,11 +242,11 @@ def validate_puzzle_config(
     return errors
 
 
-def is_contiguous(shape: Set[Tuple[int, int]]) -> bool:
+def is_contiguous(shape: AbstractSet[Tuple[int, int]]) -> bool:
     """Check if all cells in shape are 4-directionally connected.
 
     Args:
-        shape: Set of (row, col) coordinates
+        shape: Set or frozenset of (row, col) coordinates
 
     Returns:
         True if shape is contiguous, False otherwise
@@ -2,22 +2,103 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator, Set
+
+# Per-cell state codes stored in GameBoard._cells
+_EMPTY = 0
+_BLOCKED = 1
+_PIECE = 2
+# bytes.translate table turning cell codes into the binary digits of the
+# blocked mask: "1" for blocked cells, "0" for everything else
+_BLOCKED_DIGITS = b"0" * _BLOCKED + b"1" + b"0" * (255 - _BLOCKED)
+
+
+class _BitCellView(Set[tuple[int, int]]):
+    """Read-only set of (row, col) positions backed by a cell bitmask.
+
+    Positions are decoded from the set bits only when iterated, and
+    membership is a single bit test. The mask is captured on creation, so
+    the view is a snapshot like the sets it replaces.
+    """
+
+    __slots__ = ("_mask", "_width")
+
+    def __init__(self, mask: int, width: int) -> None:
+        """Initialize the view.
+
+        Args:
+            mask: Bitmask with bit ``row * width + col`` set per member cell
+            width: Board width used to decode bit indices
+        """
+        self._mask = mask
+        self._width = width
+
+    @classmethod
+    def _from_iterable(
+        cls, it: Iterable[tuple[int, int]]
+    ) -> frozenset[tuple[int, int]]:
+        """Build the results of set operators, which have no bitmask."""
+        return frozenset(it)
+
+    def __contains__(self, position: object) -> bool:
+        """Check whether a (row, col) position is in the set."""
+        if not isinstance(position, tuple) or len(position) != 2:
+            return False
+        row, col = position
+        if row < 0 or not 0 <= col < self._width:
+            return False
+        return bool((self._mask >> (row * self._width + col)) & 1)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        """Yield member positions in row-major order."""
+        mask = self._mask
+        width = self._width
+        while mask:
+            low = mask & -mask
+            yield divmod(low.bit_length() - 1, width)
+            mask ^= low
+
+    def __len__(self) -> int:
+        """Get the number of member positions."""
+        return self._mask.bit_count()
+
 
 class GameBoard:
     """Represents the rectangular grid area where pieces must be placed.
 
+    Occupancy is also kept as integer bitmasks with bit ``row * width + col``
+    per cell, so fit tests and empty-cell searches are single integer
+    operations instead of per-cell Python loops.
+
     Attributes:
         width: Number of columns in the board
         height: Number of rows in the board
-        cells: 2D array (list of lists) where cells[row][col] = piece_id, None, or -1
+        cells: Flat bytearray of per-cell state codes (empty, blocked, piece),
+            indexed by ``row * width + col``, with the piece IDs of covered
+            cells kept in a sparse dict alongside
         blocked_cells: Set of initially filled (blocked) cell positions
+
+    The solver allocates one board and mutates it in place, yielding the same
+    instance with every event; take a copy() only outside such loops.
     """
 
+    __slots__ = (
+        "width",
+        "height",
+        "_cells",
+        "_piece_ids",
+        "_occupied",
+        "_blocked_mask",
+        "_occupied_count",
+        "_blocked_cells",
+        "_full_mask",
+    )
+
     def __init__(
         self,
         width: int,
         height: int,
-        blocked_cells: set[tuple[int, int]] | None = None,
+        blocked_cells: Set[tuple[int, int]] | None = None,
     ) -> None:
         """Initialize a game board with specified dimensions.
 
@@ -35,59 +116,110 @@ class GameBoard:
         if not (1 <= height <= 50):
             raise ValueError("Height must be between 1 and 50")
 
-        self._width = width
-        self._height = height
-        self._cells: list[list[int | None]] = [
-            [None for _ in range(width)] for _ in range(height)
-        ]
+        # Plain set-once attributes: read on every bounds check, so no
+        # property call
+        self.width = width
+        self.height = height
+        self._cells = bytearray(width * height)
+        self._piece_ids: dict[int, int] = {}
+
+        # Bitmasks: cells covered by placed pieces, blocked cells, and the
+        # cells pieces may occupy (everything not blocked)
+        self._occupied = 0
+        self._blocked_mask = 0
+        # Number of cells covered by placed pieces, kept in step with
+        # _occupied so area queries need no scan
+        self._occupied_count = 0
 
         # Validate and set blocked cells
         self._blocked_cells: set[tuple[int, int]] = set()
         if blocked_cells:
-            for cell in blocked_cells:
-                row, col = cell
-                if not (0 <= row < height and 0 <= col < width):
-                    raise ValueError(
-                        f"Blocked cell {cell} is out of board bounds ({width}x{height})"
-                    )
-                self._blocked_cells.add(cell)
-                # Mark blocked cells as occupied (use -1 as special marker)
-                self._cells[row][col] = -1
-
-    @property
-    def width(self) -> int:
-        """Get the board width."""
-        return self._width
-
-    @property
-    def height(self) -> int:
-        """Get the board height."""
-        return self._height
+            # Check the row and column extremes in bulk; scan cell by cell
+            # only to name the offending cell
+            rows, cols = zip(*blocked_cells)
+            in_bounds = (
+                min(rows) >= 0
+                and max(rows) < height
+                and min(cols) >= 0
+                and max(cols) < width
+            )
+            if not in_bounds:
+                for cell in blocked_cells:
+                    row, col = cell
+                    if not (0 <= row < height and 0 <= col < width):
+                        raise ValueError(
+                            f"Blocked cell {cell} is out of board bounds "
+                            f"({width}x{height})"
+                        )
+            self._blocked_cells.update(blocked_cells)
+            cells = self._cells
+            for row, col in self._blocked_cells:
+                cells[row * width + col] = _BLOCKED
+            # Read the mask off the packed cell codes in one base-2 parse,
+            # highest index first, instead of OR-ing a growing integer with
+            # one shifted bit per cell
+            self._blocked_mask = int(cells[::-1].translate(_BLOCKED_DIGITS), 2)
+        self._full_mask = ((1 << (width * height)) - 1) & ~self._blocked_mask
 
     @property
     def total_area(self) -> int:
         """Get total number of cells."""
-        return self._width * self._height
+        return self.width * self.height
 
     @property
     def available_area(self) -> int:
         """Get number of cells available for piece placement (excluding blocked cells)."""
-        return self._width * self._height - len(self._blocked_cells)
+        return self.width * self.height - len(self._blocked_cells)
 
     @property
     def blocked_cells(self) -> set[tuple[int, int]]:
         """Get the set of blocked cell positions."""
         return self._blocked_cells.copy()
 
+    @property
+    def occupied_mask(self) -> int:
+        """Get the bitmask of cells covered by placed pieces."""
+        return self._occupied
+
+    @property
+    def blocked_mask(self) -> int:
+        """Get the bitmask of blocked cells."""
+        return self._blocked_mask
+
     @property
     def filled_area(self) -> int:
         """Get number of occupied cells."""
-        return sum(1 for row in self._cells for cell in row if cell is not None)
+        return self._occupied_count + len(self._blocked_cells)
 
     @property
     def empty_area(self) -> int:
         """Get number of empty cells."""
-        return sum(1 for row in self._cells for cell in row if cell is None)
+        return self.width * self.height - self.filled_area
+
+    def shape_mask(
+        self, shape: frozenset[tuple[int, int]], position: tuple[int, int]
+    ) -> int:
+        """Get the cell bitmask a shape would cover at the specified position.
+
+        Args:
+            shape: The shape cells as a frozenset of (row_offset, col_offset) tuples
+            position: (row, col) position to place shape origin
+
+        Returns:
+            Bitmask with bit ``row * width + col`` set for each covered cell,
+            or 0 if any cell falls outside the board
+        """
+        width = self.width
+        height = self.height
+        base_row, base_col = position
+        mask = 0
+        for row_offset, col_offset in shape:
+            row = base_row + row_offset
+            col = base_col + col_offset
+            if not (0 <= row < height and 0 <= col < width):
+                return 0
+            mask |= 1 << (row * width + col)
+        return mask
 
     def can_place_shape(
         self, shape: frozenset[tuple[int, int]], position: tuple[int, int]
@@ -101,96 +233,115 @@ class GameBoard:
         Returns:
             True if shape fits without overlapping, going out of bounds, or hitting blocked cells
         """
-        for row_offset, col_offset in shape:
-            row = position[0] + row_offset
-            col = position[1] + col_offset
-
-            # Check bounds
-            if not (0 <= row < self._height and 0 <= col < self._width):
-                return False
+        mask = self.shape_mask(shape, position)
+        return mask != 0 and not mask & (self._occupied | self._blocked_mask)
 
-            # Check if cell is blocked (initially filled)
-            if (row, col) in self._blocked_cells:
-                return False
+    def fits_mask(self, mask: int) -> bool:
+        """Check if an in-bounds cell bitmask overlaps no piece or blocked cell.
 
-            # Check if cell is already occupied by a piece
-            cell_content = self._cells[row][col]
-            if cell_content is not None and cell_content != -1:
-                return False
+        Args:
+            mask: Bitmask as returned by shape_mask (must be non-zero)
 
-        return True
+        Returns:
+            True if none of the masked cells are occupied or blocked
+        """
+        return not mask & (self._occupied | self._blocked_mask)
 
     def place_shape(
-        self, shape: frozenset[tuple[int, int]], position: tuple[int, int]
+        self,
+        shape: frozenset[tuple[int, int]],
+        position: tuple[int, int],
+        mask: int | None = None,
     ) -> None:
         """Place a shape at the specified position.
 
         Args:
             shape: The shape cells as a frozenset of (row_offset, col_offset) tuples
             position: (row, col) position to place shape origin
+            mask: Precomputed shape_mask(shape, position), if already known
 
         Raises:
             ValueError: If shape cannot be placed at position
         """
-        if not self.can_place_shape(shape, position):
+        if mask is None:
+            mask = self.shape_mask(shape, position)
+        if mask == 0 or mask & (self._occupied | self._blocked_mask):
             raise ValueError(f"Cannot place shape at position {position}")
 
+        self._occupied |= mask
+        self._occupied_count += len(shape)
         shape_hash = hash(shape)
+        width = self.width
+        base_row, base_col = position
         for row_offset, col_offset in shape:
-            row = position[0] + row_offset
-            col = position[1] + col_offset
-            self._cells[row][col] = shape_hash
+            index = (base_row + row_offset) * width + base_col + col_offset
+            self._cells[index] = _PIECE
+            self._piece_ids[index] = shape_hash
 
     def remove_shape(
-        self, shape: frozenset[tuple[int, int]], position: tuple[int, int]
+        self,
+        shape: frozenset[tuple[int, int]],
+        position: tuple[int, int],
+        mask: int | None = None,
     ) -> None:
         """Remove a shape from the board.
 
         Args:
             shape: The shape cells as a frozenset of (row_offset, col_offset) tuples
             position: (row, col) position where shape is placed
+            mask: Precomputed shape_mask(shape, position), if already known
 
         Raises:
             ValueError: If shape is not found at position
         """
         shape_hash = hash(shape)
-        for row_offset, col_offset in shape:
-            row = position[0] + row_offset
-            col = position[1] + col_offset
-            if self._cells[row][col] != shape_hash:
+        width = self.width
+        base_row, base_col = position
+        indices = [
+            (base_row + row_offset) * width + base_col + col_offset
+            for row_offset, col_offset in shape
+        ]
+        piece_ids = self._piece_ids
+        for index in indices:
+            if piece_ids.get(index) != shape_hash:
                 raise ValueError(f"Shape not found at position {position}")
 
         # Remove the shape
-        for row_offset, col_offset in shape:
-            row = position[0] + row_offset
-            col = position[1] + col_offset
-            self._cells[row][col] = None
+        for index in indices:
+            self._cells[index] = _EMPTY
+            del piece_ids[index]
+        if mask is None:
+            mask = self.shape_mask(shape, position)
+        self._occupied &= ~mask
+        self._occupied_count -= len(indices)
+
+    def find_next_empty(self) -> tuple[int, int] | None:
+        """Find the first empty cell in left-to-right, top-to-bottom order.
+
+        Returns:
+            (row, col) of the first cell that is neither blocked nor covered
+            by a piece, or None if the board is full
+        """
+        free = self._full_mask & ~self._occupied
+        if not free:
+            return None
+        return divmod((free & -free).bit_length() - 1, self.width)
 
-    def get_occupied_cells(self) -> set[tuple[int, int]]:
+    def get_occupied_cells(self) -> Set[tuple[int, int]]:
         """Get set of all occupied cell positions.
 
         Returns:
-            Set of (row, col) tuples with pieces placed
+            Read-only set of (row, col) tuples with pieces placed or blocked
         """
-        return {
-            (row, col)
-            for row in range(self._height)
-            for col in range(self._width)
-            if self._cells[row][col] is not None
-        }
-
-    def get_empty_cells(self) -> set[tuple[int, int]]:
+        return _BitCellView(self._occupied | self._blocked_mask, self.width)
+
+    def get_empty_cells(self) -> Set[tuple[int, int]]:
         """Get set of all empty cell positions.
 
         Returns:
-            Set of (row, col) tuples without pieces
+            Read-only set of (row, col) tuples without pieces
         """
-        return {
-            (row, col)
-            for row in range(self._height)
-            for col in range(self._width)
-            if self._cells[row][col] is None
-        }
+        return _BitCellView(self._full_mask & ~self._occupied, self.width)
 
     def is_full(self) -> bool:
         """Check if board is completely filled.
@@ -198,11 +349,7 @@ class GameBoard:
         Returns:
             True if all cells are occupied
         """
-        return all(
-            self._cells[row][col] is not None
-            for row in range(self._height)
-            for col in range(self._width)
-        )
+        return self._occupied == self._full_mask
 
     def is_empty(self) -> bool:
         """Check if the board is completely empty.
@@ -210,8 +357,8 @@ class GameBoard:
         Returns:
             True if no pieces are placed (blocked cells are ignored)
         """
-        # Check if any non-blocked cells are occupied
-        return all(cell is None or cell == -1 for row in self._cells for cell in row)
+        # Blocked cells are never part of the occupied mask
+        return self._occupied == 0
 
     def is_blocked(self, position: tuple[int, int]) -> bool:
         """Check if a cell is blocked (initially filled).
@@ -239,17 +386,34 @@ class GameBoard:
             position: (row, col) position to query
 
         Returns:
-            Piece ID (hash) if cell is occupied, None otherwise
+            Piece ID (hash) if cell is occupied, -1 if it is blocked,
+            None otherwise
+
+        Raises:
+            IndexError: If the position is outside the board
         """
         row, col = position
-        return self._cells[row][col]
+        # The flat index would silently wrap into another row otherwise
+        if not (0 <= row < self.height and 0 <= col < self.width):
+            raise IndexError(
+                f"Position {position} is out of board bounds "
+                f"({self.width}x{self.height})"
+            )
+        index = row * self.width + col
+        state = self._cells[index]
+        if state == _PIECE:
+            return self._piece_ids[index]
+        if state == _BLOCKED:
+            return -1
+        return None
 
     def clear(self) -> None:
         """Clear all pieces from the board."""
-        for row in range(self._height):
-            for col in range(self._width):
-                if self._cells[row][col] != -1:
-                    self._cells[row][col] = None
+        for index in self._piece_ids:
+            self._cells[index] = _EMPTY
+        self._piece_ids.clear()
+        self._occupied = 0
+        self._occupied_count = 0
 
     def copy(self) -> GameBoard:
         """Create a deep copy of the board.
@@ -257,25 +421,34 @@ class GameBoard:
         Returns:
             New GameBoard with identical state (including blocked cells)
         """
-        new_board = GameBoard(self._width, self._height, self._blocked_cells.copy())
-        new_board._cells = [row[:] for row in self._cells]
+        # Start from an unblocked board and copy the blocked state over, so
+        # the blocked cells are not validated and packed again
+        new_board = GameBoard(self.width, self.height)
+        new_board._blocked_cells = self._blocked_cells.copy()
+        new_board._blocked_mask = self._blocked_mask
+        new_board._full_mask = self._full_mask
+        new_board._cells = self._cells.copy()
+        new_board._piece_ids = self._piece_ids.copy()
+        new_board._occupied = self._occupied
+        new_board._occupied_count = self._occupied_count
         return new_board
 
     def __eq__(self, other: object) -> bool:
-        """Check equality with another board."""
+        """Check equality with another board.
+
+        Cell states follow from the masks, so the cheap integer compares run
+        first and piece IDs are only compared once the layouts match.
+        """
         if not isinstance(other, GameBoard):
             return NotImplemented
         return (
-            self._width == other._width
-            and self._height == other._height
-            and all(
-                self._cells[row][col] == other._cells[row][col]
-                for row in range(self._height)
-                for col in range(self._width)
-            )
-            and self._blocked_cells == other._blocked_cells
+            self.width == other.width
+            and self.height == other.height
+            and self._occupied == other._occupied
+            and self._blocked_mask == other._blocked_mask
+            and self._piece_ids == other._piece_ids
         )
 
     def __repr__(self) -> str:
         """Get string representation."""
-        return f"GameBoard(width={self._width}, height={self._height})"
+        return f"GameBoard(width={self.width}, height={self.height})"
@@ -2,8 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from weakref import WeakValueDictionary
+
 from src.logic.validator import is_contiguous
 
+# Live pieces by shape, as given and canonical, for PuzzlePiece.intern()
+_interned: WeakValueDictionary[frozenset[tuple[int, int]], PuzzlePiece] = (
+    WeakValueDictionary()
+)
+
 
 class PuzzlePiece:
     """Represents a single polyomino piece with its shape.
@@ -40,6 +48,35 @@ class PuzzlePiece:
         # Precomputed attributes
         self._area = len(self._canonical_shape)
         self._bounding_box = self._compute_bounding_box(self._canonical_shape)
+        # Pieces key every dict lookup in configurations and the solver, so
+        # hash the canonical shape once
+        self._hash = hash(self._canonical_shape)
+
+    @classmethod
+    def intern(cls, shape: Iterable[tuple[int, int]]) -> PuzzlePiece:
+        """Get the shared piece for a shape, creating it on first use.
+
+        Pieces are immutable, so configurations loaded from the same files
+        can share one instance per shape instead of canonicalizing each
+        copy. A piece is dropped from the registry once nothing else holds
+        it.
+
+        Args:
+            shape: (row, col) coordinates defining the piece shape
+
+        Returns:
+            A piece equal to PuzzlePiece(shape), shared with earlier calls
+
+        Raises:
+            ValueError: If shape is empty or not contiguous
+        """
+        key = frozenset(shape)
+        piece = _interned.get(key)
+        if piece is None:
+            piece = cls(key)
+            _interned[key] = piece
+            _interned.setdefault(piece._canonical_shape, piece)
+        return piece
 
     def _compute_all_orientations(
         self, shape: set[tuple[int, int]]
@@ -137,14 +174,17 @@ class PuzzlePiece:
         """
         if not isinstance(other, PuzzlePiece):
             return NotImplemented
-        return self._canonical_shape == other._canonical_shape
+        return (
+            self._hash == other._hash
+            and self._canonical_shape == other._canonical_shape
+        )
 
     def __hash__(self) -> int:
         """Make piece hashable for use in sets and dicts.
 
         Uses canonical shape so rotated/flipped versions hash the same.
         """
-        return hash(self._canonical_shape)
+        return self._hash
 
     def __repr__(self) -> str:
         """Get string representation."""
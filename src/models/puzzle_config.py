@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from collections.abc import Iterable, Mapping
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import chain, repeat, starmap
+from time import time
+from types import MappingProxyType
 from typing import Any
 
 from src.logic.validator import validate_piece_shape
@@ -10,6 +15,91 @@ from src.models.board import GameBoard
 from src.models.piece import PuzzlePiece
 
 
+@lru_cache(maxsize=1024)
+def _shape_error_messages(shape: frozenset[tuple[int, int]]) -> tuple[str, ...]:
+    """Validate a canonical piece shape once and cache the error messages.
+
+    Args:
+        shape: Canonical shape of a piece
+
+    Returns:
+        Messages of the shape's validation errors (empty if valid)
+    """
+    return tuple(error.message for error in validate_piece_shape(shape))
+
+
+def _parse_timestamp(text: str) -> float:
+    """Parse an ISO 8601 timestamp into POSIX seconds.
+
+    Args:
+        text: Timestamp string; naive values are taken to be UTC, as written
+            by earlier versions
+
+    Returns:
+        Seconds since the epoch
+
+    Raises:
+        ValueError: If the string is not a valid ISO 8601 timestamp
+        TypeError: If the value is not a string
+    """
+    parsed = datetime.fromisoformat(text)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _find_out_of_bounds_cell(
+    cells: frozenset[tuple[int, int]], width: int, height: int
+) -> tuple[int, int] | None:
+    """Find a cell outside a width x height board.
+
+    Row and column extremes are checked first in bulk; the cells are only
+    scanned one by one when some cell is actually out of bounds.
+
+    Args:
+        cells: Cell positions to check
+        width: Board width in cells
+        height: Board height in cells
+
+    Returns:
+        The first out-of-bounds cell found, or None if all are on the board
+    """
+    if not cells:
+        return None
+    rows, cols = zip(*cells)
+    if min(rows) >= 0 and max(rows) < height and min(cols) >= 0 and max(cols) < width:
+        return None
+    for cell in cells:
+        row, col = cell
+        if not (0 <= row < height and 0 <= col < width):
+            return cell
+    return None
+
+
+def _decode_cells(raw: Iterable[Any], what: str) -> frozenset[tuple[int, int]]:
+    """Convert JSON-decoded [row, col] lists into a set of cell tuples.
+
+    Args:
+        raw: Decoded cell lists
+        what: Description of the cells for error messages
+
+    Returns:
+        Frozenset of (row, col) tuples
+
+    Raises:
+        ValueError: If a cell does not have exactly two values
+    """
+    # map(tuple, ...) converts in C; the lengths are checked afterwards
+    # since nothing unpacks the tuples before they are stored
+    cells = frozenset(map(tuple, raw))
+    for cell in cells:
+        if len(cell) != 2:
+            raise ValueError(
+                f"Invalid {what}: {list(cell)} is not a [row, col] pair"
+            )
+    return cells
+
+
 class PuzzleConfiguration:
     """Represents a complete puzzle definition.
 
@@ -23,13 +113,25 @@ class PuzzleConfiguration:
         modified_at: Timestamp of last modification
     """
 
+    __slots__ = (
+        "_name",
+        "_board_width",
+        "_board_height",
+        "_blocked_cells",
+        "_pieces",
+        "_piece_area",
+        "_board_cache",
+        "_created_at",
+        "_modified_at",
+    )
+
     def __init__(
         self,
         name: str,
         board_width: int,
         board_height: int,
         pieces: dict[PuzzlePiece, int] | None = None,
-        blocked_cells: set[tuple[int, int]] | None = None,
+        blocked_cells: Iterable[tuple[int, int]] | None = None,
     ) -> None:
         """Initialize a puzzle configuration.
 
@@ -50,23 +152,34 @@ class PuzzleConfiguration:
         if not (1 <= board_height <= 50):
             raise ValueError("Board height must be between 1 and 50")
 
+        # Immutable, so it can be handed out without copying
+        cells = frozenset(blocked_cells or ())
+
         # Validate blocked cells are within bounds
-        if blocked_cells:
-            for cell in blocked_cells:
-                row, col = cell
-                if not (0 <= row < board_height and 0 <= col < board_width):
-                    raise ValueError(
-                        f"Blocked cell {cell} is out of board bounds "
-                        f"({board_width}x{board_height})"
-                    )
+        bad_cell = _find_out_of_bounds_cell(cells, board_width, board_height)
+        if bad_cell is not None:
+            raise ValueError(
+                f"Blocked cell {bad_cell} is out of board bounds "
+                f"({board_width}x{board_height})"
+            )
 
         self._name = name.strip()
         self._board_width = board_width
         self._board_height = board_height
-        self._blocked_cells = blocked_cells.copy() if blocked_cells else set()
+        self._blocked_cells: frozenset[tuple[int, int]] = cells
         self._pieces = pieces.copy() if pieces else {}
-        self._created_at = datetime.utcnow()
-        self._modified_at = datetime.utcnow()
+        # Running total of piece area, kept in step by the piece mutators
+        self._piece_area = sum(
+            piece.area * count for piece, count in self._pieces.items()
+        )
+        # Pristine board for get_board(), with the dimensions and blocked
+        # cells it was built from; rebuilt once any of them is replaced
+        self._board_cache: (
+            tuple[int, int, frozenset[tuple[int, int]], GameBoard] | None
+        ) = None
+        # POSIX seconds; mutators only record time(), and datetimes are
+        # built on demand by the timestamp properties and to_dict()
+        self._created_at = self._modified_at = time()
 
     @property
     def name(self) -> str:
@@ -79,7 +192,7 @@ class PuzzleConfiguration:
         if not value or not value.strip():
             raise ValueError("Puzzle name cannot be empty")
         self._name = value.strip()
-        self._modified_at = datetime.utcnow()
+        self._modified_at = time()
 
     @property
     def board_width(self) -> int:
@@ -92,24 +205,73 @@ class PuzzleConfiguration:
         return self._board_height
 
     @property
-    def blocked_cells(self) -> set[tuple[int, int]]:
+    def blocked_cells(self) -> frozenset[tuple[int, int]]:
         """Get the set of blocked cell positions."""
-        return self._blocked_cells.copy()
+        return self._blocked_cells
+
+    @blocked_cells.setter
+    def blocked_cells(self, cells: Iterable[tuple[int, int]]) -> None:
+        """Replace the blocked cells.
+
+        Raises:
+            ValueError: If a cell is outside the board
+        """
+        cells = frozenset(cells)
+        bad_cell = _find_out_of_bounds_cell(
+            cells, self._board_width, self._board_height
+        )
+        if bad_cell is not None:
+            raise ValueError(
+                f"Blocked cell {bad_cell} is out of board bounds "
+                f"({self._board_width}x{self._board_height})"
+            )
+        self._blocked_cells = cells
+        self._modified_at = time()
+
+    def set_dimensions(self, width: int, height: int) -> None:
+        """Resize the board, dropping blocked cells that fall outside it.
+
+        Args:
+            width: New board width in cells (1-50)
+            height: New board height in cells (1-50)
+
+        Raises:
+            ValueError: If a dimension is out of range
+        """
+        if not (1 <= width <= 50):
+            raise ValueError("Board width must be between 1 and 50")
+        if not (1 <= height <= 50):
+            raise ValueError("Board height must be between 1 and 50")
+
+        # Every blocked cell survives unless the board shrinks below the
+        # furthest one, so skip the per-cell filter when nothing is dropped
+        if _find_out_of_bounds_cell(self._blocked_cells, width, height) is not None:
+            self._blocked_cells = frozenset(
+                (row, col)
+                for row, col in self._blocked_cells
+                if row < height and col < width
+            )
+        self._board_width = width
+        self._board_height = height
+        self._modified_at = time()
 
     @property
-    def pieces(self) -> dict[PuzzlePiece, int]:
-        """Get the dictionary of pieces with counts."""
-        return self._pieces.copy()
+    def pieces(self) -> Mapping[PuzzlePiece, int]:
+        """Get a read-only view of the pieces with counts.
+
+        The view tracks later changes; copy it to keep a snapshot.
+        """
+        return MappingProxyType(self._pieces)
 
     @property
     def created_at(self) -> datetime:
-        """Get creation timestamp."""
-        return self._created_at
+        """Get creation timestamp (UTC)."""
+        return datetime.fromtimestamp(self._created_at, timezone.utc)
 
     @property
     def modified_at(self) -> datetime:
-        """Get last modification timestamp."""
-        return self._modified_at
+        """Get last modification timestamp (UTC)."""
+        return datetime.fromtimestamp(self._modified_at, timezone.utc)
 
     @property
     def available_area(self) -> int:
@@ -131,10 +293,7 @@ class PuzzleConfiguration:
         Returns:
             Sum of all piece areas multiplied by their counts
         """
-        total = 0
-        for piece, count in self._pieces.items():
-            total += piece.area * count
-        return total
+        return self._piece_area
 
     def get_all_pieces(self) -> list[PuzzlePiece]:
         """Get list of all pieces (expanding counts).
@@ -142,10 +301,8 @@ class PuzzleConfiguration:
         Returns:
             List of pieces with each piece repeated according to its count
         """
-        all_pieces = []
-        for piece, count in self._pieces.items():
-            all_pieces.extend([piece] * count)
-        return all_pieces
+        # repeat() yields each piece count times without building a list
+        return list(chain.from_iterable(starmap(repeat, self._pieces.items())))
 
     def get_piece_counts(self) -> dict[str, int]:
         """Get mapping of piece shape representations to their counts.
@@ -168,20 +325,22 @@ class PuzzleConfiguration:
             ValueError: If piece not found or shape is invalid
         """
         # Validate new shape
-        shape_errors = validate_piece_shape(set(piece.canonical_shape))
+        shape_errors = _shape_error_messages(piece.canonical_shape)
         if shape_errors:
-            raise ValueError(f"Piece: {shape_errors[0].message}")
+            raise ValueError(f"Piece: {shape_errors[0]}")
 
         if piece not in self._pieces:
             raise ValueError("Piece not found")
 
+        self._piece_area += piece.area * (count - self._pieces[piece])
         self._pieces[piece] = count
-        self._modified_at = datetime.utcnow()
+        self._modified_at = time()
 
     def clear_pieces(self) -> None:
         """Remove all pieces from the configuration."""
         self._pieces.clear()
-        self._modified_at = datetime.utcnow()
+        self._piece_area = 0
+        self._modified_at = time()
 
     def validate(self) -> list[str]:
         """Validate the configuration.
@@ -190,30 +349,32 @@ class PuzzleConfiguration:
             List of validation errors (empty if valid)
         """
         errors: list[str] = []
+        shape_errors: list[str] = []
 
-        # Check piece counts are positive
+        # Check piece counts are positive and piece contiguity using the
+        # centralized validator in one pass; count errors are reported first
+        shape_error_messages = _shape_error_messages
         for piece, count in self._pieces.items():
             if count <= 0:
                 errors.append(f"Piece has invalid count {count}")
+            for message in shape_error_messages(piece.canonical_shape):
+                shape_errors.append(f"Piece: {message}")
+        errors.extend(shape_errors)
 
-        # Check piece contiguity using centralized validator
-        for piece in self._pieces:
-            shape_errors = validate_piece_shape(set(piece.canonical_shape))
-            for error in shape_errors:
-                errors.append(f"Piece: {error.message}")
-
-        # Check total piece area vs available board area
+        # Check total piece area vs available board area; the piece area is
+        # the running total, and the board areas are read once
         piece_area = self.get_total_piece_area()
-        board_area = self.get_board_area()
+        board_area = self._board_width * self._board_height
+        available_area = board_area - len(self._blocked_cells)
 
         if piece_area > board_area:
             errors.append(
                 f"Total piece area ({piece_area}) exceeds board area ({board_area})"
             )
-        elif piece_area != self.available_area:
+        elif piece_area != available_area:
             errors.append(
                 f"Total piece area ({piece_area}) does not equal available board area "
-                f"({self.available_area}) - blocked cells: {len(self._blocked_cells)}"
+                f"({available_area}) - blocked cells: {len(self._blocked_cells)}"
             )
 
         return errors
@@ -229,17 +390,16 @@ class PuzzleConfiguration:
             ValueError: If piece is invalid
         """
         # Use centralized validation
-        shape_errors = validate_piece_shape(set(piece.canonical_shape))
+        shape_errors = _shape_error_messages(piece.canonical_shape)
         if shape_errors:
-            raise ValueError(f"Piece: {shape_errors[0].message}")
+            raise ValueError(f"Piece: {shape_errors[0]}")
 
-        # Check for duplicate shape
-        if piece in self._pieces:
-            self._pieces[piece] += count
-        else:
-            self._pieces[piece] = count
+        # Merge into an existing entry for the same shape
+        pieces = self._pieces
+        pieces[piece] = pieces.get(piece, 0) + count
+        self._piece_area += piece.area * count
 
-        self._modified_at = datetime.utcnow()
+        self._modified_at = time()
 
     def remove_piece(self, piece: PuzzlePiece, count: int = 1) -> None:
         """Remove a piece from the configuration.
@@ -262,20 +422,35 @@ class PuzzleConfiguration:
         self._pieces[piece] -= count
         if self._pieces[piece] == 0:
             del self._pieces[piece]
+        self._piece_area -= piece.area * count
 
-        self._modified_at = datetime.utcnow()
+        self._modified_at = time()
 
     def get_board(self) -> GameBoard:
         """Create a GameBoard from configuration.
 
+        The board is built once per size and set of blocked cells; later
+        calls return copies of it, which skip the blocked-cell checks.
+
         Returns:
             New GameBoard instance with blocked_cells configured
         """
-        return GameBoard(
-            self._board_width,
-            self._board_height,
-            self._blocked_cells.copy(),
-        )
+        width = self._board_width
+        height = self._board_height
+        blocked_cells = self._blocked_cells
+        cache = self._board_cache
+        # Blocked cells are an immutable frozenset that every edit replaces,
+        # so identity tells whether the cached board is still current
+        if (
+            cache is None
+            or cache[0] != width
+            or cache[1] != height
+            or cache[2] is not blocked_cells
+        ):
+            board = GameBoard(width, height, blocked_cells)
+            self._board_cache = cache = (width, height, blocked_cells, board)
+        # Callers such as the solver mutate the board, so hand out a copy
+        return cache[3].copy()
 
     def get_piece_area(self) -> int:
         """Get total area of all pieces accounting for counts.
@@ -316,8 +491,8 @@ class PuzzleConfiguration:
                 {"shape": list(piece.canonical_shape), "count": count}
                 for piece, count in self._pieces.items()
             ],
-            "created_at": self._created_at.isoformat(),
-            "modified_at": self._modified_at.isoformat(),
+            "created_at": self.created_at.isoformat(),
+            "modified_at": self.modified_at.isoformat(),
         }
 
     @classmethod
@@ -338,10 +513,11 @@ class PuzzleConfiguration:
             if field not in data:
                 raise ValueError(f"Missing required field: {field}")
 
-        # Handle blocked_cells (handle missing field for backward compatibility)
-        blocked_cells: set[tuple[int, int]] = set()
+        # Handle blocked_cells (handle missing field for backward compatibility).
+        # A frozenset is adopted by __init__ without a copy
+        blocked_cells: frozenset[tuple[int, int]] = frozenset()
         if "blocked_cells" in data:
-            blocked_cells = set((row, col) for row, col in data["blocked_cells"])
+            blocked_cells = _decode_cells(data["blocked_cells"], "blocked cell")
 
         config = cls(
             name=data["name"],
@@ -355,8 +531,9 @@ class PuzzleConfiguration:
             if "shape" not in piece_data:
                 raise ValueError("Invalid piece data: missing shape")
 
-            shape = set((row, col) for row, col in piece_data["shape"])
-            piece = PuzzlePiece(shape=shape)
+            piece = PuzzlePiece.intern(
+                _decode_cells(piece_data["shape"], "piece cell")
+            )
             count = piece_data.get(
                 "count", 1
             )  # Default to 1 for backward compatibility
@@ -365,42 +542,87 @@ class PuzzleConfiguration:
         # Handle timestamps if present
         if "created_at" in data:
             try:
-                config._created_at = datetime.fromisoformat(data["created_at"])
+                config._created_at = _parse_timestamp(data["created_at"])
             except (ValueError, TypeError):
                 pass
 
         if "modified_at" in data:
             try:
-                config._modified_at = datetime.fromisoformat(data["modified_at"])
+                config._modified_at = _parse_timestamp(data["modified_at"])
             except (ValueError, TypeError):
                 pass
 
         return config
 
+    @classmethod
+    def _unchecked(
+        cls,
+        name: str,
+        board_width: int,
+        board_height: int,
+        pieces: dict[PuzzlePiece, int],
+        blocked_cells: frozenset[tuple[int, int]],
+        piece_area: int,
+        created_at: float,
+        modified_at: float,
+    ) -> PuzzleConfiguration:
+        """Build a configuration from state that is already known to be valid.
+
+        Skips the name, dimension and blocked-cell checks of __init__, so it
+        must only be given state taken from another configuration.
+
+        Args:
+            name: Stripped, non-empty puzzle name
+            board_width: Board width in cells (1-50)
+            board_height: Board height in cells (1-50)
+            pieces: Piece counts; adopted, not copied
+            blocked_cells: In-bounds blocked cell positions
+            piece_area: Total area of ``pieces``
+            created_at: Creation time in POSIX seconds
+            modified_at: Last modification time in POSIX seconds
+
+        Returns:
+            New PuzzleConfiguration holding the given state
+        """
+        config = cls.__new__(cls)
+        config._name = name
+        config._board_width = board_width
+        config._board_height = board_height
+        config._blocked_cells = blocked_cells
+        config._pieces = pieces
+        config._piece_area = piece_area
+        config._board_cache = None
+        config._created_at = created_at
+        config._modified_at = modified_at
+        return config
+
     def copy(self) -> PuzzleConfiguration:
-        """Create a deep copy of the configuration.
+        """Create a copy of the configuration.
+
+        The source is already valid, so nothing is re-checked. Pieces are
+        immutable and shared; the piece counts are copied.
 
         Returns:
-            New PuzzleConfiguration with identical state (including blocked cells)
+            New PuzzleConfiguration with identical state (including blocked
+            cells and timestamps)
         """
-        pieces_copy = {
-            PuzzlePiece(shape=set(p.canonical_shape)): count
-            for p, count in self._pieces.items()
-        }
-        new_config = PuzzleConfiguration(
+        return PuzzleConfiguration._unchecked(
             name=self._name,
             board_width=self._board_width,
             board_height=self._board_height,
-            pieces=pieces_copy,
-            blocked_cells=self._blocked_cells.copy(),
+            pieces=self._pieces.copy(),
+            blocked_cells=self._blocked_cells,
+            piece_area=self._piece_area,
+            created_at=self._created_at,
+            modified_at=self._modified_at,
         )
-        # Preserve timestamps
-        new_config._created_at = self._created_at
-        new_config._modified_at = self._modified_at
-        return new_config
 
     def __eq__(self, other: object) -> bool:
-        """Check equality with another configuration."""
+        """Check equality with another configuration.
+
+        Pieces hash and compare by canonical shape, so comparing the piece
+        dicts directly is a multiset compare of shapes and counts.
+        """
         if not isinstance(other, PuzzleConfiguration):
             return NotImplemented
         return (
@@ -408,18 +630,7 @@ class PuzzleConfiguration:
             and self._board_width == other._board_width
             and self._board_height == other._board_height
             and self._blocked_cells == other._blocked_cells
-            and len(self._pieces) == len(other._pieces)
-            and all(
-                p1.canonical_shape == p2.canonical_shape and c1 == c2
-                for (p1, c1), (p2, c2) in zip(
-                    sorted(
-                        self._pieces.items(), key=lambda x: str(x[0].canonical_shape)
-                    ),
-                    sorted(
-                        other._pieces.items(), key=lambda x: str(x[0].canonical_shape)
-                    ),
-                )
-            )
+            and self._pieces == other._pieces
         )
 
     def __repr__(self) -> str:
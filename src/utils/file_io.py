@@ -4,10 +4,31 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import Any
 
 from src.models.puzzle_config import PuzzleConfiguration
 
 
+def _encode_puzzle(data: dict[str, Any]) -> str:
+    """Encode a puzzle dictionary as JSON, one top-level field per line.
+
+    ``json.dumps`` with ``indent`` falls back to the pure-Python encoder,
+    which is slow for boards with thousands of blocked cells. Encoding each
+    field compactly uses the C encoder and keeps the file readable.
+
+    Args:
+        data: Dictionary from PuzzleConfiguration.to_dict()
+
+    Returns:
+        JSON text ending in a newline
+    """
+    dumps = json.dumps
+    fields = ",\n".join(
+        f"  {dumps(key)}: {dumps(value)}" for key, value in data.items()
+    )
+    return f"{{\n{fields}\n}}\n"
+
+
 def save_puzzle(config: PuzzleConfiguration, filepath: Path) -> None:
     """Save puzzle configuration to JSON file.
 
@@ -20,10 +41,7 @@ def save_puzzle(config: PuzzleConfiguration, filepath: Path) -> None:
     """
     try:
         filepath.parent.mkdir(parents=True, exist_ok=True)
-        data = config.to_dict()
-
-        with filepath.open("w") as f:
-            json.dump(data, f, indent=2)
+        filepath.write_text(_encode_puzzle(config.to_dict()))
 
     except OSError as e:
         raise OSError(f"Failed to save puzzle to {filepath}: {e}") from e
@@ -46,8 +64,7 @@ def load_puzzle(filepath: Path) -> PuzzleConfiguration:
         if not filepath.exists():
             raise OSError(f"File not found: {filepath}")
 
-        with filepath.open("r") as f:
-            data = json.load(f)
+        data = json.loads(filepath.read_bytes())
 
         return PuzzleConfiguration.from_dict(data)
 
@@ -69,10 +86,7 @@ def export_puzzle(config: PuzzleConfiguration, filepath: Path) -> None:
     """
     try:
         filepath.parent.mkdir(parents=True, exist_ok=True)
-        data = config.to_dict()
-
-        with filepath.open("w") as f:
-            json.dump(data, f, indent=2)
+        filepath.write_text(_encode_puzzle(config.to_dict()))
 
     except OSError as e:
         raise OSError(f"Failed to export puzzle to {filepath}: {e}") from e
@@ -95,8 +109,7 @@ def import_puzzle(filepath: Path) -> PuzzleConfiguration:
         if not filepath.exists():
             raise OSError(f"File not found: {filepath}")
 
-        with filepath.open("r") as f:
-            data = json.load(f)
+        data = json.loads(filepath.read_bytes())
 
         return PuzzleConfiguration.from_dict(data)
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import re
+
 import pytest
 
 from src.models.piece import PuzzlePiece
@@ -204,6 +206,128 @@ class TestPuzzleConfigurationModification:
 
         assert config.pieces[piece] == 2
 
+    def test_piece_area_tracks_mutations(self) -> None:
+        """Test that the running piece area follows add, update and remove."""
+        domino = PuzzlePiece(shape={(0, 0), (1, 0)})
+        tromino = PuzzlePiece(shape={(0, 0), (1, 0), (2, 0)})
+        config = PuzzleConfiguration(
+            name="Test", board_width=4, board_height=4, pieces={domino: 1}
+        )
+
+        config.add_piece(tromino, 2)
+        assert config.get_piece_area() == 8
+        config.update_piece(domino, 3)
+        assert config.get_piece_area() == 12
+        config.remove_piece(tromino)
+        assert config.get_piece_area() == 9
+        config.clear_pieces()
+        assert config.get_piece_area() == 0
+
+    def test_set_dimensions_drops_out_of_bounds_blocked_cells(self) -> None:
+        """Test that resizing in place trims blocked cells to the new board."""
+        config = PuzzleConfiguration(
+            name="Test",
+            board_width=4,
+            board_height=4,
+            blocked_cells={(0, 0), (3, 3)},
+        )
+
+        config.set_dimensions(3, 5)
+
+        assert config.board_width == 3
+        assert config.board_height == 5
+        assert config.blocked_cells == {(0, 0)}
+
+    def test_set_dimensions_keeps_blocked_cells_when_none_drop(self) -> None:
+        """Test that resizing without losing cells reuses the blocked set."""
+        config = PuzzleConfiguration(
+            name="Test",
+            board_width=4,
+            board_height=4,
+            blocked_cells={(0, 0), (2, 3)},
+        )
+        blocked = config.blocked_cells
+
+        config.set_dimensions(4, 3)
+        assert config.blocked_cells is blocked
+        config.set_dimensions(3, 3)
+        assert config.blocked_cells == {(0, 0)}
+
+    def test_set_blocked_cells_validates_bounds(self) -> None:
+        """Test that assigning blocked cells rejects cells off the board."""
+        config = PuzzleConfiguration(name="Test", board_width=3, board_height=3)
+
+        config.blocked_cells = {(2, 2)}
+        assert config.blocked_cells == {(2, 2)}
+
+        with pytest.raises(ValueError, match="out of board bounds"):
+            config.blocked_cells = {(3, 0)}
+
+    def test_repeated_validation_reuses_shape_checks(self) -> None:
+        """Test that each canonical shape is validated only once."""
+        from src.models.puzzle_config import _shape_error_messages
+
+        domino = PuzzlePiece(shape={(0, 0), (1, 0)})
+        config = PuzzleConfiguration(
+            name="Test", board_width=2, board_height=2, pieces={domino: 2}
+        )
+        _shape_error_messages.cache_clear()
+
+        assert config.validate() == []
+        config.add_piece(PuzzlePiece(shape={(0, 0), (0, 1)}))
+        config.validate()
+
+        info = _shape_error_messages.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+    def test_equality_compares_pieces_as_shape_multiset(self) -> None:
+        """Test equality ignores piece orientation and insertion order."""
+        l_piece = PuzzlePiece(shape={(0, 0), (1, 0), (1, 1)})
+        l_rotated = PuzzlePiece(shape={(0, 0), (0, 1), (1, 0)})
+        domino = PuzzlePiece(shape={(0, 0), (0, 1)})
+
+        first = PuzzleConfiguration(
+            name="Test", board_width=4, board_height=4, pieces={l_piece: 2, domino: 1}
+        )
+        second = PuzzleConfiguration(
+            name="Test", board_width=4, board_height=4, pieces={domino: 1, l_rotated: 2}
+        )
+
+        assert first == second
+        second.add_piece(domino)
+        assert first != second
+
+    def test_read_accessors_return_views_not_copies(self) -> None:
+        """Test blocked cells and pieces are returned as read-only views."""
+        domino = PuzzlePiece(shape={(0, 0), (0, 1)})
+        config = PuzzleConfiguration(
+            name="Test",
+            board_width=2,
+            board_height=2,
+            pieces={domino: 1},
+            blocked_cells={(0, 0)},
+        )
+
+        pieces = config.pieces
+        assert config.blocked_cells is config.blocked_cells
+        assert isinstance(config.blocked_cells, frozenset)
+        with pytest.raises(TypeError):
+            pieces[domino] = 5  # type: ignore[index]
+
+        config.add_piece(domino)
+        assert pieces[domino] == 2
+
+    def test_blocked_cell_bounds_reject_each_edge(self) -> None:
+        """Test out-of-bounds blocked cells are reported on every side."""
+        for bad in [(-1, 0), (0, -1), (3, 0), (0, 4)]:
+            with pytest.raises(ValueError, match=re.escape(str(bad))):
+                PuzzleConfiguration(
+                    name="Test",
+                    board_width=4,
+                    board_height=3,
+                    blocked_cells={(0, 0), (2, 3), bad},
+                )
 
 class TestPuzzleConfigurationSerialization:
     """Test puzzle configuration serialization."""
@@ -232,6 +356,37 @@ class TestPuzzleConfigurationSerialization:
         # Blocked cells are serialized as list of lists
         assert [1, 1] in data["blocked_cells"]
 
+    @pytest.mark.parametrize("bad_cell", [[1, 1, 5], [1]])
+    def test_from_dict_rejects_malformed_blocked_cell(
+        self, bad_cell: list[int]
+    ) -> None:
+        """Test that blocked cells must be [row, col] pairs."""
+        data = {
+            "name": "Bad Cell",
+            "board_width": 3,
+            "board_height": 3,
+            "blocked_cells": [[0, 0], bad_cell],
+            "pieces": [],
+        }
+
+        with pytest.raises(ValueError, match=re.escape(str(bad_cell))):
+            PuzzleConfiguration.from_dict(data)
+
+    @pytest.mark.parametrize("bad_cell", [[0, 1, 5], [0]])
+    def test_from_dict_rejects_malformed_piece_cell(
+        self, bad_cell: list[int]
+    ) -> None:
+        """Test that piece shape cells must be [row, col] pairs."""
+        data = {
+            "name": "Bad Piece",
+            "board_width": 3,
+            "board_height": 3,
+            "pieces": [{"shape": [[0, 0], bad_cell], "count": 1}],
+        }
+
+        with pytest.raises(ValueError, match="not a \\[row, col\\] pair"):
+            PuzzleConfiguration.from_dict(data)
+
     def test_from_dict(self) -> None:
         """Test creating configuration from dictionary."""
         data = {
@@ -271,3 +426,78 @@ class TestPuzzleConfigurationSerialization:
         assert restored.board_height == original.board_height
         assert len(restored.pieces) == len(original.pieces)
         assert restored.blocked_cells == original.blocked_cells
+
+    def test_timestamps_are_utc_and_roundtrip(self) -> None:
+        """Test that naive stored timestamps load as UTC and survive a roundtrip."""
+        from datetime import datetime, timezone
+
+        data = {
+            "name": "Timestamps",
+            "board_width": 2,
+            "board_height": 2,
+            "pieces": [{"shape": [[0, 0]], "count": 4}],
+            "created_at": "2026-01-14T12:00:00",
+            "modified_at": "2026-01-14T12:30:00",
+        }
+
+        config = PuzzleConfiguration.from_dict(data)
+
+        assert config.created_at == datetime(2026, 1, 14, 12, 0, tzinfo=timezone.utc)
+        assert config.modified_at == datetime(2026, 1, 14, 12, 30, tzinfo=timezone.utc)
+        restored = PuzzleConfiguration.from_dict(config.to_dict())
+        assert restored.created_at == config.created_at
+        assert restored.modified_at == config.modified_at
+
+        config.name = "Renamed"
+        assert config.modified_at > restored.modified_at
+        assert config.created_at == restored.created_at
+
+    def test_copy_is_independent(self) -> None:
+        """Test that copy preserves state but not later piece edits."""
+        piece = PuzzlePiece(shape={(0, 0), (0, 1)})
+        original = PuzzleConfiguration(
+            name="Copy Test",
+            board_width=4,
+            board_height=3,
+            pieces={piece: 2},
+            blocked_cells={(0, 0), (2, 3)},
+        )
+
+        copied = original.copy()
+
+        assert copied == original
+        assert copied.created_at == original.created_at
+        assert copied.modified_at == original.modified_at
+        assert copied.get_piece_area() == 4
+
+        copied.add_piece(piece)
+        copied.blocked_cells = set()
+        assert original.pieces == {piece: 2}
+        assert original.get_piece_area() == 4
+        assert original.blocked_cells == {(0, 0), (2, 3)}
+        assert copied.get_piece_area() == 6
+
+    def test_get_board_reuses_cached_board(self) -> None:
+        """Test that get_board hands out fresh copies of a cached board."""
+        from unittest.mock import patch
+
+        config = PuzzleConfiguration(
+            name="Board Cache",
+            board_width=4,
+            board_height=3,
+            blocked_cells={(0, 0)},
+        )
+
+        first = config.get_board()
+        first.place_shape(frozenset({(0, 0)}), (1, 1))
+        with patch("src.models.puzzle_config.GameBoard") as mock_board:
+            second = config.get_board()
+        mock_board.assert_not_called()
+        assert second is not first
+        assert second.occupied_mask == 0
+        assert second.blocked_cells == {(0, 0)}
+
+        config.blocked_cells = {(2, 3)}
+        assert config.get_board().blocked_cells == {(2, 3)}
+        config.set_dimensions(5, 3)
+        assert config.get_board().width == 5
@@ -84,6 +84,19 @@ class TestGameBoardBlockedCells:
         """Test that out-of-bounds blocked cells raise ValueError."""
         with pytest.raises(ValueError, match="out of board bounds"):
             GameBoard(width=3, height=3, blocked_cells={(5, 5)})
+        with pytest.raises(ValueError, match=r"\(0, -1\)"):
+            GameBoard(width=3, height=3, blocked_cells={(0, 0), (0, -1)})
+
+    def test_blocked_mask_matches_cells(self) -> None:
+        """Test that the blocked mask has bit row * width + col per cell."""
+        blocked = {(row, col) for row in range(50) for col in range(50) if row % 3}
+        board = GameBoard(width=50, height=50, blocked_cells=blocked)
+
+        expected = 0
+        for row, col in blocked:
+            expected |= 1 << (row * 50 + col)
+        assert board.blocked_mask == expected
+        assert board.available_area == 2500 - len(blocked)
 
     def test_is_blocked_method(self) -> None:
         """Test is_blocked method for checking blocked cells."""
@@ -132,6 +145,16 @@ class TestGameBoardCellAccess:
         result = board.get_piece_at((1, 1))
         assert result == -1
 
+    @pytest.mark.parametrize("position", [(0, 3), (0, -1), (-1, 0), (2, 0)])
+    def test_get_piece_at_out_of_bounds_raises_error(
+        self, position: tuple[int, int]
+    ) -> None:
+        """Test that positions off the board do not wrap into other cells."""
+        board = GameBoard(width=3, height=2, blocked_cells={(1, 0)})
+
+        with pytest.raises(IndexError, match="out of board bounds"):
+            board.get_piece_at(position)
+
 
 class TestGameBoardShapePlacement:
     """Test GameBoard shape placement methods."""
@@ -353,3 +376,141 @@ class TestGameBoardFilledArea:
 
         # 3 cells placed, 1 blocked = 12 empty
         assert board.empty_area == 12
+
+
+class TestGameBoardBitmask:
+    """Test GameBoard bitmask occupancy tracking."""
+
+    def test_shape_mask_sets_one_bit_per_cell(self) -> None:
+        """Test shape_mask uses bit row * width + col and rejects overhangs."""
+        board = GameBoard(width=4, height=3)
+        shape = frozenset({(0, 0), (0, 1), (1, 1)})
+
+        assert board.shape_mask(shape, (1, 2)) == (1 << 6) | (1 << 7) | (1 << 11)
+        assert board.shape_mask(shape, (2, 0)) == 0
+
+    def test_find_next_empty_skips_blocked_and_occupied(self) -> None:
+        """Test find_next_empty returns the first free cell in scan order."""
+        board = GameBoard(width=3, height=2, blocked_cells={(0, 0)})
+
+        assert board.find_next_empty() == (0, 1)
+        board.place_shape(frozenset({(0, 0), (0, 1)}), (0, 1))
+        assert board.find_next_empty() == (1, 0)
+        board.place_shape(frozenset({(0, 0), (0, 1), (0, 2)}), (1, 0))
+        assert board.find_next_empty() is None
+        assert board.is_full() is True
+
+    def test_remove_shape_frees_cells_for_placement(self) -> None:
+        """Test that removing a shape makes its cells placeable again."""
+        board = GameBoard(width=2, height=2)
+        shape = frozenset({(0, 0), (0, 1)})
+
+        board.place_shape(shape, (0, 0))
+        assert board.can_place_shape(shape, (0, 0)) is False
+        board.remove_shape(shape, (0, 0))
+        assert board.can_place_shape(shape, (0, 0)) is True
+        assert board.find_next_empty() == (0, 0)
+
+    def test_place_shape_with_precomputed_mask(self) -> None:
+        """Test placing and removing with a precomputed mask and fits_mask."""
+        board = GameBoard(width=3, height=2, blocked_cells={(1, 2)})
+        shape = frozenset({(0, 0), (1, 0)})
+        mask = board.shape_mask(shape, (0, 1))
+
+        assert board.fits_mask(mask) is True
+        board.place_shape(shape, (0, 1), mask)
+        assert board.fits_mask(mask) is False
+        assert board.get_piece_at((1, 1)) == hash(shape)
+        board.remove_shape(shape, (0, 1), mask)
+        assert board.fits_mask(mask) is True
+        assert board.fits_mask(board.shape_mask(shape, (0, 2))) is False
+        assert board.blocked_mask == 1 << 5
+
+    def test_occupied_mask_excludes_blocked_cells(self) -> None:
+        """Test occupied_mask tracks placed pieces only."""
+        board = GameBoard(width=2, height=2, blocked_cells={(1, 1)})
+        shape = frozenset({(0, 0), (0, 1)})
+
+        assert board.occupied_mask == 0
+        board.place_shape(shape, (0, 0))
+        assert board.occupied_mask == 0b0011
+        board.clear()
+        assert board.occupied_mask == 0
+
+    def test_clear_keeps_blocked_cells_and_drops_piece_ids(self) -> None:
+        """Test clear() resets covered cells but not blocked ones."""
+        board = GameBoard(width=3, height=1, blocked_cells={(0, 2)})
+        shape = frozenset({(0, 0), (0, 1)})
+        board.place_shape(shape, (0, 0))
+
+        board.clear()
+
+        assert board.get_piece_at((0, 0)) is None
+        assert board.get_piece_at((0, 2)) == -1
+        assert board.filled_area == 1
+        assert board.empty_area == 2
+        assert board == GameBoard(width=3, height=1, blocked_cells={(0, 2)})
+
+    def test_area_counters_follow_place_and_remove(self) -> None:
+        """Test filled_area and empty_area track placements incrementally."""
+        board = GameBoard(width=4, height=2, blocked_cells={(1, 3)})
+        shape = frozenset({(0, 0), (0, 1), (1, 0)})
+
+        board.place_shape(shape, (0, 0))
+        assert board.filled_area == 4
+        assert board.empty_area == 4
+        copied = board.copy()
+        board.remove_shape(shape, (0, 0))
+        assert board.filled_area == 1
+        assert board.empty_area == 7
+        assert copied.filled_area == 4
+
+    def test_cell_views_decode_bitmasks(self) -> None:
+        """Test occupied/empty cell views behave like snapshot sets."""
+        board = GameBoard(width=3, height=2, blocked_cells={(1, 2)})
+        board.place_shape(frozenset({(0, 0), (1, 0)}), (0, 1))
+
+        occupied = board.get_occupied_cells()
+        empty = board.get_empty_cells()
+        board.clear()
+
+        assert occupied == {(0, 1), (1, 1), (1, 2)}
+        assert set(empty) == {(0, 0), (0, 2), (1, 0)}
+        assert list(empty) == [(0, 0), (0, 2), (1, 0)]
+        assert len(occupied) == 3
+        assert (0, 3) not in empty
+        assert (-1, 0) not in empty
+        assert "x" not in empty
+
+    def test_cell_views_support_set_operators(self) -> None:
+        """Test that cell views combine with sets like the sets they replace."""
+        board = GameBoard(width=3, height=2)
+        board.place_shape(frozenset({(0, 0), (0, 1)}), (0, 0))
+        occupied = board.get_occupied_cells()
+
+        assert occupied | {(1, 0)} == {(0, 0), (0, 1), (1, 0)}
+        assert occupied & {(0, 1), (1, 1)} == {(0, 1)}
+        assert occupied - {(0, 0)} == {(0, 1)}
+        assert occupied ^ {(0, 0), (1, 2)} == {(0, 1), (1, 2)}
+        assert board.get_empty_cells() | occupied == {
+            (row, col) for row in range(2) for col in range(3)
+        }
+
+    def test_equality_compares_layout_and_piece_ids(self) -> None:
+        """Test boards differ on occupancy, blocked cells or piece identity."""
+        domino = frozenset({(0, 0), (0, 1)})
+        other_domino = frozenset({(0, 1), (0, 2)})
+        board = GameBoard(width=3, height=1)
+        board.place_shape(domino, (0, 0))
+
+        same = GameBoard(width=3, height=1)
+        same.place_shape(domino, (0, 0))
+        shifted = GameBoard(width=3, height=1)
+        shifted.place_shape(domino, (0, 1))
+        relabelled = GameBoard(width=3, height=1)
+        relabelled.place_shape(other_domino, (0, -1))
+
+        assert board == same
+        assert board != shifted
+        assert board != relabelled
+        assert board != GameBoard(width=3, height=1, blocked_cells={(0, 2)})
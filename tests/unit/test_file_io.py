@@ -123,6 +123,38 @@ class TestSavePuzzle:
             if filepath.exists():
                 filepath.unlink()
 
+    def test_save_puzzle_writes_one_field_per_line(self) -> None:
+        """Test that a large board round-trips with one field per line."""
+        from src.utils.file_io import load_puzzle, save_puzzle
+
+        piece = PuzzlePiece(shape={(0, 0)})
+        blocked = {(row, col) for row in range(50) for col in range(49)}
+        config = PuzzleConfiguration(
+            name="Large Board",
+            board_width=50,
+            board_height=50,
+            pieces={piece: 50},
+            blocked_cells=blocked,
+        )
+
+        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
+            filepath = Path(f.name)
+
+        try:
+            save_puzzle(config, filepath)
+
+            lines = filepath.read_text().splitlines()
+            assert lines[0] == "{"
+            assert lines[-1] == "}"
+            assert len(lines) == len(config.to_dict()) + 2
+
+            loaded = load_puzzle(filepath)
+            assert loaded.blocked_cells == blocked
+            assert loaded.pieces == {piece: 50}
+        finally:
+            if filepath.exists():
+                filepath.unlink()
+
 
 class TestLoadPuzzle:
     """Test load_puzzle function."""
@@ -19,7 +19,7 @@ class TestSolveButtonValidation:
         window = EditorWindow()
         qtbot.addWidget(window)
 
-        window._config._pieces = {}
+        window._config.clear_pieces()
 
         with patch("src.gui.editor_window.QMessageBox") as mock_msgbox:
             window._on_solve()
@@ -63,7 +63,7 @@ class TestSolveButtonValidation:
             (25, 0),
         }
         large_piece = PuzzlePiece(shape=shape)
-        window._config._pieces = {large_piece: 1}
+        window._config.add_piece(large_piece)
 
         with patch("src.gui.editor_window.QMessageBox") as mock_msgbox:
             mock_msgbox.StandardButton.Yes = mock_msgbox.StandardButton.Yes
@@ -74,6 +74,53 @@ class TestSolveButtonValidation:
 
             mock_msgbox.question.assert_called_once()
 
+    def test_solve_menu_action_clicks_solve_button(self, qtbot) -> None:
+        """Test that the Solve menu action goes through the Solve button."""
+        from src.gui.editor_window import EditorWindow
+
+        window = EditorWindow()
+        qtbot.addWidget(window)
+        solve_menu = window.menuBar().actions()[-1].menu()
+
+        with qtbot.waitSignal(window._solve_btn.clicked):
+            with patch("src.gui.editor_window.QMessageBox") as mock_msgbox:
+                solve_menu.actions()[0].trigger()
+
+        mock_msgbox.warning.assert_called_once()
+
+    def test_board_edits_do_not_resize_open_visualization(self, qtbot) -> None:
+        """Test that board edits do not reach an open solve window."""
+        from src.gui.editor_window import EditorWindow
+        from src.gui.visualization_window import VisualizationWindow
+        from src.models.piece import PuzzlePiece
+
+        window = EditorWindow()
+        qtbot.addWidget(window)
+        window._config.add_piece(PuzzlePiece(shape={(0, 0)}), 25)
+
+        opened: list[VisualizationWindow] = []
+
+        def open_viz(config):
+            opened.append(VisualizationWindow(config))
+            return opened[-1]
+
+        with patch(
+            "src.gui.visualization_window.VisualizationWindow", side_effect=open_viz
+        ), patch.object(VisualizationWindow, "show"):
+            window._on_solve()
+        viz = opened[0]
+        qtbot.addWidget(viz)
+
+        window._on_board_dimensions_changed(3, 2)
+        window._flush_board_changes()
+        viz._create_solver()
+
+        assert window._config.board_width == 3
+        assert viz._config is not window._config
+        assert viz._config.board_width == 5
+        assert viz._config.board_height == 5
+        viz._board_widget.grab()
+
 
 class TestVizWindowQTimer:
     """Tests for QTimer-based solver visualization."""
@@ -137,6 +184,50 @@ class TestVizWindowQTimer:
 
         assert not window._timer.isActive()
 
+    def test_single_shot_timer_rearmed_after_each_step(self, qtbot) -> None:
+        """Test that each step re-arms the single-shot timer while playing."""
+        from src.gui.visualization_window import VisualizationWindow
+        from src.models.piece import PuzzlePiece
+        from src.models.puzzle_config import PuzzleConfiguration
+
+        config = PuzzleConfiguration(name="test", board_width=10, board_height=6)
+        config.add_piece(PuzzlePiece(shape={(0, 0)}), 60)
+        window = VisualizationWindow(config)
+        qtbot.addWidget(window)
+
+        window._on_play_pause_clicked()
+        assert window._timer.isSingleShot()
+        assert window._timer.isActive()
+
+        window._timer.stop()
+        window._advance()
+        assert window._timer.isActive()
+
+        window._on_play_pause_clicked()
+        assert not window._timer.isActive()
+        window._advance()
+        assert not window._timer.isActive()
+
+    def test_resize_uses_cached_board_dimensions(self, qtbot, monkeypatch) -> None:
+        """Test that resizing sizes cells without rebuilding the board."""
+        from PySide6.QtCore import QSize
+        from PySide6.QtGui import QResizeEvent
+
+        from src.gui.visualization_window import VisualizationWindow
+        from src.models.puzzle_config import PuzzleConfiguration
+
+        config = PuzzleConfiguration(name="test", board_width=10, board_height=5)
+        window = VisualizationWindow(config)
+        qtbot.addWidget(window)
+
+        def fail_get_board(self):
+            raise AssertionError("get_board called during resize")
+
+        monkeypatch.setattr(PuzzleConfiguration, "get_board", fail_get_board)
+        window.resizeEvent(QResizeEvent(QSize(420, 400), QSize(800, 600)))
+
+        assert window._board_widget._cell_size == 40
+
 
 class TestSpeedControl:
     """Tests for visualization speed control."""
@@ -160,6 +251,39 @@ class TestSpeedControl:
         window._speed_slider.setValue(10)
         assert window._speed_slider.value() == 10
 
+    def test_fast_speed_batches_solver_steps(self, qtbot) -> None:
+        """Test that fast speeds make the solver yield every Nth step."""
+        from src.gui.visualization_window import VisualizationWindow
+        from src.models.puzzle_config import PuzzleConfiguration
+
+        config = PuzzleConfiguration(name="test", board_width=3, board_height=3)
+        window = VisualizationWindow(config)
+        qtbot.addWidget(window)
+
+        window._on_speed_changed(500)
+        assert window._yield_every == 1
+
+        window._on_speed_changed(10)
+        assert window._yield_every == 10
+
+    def test_fast_speed_drains_several_events_per_tick(self, qtbot) -> None:
+        """Test that fast ticks pull a burst of events and draw the last one."""
+        from src.gui.visualization_window import VisualizationWindow
+        from src.models.piece import PuzzlePiece
+        from src.models.puzzle_config import PuzzleConfiguration
+
+        config = PuzzleConfiguration(name="test", board_width=10, board_height=6)
+        config.add_piece(PuzzlePiece(shape={(0, 0)}), 60)
+        window = VisualizationWindow(config)
+        qtbot.addWidget(window)
+
+        window._on_speed_changed(10)
+        assert window._timer.interval() == window.MIN_TICK_MS
+        window._create_solver()
+        window._advance()
+
+        assert window._status_label.text().startswith("Step 50:")
+
 
 class TestSolverCancellation:
     """Tests for solver cancellation/interruption."""
@@ -201,3 +325,538 @@ class TestSolverCancellation:
         window._on_stop_clicked()
 
         assert not window._timer.isActive()
+
+
+class TestBoardDimensionDebounce:
+    """Tests for coalescing board dimension spinner changes."""
+
+    def test_spinner_burst_applies_once(self, qtbot) -> None:
+        """Test that a burst of spinner changes triggers a single rebuild."""
+        from src.gui.board_tab import BoardTab
+
+        calls = []
+        tab = BoardTab(on_dimensions_changed=lambda w, h: calls.append((w, h)))
+        qtbot.addWidget(tab)
+
+        for width in range(6, 12):
+            tab._width_spinner.setValue(width)
+
+        assert calls == []
+        qtbot.waitUntil(lambda: calls == [(11, 5)])
+        assert tab._grid_widget.board_width == 11
+
+    def test_solve_applies_pending_spinner_change(self, qtbot) -> None:
+        """Test that solving right after a spinner change uses the new size."""
+        from src.gui.editor_window import EditorWindow
+
+        window = EditorWindow()
+        qtbot.addWidget(window)
+
+        window._board_tab._width_spinner.setValue(8)
+        with patch("src.gui.editor_window.QMessageBox"):
+            window._on_solve()
+
+        assert window._config.board_width == 8
+        assert not window._board_tab._dim_debounce.isActive()
+
+
+class TestBoardBlockedCellsSetter:
+    """Tests for diff-applying blocked cells on the board grid."""
+
+    def test_unchanged_cells_skip_repaint(self, qtbot) -> None:
+        """Test that assigning the current cells does not schedule a repaint."""
+        from src.gui.board_tab import BoardGridWidget
+
+        grid = BoardGridWidget()
+        qtbot.addWidget(grid)
+        grid.blocked_cells = {(0, 0), (1, 2)}
+
+        with patch.object(grid, "update") as mock_update:
+            grid.blocked_cells = {(1, 2), (0, 0)}
+
+        mock_update.assert_not_called()
+        assert grid.blocked_cells == {(0, 0), (1, 2)}
+
+    def test_small_change_repaints_affected_cells_only(self, qtbot) -> None:
+        """Test that a one-cell change repaints just that cell."""
+        from src.gui.board_tab import BoardGridWidget
+
+        grid = BoardGridWidget()
+        qtbot.addWidget(grid)
+        grid.blocked_cells = {(0, 0)}
+
+        with patch.object(grid, "update") as mock_update:
+            grid.blocked_cells = {(0, 0), (3, 4)}
+
+        mock_update.assert_called_once_with(grid._cell_rect(3, 4))
+        assert grid.blocked_cells == {(0, 0), (3, 4)}
+
+    def test_slotted_widget_still_emits_signals(self, qtbot) -> None:
+        """Test that the slotted grid keeps its state and Qt signals working."""
+        from src.gui.board_tab import BoardGridWidget
+
+        grid = BoardGridWidget()
+        qtbot.addWidget(grid)
+
+        assert "_mask" in BoardGridWidget.__slots__
+        with qtbot.waitSignal(grid.blocked_count_changed) as blocker:
+            grid._is_blocking = True
+            grid._toggle_cell_at_position(grid._cell_rect(0, 0).center())
+
+        assert blocker.args == [1]
+        assert grid.blocked_cells == {(0, 0)}
+
+    def test_bulk_update_emits_once(self, qtbot) -> None:
+        """Test that changes inside a bulk update are published once."""
+        from src.gui.board_tab import BoardGridWidget
+
+        grid = BoardGridWidget()
+        qtbot.addWidget(grid)
+        emitted = []
+        grid.blocked_cells_changed.connect(emitted.append)
+
+        grid.begin_bulk_update()
+        grid._is_blocking = True
+        for col in range(3):
+            grid._toggle_cell_at_position(grid._cell_rect(0, col).center())
+        assert emitted == []
+
+        grid.end_bulk_update()
+        assert emitted == [{(0, 0), (0, 1), (0, 2)}]
+        assert isinstance(emitted[0], frozenset)
+
+    def test_set_dimensions_unchanged_is_noop(self, qtbot) -> None:
+        """Test that re-applying the current dimensions skips all work."""
+        from src.gui.board_tab import BoardGridWidget
+
+        grid = BoardGridWidget()
+        qtbot.addWidget(grid)
+        grid.set_dimensions(7, 4)
+
+        with patch.object(grid, "update") as mock_update:
+            grid.set_dimensions(7, 4)
+            grid.board_width = 7
+            grid.board_height = 4
+
+        mock_update.assert_not_called()
+
+
+class TestEditorValidationCache:
+    """Tests for cached validation in the editor window."""
+
+    def test_validation_tracks_repeated_piece(self, qtbot) -> None:
+        """Test that adding another copy of a piece refreshes the cached area."""
+        from src.gui.editor_window import EditorWindow
+        from src.models.piece import PuzzlePiece
+
+        window = EditorWindow()
+        qtbot.addWidget(window)
+        piece = PuzzlePiece(shape={(0, 0), (0, 1), (0, 2), (0, 3), (0, 4)})
+
+        window._on_piece_added(piece)
+        qtbot.waitUntil(lambda: "(5)" in window._validation_label.text())
+
+        window._on_piece_added(piece)
+        qtbot.waitUntil(lambda: "(10)" in window._validation_label.text())
+
+    def test_piece_edits_are_coalesced(self, qtbot) -> None:
+        """Test that a burst of piece edits revalidates once."""
+        from unittest.mock import patch
+
+        from src.gui.editor_window import EditorWindow
+        from src.models.piece import PuzzlePiece
+
+        window = EditorWindow()
+        qtbot.addWidget(window)
+        piece = PuzzlePiece(shape={(0, 0), (0, 1)})
+
+        with patch.object(
+            window, "_update_validation", wraps=window._update_validation
+        ) as mock_validate:
+            for _ in range(5):
+                window._on_piece_added(piece)
+            window._on_piece_deleted(piece)
+            mock_validate.assert_not_called()
+
+            qtbot.waitUntil(lambda: mock_validate.call_count == 1)
+
+        assert window._config.pieces[piece] == 4
+        assert "(8)" in window._validation_label.text()
+
+    def test_bulk_load_defers_validation(self, qtbot) -> None:
+        """Test that validation is skipped while bulk loading."""
+        from src.gui.editor_window import EditorWindow
+
+        window = EditorWindow()
+        qtbot.addWidget(window)
+        window._validation_label.setText("stale")
+
+        window._bulk_loading = True
+        window._validation_key = None
+        window._update_validation()
+        assert window._validation_label.text() == "stale"
+
+        window._bulk_loading = False
+        window._update_validation()
+        assert window._validation_label.text() == "No pieces defined"
+
+    def test_blocked_cell_events_are_coalesced(self, qtbot) -> None:
+        """Test that a burst of board edits updates the config once."""
+        from src.gui.editor_window import EditorWindow
+
+        window = EditorWindow()
+        qtbot.addWidget(window)
+
+        window._on_blocked_cells_changed(frozenset({(0, 0)}))
+        window._on_blocked_cells_changed(frozenset({(0, 0), (1, 1)}))
+        assert window.config.blocked_cells == set()
+
+        qtbot.waitUntil(lambda: window.config.blocked_cells == {(0, 0), (1, 1)})
+        assert window.config.available_area == 23
+
+
+class TestPieceTabBulkLoad:
+    """Tests for replacing all pieces in the piece tab at once."""
+
+    def test_set_pieces_replaces_list_and_count(self, qtbot) -> None:
+        """Test that set_pieces rebuilds the list and expanded count."""
+        from src.gui.piece_tab import PieceTab
+        from src.models.piece import PuzzlePiece
+
+        tab = PieceTab()
+        qtbot.addWidget(tab)
+        tab.add_piece(PuzzlePiece(shape={(0, 0)}))
+
+        domino = PuzzlePiece(shape={(0, 0), (0, 1)})
+        tromino = PuzzlePiece(shape={(0, 0), (0, 1), (0, 2)})
+        tab.set_pieces({tromino: 1, domino: 2})
+
+        assert tab._piece_list.count() == 2
+        assert tab._piece_count_label.text() == "Pieces: 3"
+        assert sorted(tab.pieces, key=lambda p: p.area) == [domino, domino, tromino]
+
+
+class TestSavedPuzzlesDeferredRefresh:
+    """Tests for scanning saved puzzles only when their tab is opened."""
+
+    def test_refresh_runs_on_first_tab_open(self, qtbot) -> None:
+        """Test that the saved puzzles list is refreshed lazily, once."""
+        from src.gui.editor_window import EditorWindow
+        from src.gui.saved_puzzles_tab import SavedPuzzlesTab
+
+        with patch.object(SavedPuzzlesTab, "refresh") as mock_refresh:
+            window = EditorWindow()
+            qtbot.addWidget(window)
+            mock_refresh.assert_not_called()
+
+            window._tab_widget.setCurrentWidget(window._saved_puzzles_tab)
+            window._tab_widget.setCurrentIndex(0)
+            window._tab_widget.setCurrentWidget(window._saved_puzzles_tab)
+
+            mock_refresh.assert_called_once()
+
+
+class TestPieceGridCache:
+    """Tests for the piece grid back-buffer cache."""
+
+    def test_repaint_reuses_cached_pixmap(self, qtbot) -> None:
+        """Test that repainting unchanged state blits the cache."""
+        from src.gui.piece_tab import PieceGridWidget
+
+        grid = PieceGridWidget()
+        qtbot.addWidget(grid)
+        grid.resize(300, 300)
+        grid.filled_cells = {(0, 0), (1, 1)}
+        grid.grab()
+        assert grid._cache_valid
+
+        with patch.object(grid, "_render") as mock_render:
+            grid.grab()
+
+        mock_render.assert_not_called()
+
+    def test_state_change_invalidates_cache(self, qtbot) -> None:
+        """Test that changing cells or dimensions rebuilds the cache."""
+        from src.gui.piece_tab import PieceGridWidget
+
+        grid = PieceGridWidget()
+        qtbot.addWidget(grid)
+        grid.resize(300, 300)
+        grid.grab()
+
+        grid.filled_cells = {(2, 2)}
+        assert not grid._cache_valid
+        grid.grab()
+        grid.set_dimensions(3, 3)
+        assert not grid._cache_valid
+
+    def test_small_cell_image_path_matches_rects(self, qtbot) -> None:
+        """Test that dense grids drawn as an image look the same as rects."""
+        from src.gui.piece_tab import PieceGridWidget
+
+        grid = PieceGridWidget()
+        qtbot.addWidget(grid)
+        grid.resize(300, 300)
+        grid.set_dimensions(20, 20)
+        grid.filled_cells = {(r, (r * 7) % 20) for r in range(20)} | {(0, 1)}
+        grid.grab()
+        assert grid._cell_size < 20
+        image = grid._cache.toImage()
+
+        with patch.object(
+            grid, "_draw_cells_as_image", grid._draw_cells_as_rects
+        ):
+            grid._cache_valid = False
+            grid.grab()
+
+        assert grid._cache.toImage() == image
+
+    def test_toggle_repaints_only_the_cell(self, qtbot) -> None:
+        """Test that toggling a cell updates just that cell's rectangle."""
+        from src.gui.piece_tab import PieceGridWidget
+
+        grid = PieceGridWidget()
+        qtbot.addWidget(grid)
+        grid.resize(300, 300)
+        grid.grab()
+        grid._is_filling = True
+        center = grid._cell_rect(1, 2).center()
+
+        with patch.object(grid, "update") as mock_update:
+            grid._toggle_cell_at_position(center)
+            grid._toggle_cell_at_position(center)
+
+        mock_update.assert_called_once_with(grid._cell_rect(1, 2))
+        assert grid._cache_valid
+        assert grid.filled_cells == {(1, 2)}
+
+    @pytest.mark.parametrize("size", [5, 20])
+    def test_toggle_draws_cell_without_full_render(self, qtbot, size: int) -> None:
+        """Test that a toggled cell is drawn alone and matches a full render."""
+        from src.gui.piece_tab import PieceGridWidget
+
+        grid = PieceGridWidget()
+        qtbot.addWidget(grid)
+        grid.resize(300, 300)
+        grid.set_dimensions(size, size)
+        grid.filled_cells = {(0, 0), (1, 1)}
+        grid.grab()
+
+        with patch.object(grid, "_render") as mock_render:
+            for row, col, filling in [(1, 2, True), (0, 0, False), (0, 1, True)]:
+                grid._is_filling = filling
+                grid._last_cell = None
+                grid._toggle_cell_at_position(grid._cell_rect(row, col).center())
+        mock_render.assert_not_called()
+        image = grid._cache.toImage()
+
+        grid._cache_valid = False
+        grid.grab()
+        assert grid._cache.toImage() == image
+
+    def test_shrinking_grid_trims_filled_cells(self, qtbot) -> None:
+        """Test that cells outside new dimensions are dropped from the mask."""
+        from src.gui.piece_tab import PieceGridWidget
+
+        grid = PieceGridWidget()
+        qtbot.addWidget(grid)
+        grid.filled_cells = {(0, 0), (0, 4), (4, 0), (2, 2), (9, 9), (20, 1)}
+        assert grid.filled_cells == {(0, 0), (0, 4), (4, 0), (2, 2), (9, 9)}
+
+        grid.set_dimensions(3, 3)
+        assert grid.filled_cells == {(0, 0), (2, 2)}
+
+        grid.grid_width = 10
+        grid.grid_height = 10
+        assert grid.filled_cells == {(0, 0), (2, 2)}
+
+
+class TestPieceShapeType:
+    """Tests for piece shape type labels."""
+
+    @pytest.mark.parametrize(
+        ("cells", "expected"),
+        [
+            ({(0, 0), (0, 1), (0, 2), (0, 3)}, "Tetromino (I)"),
+            ({(0, 0), (0, 1), (1, 0), (1, 1)}, "Tetromino (O)"),
+            ({(0, 0), (0, 1), (0, 2), (1, 0)}, "Tetromino (L)"),
+            ({(0, 0), (0, 1), (0, 2), (1, 1)}, "Tetromino (T)"),
+            ({(0, 0), (0, 1), (1, 1), (1, 2)}, "Tetromino (S)"),
+            ({(0, 0), (0, 1), (0, 2)}, "Triomino (straight)"),
+            ({(0, 0), (1, 0), (1, 1), (1, 2), (2, 2)}, "Square (5)"),
+        ],
+    )
+    def test_identify_shape_type(self, qtbot, cells, expected) -> None:
+        """Test that each tetromino and larger shapes get the right label."""
+        from src.gui.piece_tab import PieceTab
+        from src.models.piece import PuzzlePiece
+
+        tab = PieceTab()
+        qtbot.addWidget(tab)
+
+        assert tab._identify_shape_type(PuzzlePiece(cells)) == expected
+
+
+class TestPieceTabSortedPieces:
+    """Tests for the piece tab's cached list order."""
+
+    def test_sorted_pieces_follow_adds_and_removes(self, qtbot) -> None:
+        """Test that list order stays sorted by cell count without re-sorting."""
+        from src.gui.piece_tab import PieceTab
+
+        tab = PieceTab()
+        qtbot.addWidget(tab)
+        shapes = [
+            {(0, 0), (0, 1), (0, 2)},
+            {(0, 0)},
+            {(0, 0), (0, 1), (1, 0), (1, 1)},
+            {(0, 0), (0, 1)},
+            {(0, 0), (1, 0), (1, 1)},
+        ]
+        for shape in shapes:
+            tab._grid_widget.filled_cells = shape
+            tab._on_add_piece()
+
+        expected = sorted(tab._pieces, key=lambda p: len(p.canonical_shape))
+        assert tab._sorted_pieces == expected
+        assert tab._piece_list.count() == len(expected)
+
+        tab._on_piece_decrement(expected[2])
+        del expected[2]
+        assert tab._sorted_pieces == expected
+        assert [tab._get_piece_index(p) for p in expected] == list(range(4))
+
+    def test_count_buttons_update_row_in_place(self, qtbot) -> None:
+        """Test that +/- clicks update the row widget instead of rebuilding."""
+        from src.gui.piece_tab import PieceTab
+
+        tab = PieceTab()
+        qtbot.addWidget(tab)
+        tab._grid_widget.filled_cells = {(0, 0), (0, 1)}
+        tab._on_add_piece()
+        piece = tab._sorted_pieces[0]
+        widget = tab._item_widgets[piece]
+
+        widget._plus_btn.click()
+        widget._plus_btn.click()
+        widget._minus_btn.click()
+
+        assert tab._item_widgets[piece] is widget
+        assert widget._count_label.text() == "x2"
+        assert tab._piece_count_label.text() == "Pieces: 2"
+
+    def test_save_unedited_shape_is_noop(self, qtbot) -> None:
+        """Test that saving an unchanged shape keeps the selected piece."""
+        from src.gui.piece_tab import PieceTab
+
+        modified = []
+        tab = PieceTab(on_piece_modified=modified.append)
+        qtbot.addWidget(tab)
+        tab._grid_widget.filled_cells = {(0, 0), (1, 0), (1, 1)}
+        tab._on_add_piece()
+        piece = tab.selected_piece
+
+        with patch("src.gui.piece_tab.PuzzlePiece") as mock_piece:
+            tab.save_current_shape_to_piece()
+        mock_piece.assert_not_called()
+        assert tab.selected_piece is piece
+        assert modified == []
+
+        tab._grid_widget.filled_cells = {(0, 0), (0, 1), (0, 2)}
+        tab.save_current_shape_to_piece()
+        assert len(modified) == 1
+        assert modified[0].canonical_shape == frozenset({(0, 0), (0, 1), (0, 2)})
+
+
+class TestPieceGridSizeDebounce:
+    """Tests for coalescing piece grid size spinner changes."""
+
+    def test_spinner_burst_applies_once(self, qtbot) -> None:
+        """Test that a burst of spinner changes resizes the grid once."""
+        from src.gui.piece_tab import PieceTab
+
+        tab = PieceTab()
+        qtbot.addWidget(tab)
+
+        with patch.object(tab._grid_widget, "set_dimensions") as mock_set:
+            for width in range(5, 9):
+                tab._width_spinner.setValue(width)
+            tab._height_spinner.setValue(4)
+
+            assert mock_set.call_count == 0
+            qtbot.waitUntil(lambda: mock_set.call_count == 1)
+
+        mock_set.assert_called_once_with(8, 4)
+
+
+class TestPieceGridRedundantToggle:
+    """Tests for skipping toggles that would not change a cell."""
+
+    def test_filling_a_filled_cell_skips_repaint(self, qtbot) -> None:
+        """Test that painting over cells already in the target state is a no-op."""
+        from src.gui.piece_tab import PieceGridWidget
+
+        grid = PieceGridWidget()
+        qtbot.addWidget(grid)
+        grid.resize(300, 300)
+        grid.filled_cells = {(0, 0)}
+        grid.grab()
+        grid._is_filling = True
+
+        with patch.object(grid, "update") as mock_update:
+            grid._toggle_cell_at_position(grid._cell_rect(0, 0).center())
+            grid._is_filling = False
+            grid._toggle_cell_at_position(grid._cell_rect(1, 1).center())
+
+        mock_update.assert_not_called()
+        assert grid.filled_cells == {(0, 0)}
+
+
+class TestPieceListWidgetPool:
+    """Tests for reusing piece list row widgets across refreshes."""
+
+    def test_refresh_rebinds_existing_rows(self, qtbot) -> None:
+        """Test that refreshing reuses row widgets and trims extra rows."""
+        from PySide6.QtCore import Qt
+
+        from src.gui.piece_tab import PieceTab
+
+        tab = PieceTab()
+        qtbot.addWidget(tab)
+        for shape in ({(0, 0)}, {(0, 0), (0, 1)}, {(0, 0), (0, 1), (0, 2)}):
+            tab._grid_widget.filled_cells = shape
+            tab._on_add_piece()
+        first_row = tab._piece_list.itemWidget(tab._piece_list.item(0))
+
+        smallest = tab._sorted_pieces[0]
+        tab._on_piece_decrement(smallest)
+
+        assert tab._piece_list.count() == 2
+        assert tab._piece_list.itemWidget(tab._piece_list.item(0)) is first_row
+        assert first_row._piece == tab._sorted_pieces[0]
+        assert first_row._label.text().endswith("(2 cells)")
+        assert tab._piece_list.item(1).data(Qt.ItemDataRole.UserRole) == (
+            tab._sorted_pieces[1]
+        )
+
+        first_row._plus_btn.click()
+        assert tab._pieces[tab._sorted_pieces[0]] == 2
+
+
+class TestPieceGridHitTest:
+    """Tests for mapping mouse positions to piece grid cells."""
+
+    def test_hit_test_matches_painted_cells(self, qtbot) -> None:
+        """Test that hit testing uses the padded offsets the grid is drawn at."""
+        from src.gui.piece_tab import PieceGridWidget
+
+        grid = PieceGridWidget()
+        qtbot.addWidget(grid)
+        # Cells fill the widget, so the label padding pushes the grid inward
+        grid.resize(300, 300)
+        grid.set_dimensions(10, 10)
+
+        for row, col in ((0, 0), (3, 7), (9, 9)):
+            center = grid._cell_rect(row, col).center()
+            assert grid._get_cell_at_position(center.x(), center.y()) == (row, col)
+        assert grid._get_cell_at_position(grid._offset_x - 1, grid._offset_y) is None
@@ -215,3 +215,20 @@ class TestPuzzlePieceEquality:
         assert len(piece_dict) == 1
         assert piece_dict[piece1] == "third"
         assert piece_dict[piece2] == "third"
+
+
+class TestPuzzlePieceIntern:
+    """Test the shared piece registry."""
+
+    def test_intern_returns_shared_instance(self) -> None:
+        """Test that interning a shape twice returns the same piece."""
+        piece = PuzzlePiece.intern([(0, 0), (1, 0), (1, 1)])
+
+        assert PuzzlePiece.intern({(0, 0), (1, 0), (1, 1)}) is piece
+        assert PuzzlePiece.intern(piece.canonical_shape) is piece
+        assert piece == PuzzlePiece(shape={(0, 0), (1, 0), (1, 1)})
+
+    def test_intern_invalid_shape_raises_error(self) -> None:
+        """Test that interning validates the shape like the constructor."""
+        with pytest.raises(ValueError, match="contiguous"):
+            PuzzlePiece.intern([(0, 0), (0, 2)])
@@ -348,6 +348,132 @@ class TestGeneratorEdgeCases:
         # Note: 4 L-tetrominoes can tile a 4x4 board
         assert last_yield["type"] in ("solved", "no_solution")
 
+    def test_placements_leaving_dead_pockets_are_pruned(self) -> None:
+        """Test the solver never places a piece that isolates an empty cell."""
+        from src.logic.solver import solve_backtracking
+
+        # Two L-trominoes tile a 3x2 board; the orientation covering
+        # (0,0), (0,1), (1,1) would strand (1,0) and must never be placed
+        l_tromino = PuzzlePiece(shape={(0, 0), (1, 0), (1, 1)})
+        board = GameBoard(width=3, height=2)
+        pieces = {l_tromino: 2}
+
+        yields = list(solve_backtracking(pieces, board))
+
+        assert yields[-1]["type"] == "solved"
+        assert [y["type"] for y in yields] == ["place", "place", "solved"]
+
+    def test_pentomino_rectangle_solved_with_constrained_search(self) -> None:
+        """Test the 12 pentominoes tile a 10x6 board with a bounded search."""
+        from src.logic.solver import solve_backtracking
+
+        shapes = [
+            {(0, 0), (0, 1), (0, 2), (0, 3), (0, 4)},
+            {(0, 0), (1, 0), (2, 0), (3, 0), (3, 1)},
+            {(0, 0), (0, 1), (1, 0), (1, 1), (2, 0)},
+            {(0, 0), (0, 1), (0, 2), (1, 1), (2, 1)},
+            {(0, 0), (0, 2), (1, 0), (1, 1), (1, 2)},
+            {(0, 0), (1, 0), (2, 0), (2, 1), (2, 2)},
+            {(0, 0), (1, 0), (1, 1), (2, 1), (2, 2)},
+            {(0, 1), (1, 0), (1, 1), (1, 2), (2, 1)},
+            {(0, 1), (1, 0), (1, 1), (2, 1), (3, 1)},
+            {(0, 0), (0, 1), (1, 1), (2, 1), (2, 2)},
+            {(0, 1), (0, 2), (1, 0), (1, 1), (2, 1)},
+            {(0, 0), (1, 0), (1, 1), (2, 1), (3, 1)},
+        ]
+        board = GameBoard(width=10, height=6)
+        pieces = {PuzzlePiece(shape=shape): 1 for shape in shapes}
+
+        yields = list(solve_backtracking(pieces, board))
+
+        # Plain scan-order search needs over 100k steps on this board
+        assert yields[-1]["type"] == "solved"
+        assert yields[-1]["step_count"] < 20000
+        assert board.is_full()
+
+    def test_read_only_piece_mapping(self) -> None:
+        """Test that a read-only piece view is accepted and left unchanged."""
+        from types import MappingProxyType
+
+        from src.logic.solver import solve_backtracking
+
+        domino = PuzzlePiece(shape={(0, 0), (0, 1)})
+        pieces = MappingProxyType({domino: 2})
+        board = GameBoard(width=2, height=2)
+
+        yields = list(solve_backtracking(pieces, board))
+
+        assert yields[-1]["type"] == "solved"
+        assert yields[-1]["remaining_pieces"] == {}
+        assert pieces == {domino: 2}
+
+
+class TestMergedRemoveEvents:
+    """Tests for reporting backtracking together with the next placement."""
+
+    def test_remove_followed_by_place_is_one_event(self) -> None:
+        """Test that a retry at the same cell carries the removed shape."""
+        from src.logic.solver import solve_backtracking
+
+        pieces = {
+            PuzzlePiece(shape={(0, 0), (1, 0), (2, 0), (2, 1)}): 2,
+            PuzzlePiece(shape={(0, 0), (0, 1), (0, 2), (1, 1)}): 1,
+            PuzzlePiece(shape={(0, 0), (0, 1), (0, 2), (0, 3)}): 1,
+            PuzzlePiece(shape={(0, 0), (0, 1), (1, 0), (1, 1)}): 1,
+        }
+
+        yields = list(solve_backtracking(pieces, GameBoard(width=5, height=4)))
+        merged = [y for y in yields if y["type"] == "place" and y["removed"]]
+        removes = [y for y in yields if y["type"] == "remove"]
+
+        assert merged
+        # Every step is still accounted for by exactly one event
+        final_steps = yields[-1]["step_count"]
+        assert len(yields) - 1 + len(merged) == final_steps
+        for y in removes:
+            assert "removed" not in y
+
+
+class TestYieldEvery:
+    """Tests for sampling solver steps with yield_every."""
+
+    def test_yields_only_every_nth_step_and_final_state(self) -> None:
+        """Test that intermediate steps are sampled but the result is not."""
+        from src.logic.solver import solve_backtracking
+
+        # Tetromino set with no tiling of 5x4, so the search backtracks a lot
+        pieces = {
+            PuzzlePiece(shape={(0, 0), (1, 0), (2, 0), (2, 1)}): 2,
+            PuzzlePiece(shape={(0, 0), (0, 1), (0, 2), (1, 1)}): 1,
+            PuzzlePiece(shape={(0, 0), (0, 1), (0, 2), (0, 3)}): 1,
+            PuzzlePiece(shape={(0, 0), (0, 1), (1, 0), (1, 1)}): 1,
+        }
+
+        all_steps = list(solve_backtracking(pieces, GameBoard(width=5, height=4)))
+        sampled = list(
+            solve_backtracking(pieces, GameBoard(width=5, height=4), yield_every=4)
+        )
+
+        assert sampled[-1]["type"] == all_steps[-1]["type"]
+        assert sampled[-1]["step_count"] == all_steps[-1]["step_count"]
+        for state in sampled[:-1]:
+            step = state["step_count"]
+            if state.get("removed") is not None:
+                # A sampled removal reported with the placement that follows
+                step -= 1
+            assert step % 4 == 0
+        assert len(sampled) < len(all_steps)
+
+    def test_rejects_non_positive_yield_every(self) -> None:
+        """Test that yield_every below 1 raises ValueError."""
+        from src.logic.solver import solve_backtracking
+
+        monomino = PuzzlePiece(shape={(0, 0)})
+        generator = solve_backtracking({monomino: 1}, GameBoard(1, 1), yield_every=0)
+
+        with pytest.raises(ValueError):
+            next(generator)
+
 
 class TestStopIterationHandling:
     """Tests for StopIteration handling and termination."""